@@ -0,0 +1,273 @@
+"""Üzenet aktivitás és XP: memóriabeli összesítés, kötegelt mentés, előre rendezett ranglista.
+
+Üzenetenként csak memóriabeli számlálók nőnek (felhasználó / nap, csatorna / nap,
+összesített XP); egy háttér task `FLUSH_INTERVAL` másodpercenként (vagy
+`FLUSH_BATCH` függő sornál) egyetlen tranzakcióban, `executemany` upserttel
+írja ki az eltéréseket. XP percenként legfeljebb egyszer jár egy tagnak.
+
+Szerverenként egy (−XP, felhasználó) szerint rendezett lista a ranglista: XP
+változáskor bisect-tel frissül, így a toplista egy szelet, a helyezés egy
+bináris keresés, bármekkora szerveren.
+"""
+
+import asyncio
+import bisect
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from storage import Database
+
+
+log = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS activity_daily (
+    guild_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    messages INTEGER NOT NULL DEFAULT 0,
+    xp INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (guild_id, user_id, day)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS activity_channels (
+    guild_id INTEGER NOT NULL,
+    channel_id INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    messages INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (guild_id, channel_id, day)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS activity_totals (
+    guild_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    messages INTEGER NOT NULL DEFAULT 0,
+    xp INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (guild_id, user_id)
+) WITHOUT ROWID;
+"""
+
+FLUSH_INTERVAL = 10.0
+FLUSH_BATCH = 2000
+XP_PER_MESSAGE = 20
+XP_COOLDOWN = 60.0  # mp; ennél sűrűbb üzenetekért nem jár XP
+DAYS_KEPT = 90  # a napi bontás megőrzése; az összesítés örök
+
+def today() -> int:
+    """UTC napsorszám (1970-01-01 = 0)."""
+    return int(time.time() // 86400)
+
+def xp_for_level(level: int) -> int:
+    """A következő szinthez szükséges XP az adott szintről."""
+    return 5 * level * level + 50 * level + 100
+
+def level_for(xp: int) -> tuple[int, int, int]:
+    """(szint, XP a szinten belül, a következő szinthez szükséges XP)."""
+    level = 0
+    while xp >= xp_for_level(level):
+        xp -= xp_for_level(level)
+        level += 1
+    return level, xp, xp_for_level(level)
+
+@dataclass
+class GuildActivity:
+    xp: dict[int, int] = field(default_factory=dict)
+    messages: dict[int, int] = field(default_factory=dict)
+    ranking: list[tuple[int, int]] = field(default_factory=list)  # (-XP, felhasználó ID), rendezve
+    last_award: dict[int, float] = field(default_factory=dict)
+
+    def add_xp(self, user_id: int, amount: int) -> None:
+        old = self.xp.get(user_id)
+        if old is not None:
+            i = bisect.bisect_left(self.ranking, (-old, user_id))
+            if i < len(self.ranking) and self.ranking[i] == (-old, user_id):
+                del self.ranking[i]
+        new = (old or 0) + amount
+        self.xp[user_id] = new
+        bisect.insort(self.ranking, (-new, user_id))
+
+    def rank(self, user_id: int) -> Optional[int]:
+        """Helyezés (1-től), ha van XP-je."""
+        xp = self.xp.get(user_id)
+        return bisect.bisect_left(self.ranking, (-xp, user_id)) + 1 if xp is not None else None
+
+    def top(self, limit: int, offset: int = 0) -> list[tuple[int, int]]:
+        """(felhasználó ID, XP) párok a ranglista adott szeletéből."""
+        return [(user_id, -neg) for neg, user_id in self.ranking[offset:offset + limit]]
+
+@dataclass
+class UserActivity:
+    xp: int
+    level: int
+    level_xp: int
+    level_needed: int
+    rank: Optional[int]
+    ranked: int
+    messages: int
+    last_7_days: int
+    today: int
+
+class ActivityTracker:
+    def __init__(self, db: Database, *, interval: float = FLUSH_INTERVAL, batch: int = FLUSH_BATCH) -> None:
+        self.db = db
+        self.interval = interval
+        self.batch = batch
+        self.guilds: dict[int, GuildActivity] = {}
+        # Még ki nem írt eltérések: (szerver, felhasználó, nap) -> [üzenet, XP] és (szerver, csatorna, nap) -> üzenet
+        self._users: dict[tuple[int, int, int], list[int]] = {}
+        self._channels: dict[tuple[int, int, int], int] = {}
+        self._wake = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._pruned_day = 0
+
+    async def start(self, owns: Optional[Callable[[int], bool]] = None) -> None:
+        """Az összesített XP betöltése és a ranglisták felépítése; több folyamatnál `owns` szűr."""
+        await self.db.executescript(SCHEMA)
+        rows = await self.db.fetchall("SELECT guild_id, user_id, messages, xp FROM activity_totals")
+        for guild_id, user_id, messages, xp in rows:
+            if owns is None or owns(guild_id):
+                guild = self.guild(guild_id)
+                guild.messages[user_id] = messages
+                if xp:
+                    guild.xp[user_id] = xp
+        for guild in self.guilds.values():
+            guild.ranking = sorted((-xp, user_id) for user_id, xp in guild.xp.items())
+        self._task = asyncio.create_task(self._run(), name="activity-flush")
+
+    async def close(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        await self.flush()
+
+    def guild(self, guild_id: int) -> GuildActivity:
+        guild = self.guilds.get(guild_id)
+        if guild is None:
+            guild = self.guilds[guild_id] = GuildActivity()
+        return guild
+
+    def pending(self) -> int:
+        return len(self._users) + len(self._channels)
+
+    # --- rögzítés (üzenetenként, csak memória) ---
+
+    def record(self, guild_id: int, channel_id: int, user_id: int) -> None:
+        day = today()
+        guild = self.guild(guild_id)
+        guild.messages[user_id] = guild.messages.get(user_id, 0) + 1
+        delta = self._users.get((guild_id, user_id, day))
+        if delta is None:
+            delta = self._users[(guild_id, user_id, day)] = [0, 0]
+        delta[0] += 1
+        key = (guild_id, channel_id, day)
+        self._channels[key] = self._channels.get(key, 0) + 1
+        now = time.monotonic()
+        if now - guild.last_award.get(user_id, -XP_COOLDOWN) >= XP_COOLDOWN:
+            guild.last_award[user_id] = now
+            guild.add_xp(user_id, XP_PER_MESSAGE)
+            delta[1] += XP_PER_MESSAGE
+        if self.pending() >= self.batch:
+            self._wake.set()
+
+    # --- kötegelt mentés ---
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await self.flush()
+            except Exception:
+                log.exception("Aktivitás mentése sikertelen")
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            day = today()
+            if not self._users and not self._channels and self._pruned_day == day:
+                return
+            users, self._users = self._users, {}
+            channels, self._channels = self._channels, {}
+            totals: dict[tuple[int, int], list[int]] = {}
+            for (guild_id, user_id, _), (messages, xp) in users.items():
+                total = totals.setdefault((guild_id, user_id), [0, 0])
+                total[0] += messages
+                total[1] += xp
+            prune = self._pruned_day != day
+
+            def write(conn):
+                conn.executemany(
+                    "INSERT INTO activity_daily (guild_id, user_id, day, messages, xp) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT (guild_id, user_id, day) DO UPDATE SET "
+                    "messages = messages + excluded.messages, xp = xp + excluded.xp",
+                    [(g, u, d, m, x) for (g, u, d), (m, x) in users.items()])
+                conn.executemany(
+                    "INSERT INTO activity_channels (guild_id, channel_id, day, messages) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (guild_id, channel_id, day) DO UPDATE SET messages = messages + excluded.messages",
+                    [(g, c, d, m) for (g, c, d), m in channels.items()])
+                conn.executemany(
+                    "INSERT INTO activity_totals (guild_id, user_id, messages, xp) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (guild_id, user_id) DO UPDATE SET "
+                    "messages = messages + excluded.messages, xp = xp + excluded.xp",
+                    [(g, u, m, x) for (g, u), (m, x) in totals.items()])
+                if prune:
+                    conn.execute("DELETE FROM activity_daily WHERE day < ?", (day - DAYS_KEPT,))
+                    conn.execute("DELETE FROM activity_channels WHERE day < ?", (day - DAYS_KEPT,))
+
+            try:
+                await self.db.run(write)
+            except Exception:
+                # Visszatesszük, hogy a következő mentés újrapróbálja.
+                for key, (messages, xp) in users.items():
+                    delta = self._users.setdefault(key, [0, 0])
+                    delta[0] += messages
+                    delta[1] += xp
+                for key, messages in channels.items():
+                    self._channels[key] = self._channels.get(key, 0) + messages
+                raise
+            if prune:
+                self._pruned_day = day
+                self._forget_cooldowns()
+
+    def _forget_cooldowns(self) -> None:
+        cutoff = time.monotonic() - XP_COOLDOWN
+        for guild in self.guilds.values():
+            guild.last_award = {u: t for u, t in guild.last_award.items() if t > cutoff}
+
+    # --- lekérdezések ---
+
+    async def user_stats(self, guild_id: int, user_id: int) -> UserActivity:
+        """Szint, helyezés és üzenetszámok (a mentett napi sorok és a függő eltérések összege)."""
+        day = today()
+        rows = await self.db.fetchall(
+            "SELECT day, messages FROM activity_daily WHERE guild_id = ? AND user_id = ? AND day > ?",
+            (guild_id, user_id, day - 7))
+        per_day = dict(rows)
+        for d in range(day - 6, day + 1):
+            delta = self._users.get((guild_id, user_id, d))
+            if delta is not None:
+                per_day[d] = per_day.get(d, 0) + delta[0]
+        guild = self.guilds.get(guild_id) or GuildActivity()
+        xp = guild.xp.get(user_id, 0)
+        level, level_xp, needed = level_for(xp)
+        return UserActivity(xp, level, level_xp, needed, guild.rank(user_id), len(guild.ranking),
+                            guild.messages.get(user_id, 0), sum(per_day.values()), per_day.get(day, 0))
+
+    async def top_channels(self, guild_id: int, days: int = 7, limit: int = 5) -> list[tuple[int, int]]:
+        """(csatorna ID, üzenetek) az elmúlt `days` napból, csökkenő sorrendben."""
+        since = today() - days
+        rows = await self.db.fetchall(
+            "SELECT channel_id, SUM(messages) FROM activity_channels WHERE guild_id = ? AND day > ? "
+            "GROUP BY channel_id", (guild_id, since))
+        counts = dict(rows)
+        for (g, channel_id, d), messages in self._channels.items():
+            if g == guild_id and d > since:
+                counts[channel_id] = counts.get(channel_id, 0) + messages
+        return sorted(counts.items(), key=lambda kv: kv[1], reverse=True)[:limit]
+
+    def forget_guild(self, guild_id: int) -> None:
+        # A függő eltérések még kiíródnak; csak a memóriabeli ranglistát dobjuk el.
+        self.guilds.pop(guild_id, None)
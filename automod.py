@@ -0,0 +1,174 @@
+"""Anti-spam / anti-raid detektor csúszóablakos számlálókkal.
+
+Minden számláló egy fix méretű gyűrűpuffer az utolsó N esemény
+időbélyegével: egy új esemény egyetlen írás, a döntés egyetlen
+összehasonlítás (a legrégebbi a legutóbbi N közül belefér-e az ablakba),
+így a detektor üzenetenként O(1), a memória pedig felhasználónként fix.
+A modul csak dönt; a végrehajtás (némítás, zárolás, slowmode) a botban van.
+"""
+
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Optional
+
+import discord
+
+
+@dataclass(frozen=True)
+class AutomodConfig:
+    flood_count: int = 7            # ennyi üzenet ...
+    flood_window: float = 5.0       # ... ennyi másodperc alatt
+    duplicate_count: int = 4        # ugyanaz a tartalom ennyiszer ...
+    duplicate_window: float = 30.0
+    mention_per_message: int = 6    # egy üzenetben ennyi említés azonnal spam
+    mention_count: int = 12         # ennyi említés ...
+    mention_window: float = 30.0
+    channel_slowmode_count: int = 40     # csatornánként ennyi üzenet ...
+    channel_lock_count: int = 100        # (ennyi felett zárolás)
+    channel_window: float = 10.0
+    join_count: int = 10            # ennyi csatlakozás ...
+    join_window: float = 30.0
+    mute_minutes: int = 10
+    slowmode_seconds: int = 5
+    slowmode_minutes: int = 10
+    raid_minutes: int = 10
+    action_cooldown: float = 60.0   # ugyanarra a célpontra ennyi ideig nincs újabb művelet
+    idle_seconds: float = 300.0     # ennyi inaktivitás után az állapot törölhető
+
+class SlidingWindow:
+    """Az utolsó `size` esemény időbélyege gyűrűpufferben."""
+    __slots__ = ("times", "pos")
+
+    def __init__(self, size: int) -> None:
+        self.times = array("d", bytes(8 * size))
+        self.pos = 0
+
+    def hit(self, now: float, window: float) -> bool:
+        """Rögzít egy eseményt; igaz, ha az utolsó `size` esemény belefér az ablakba."""
+        times = self.times
+        times[self.pos] = now
+        self.pos = (self.pos + 1) % len(times)
+        oldest = times[self.pos]
+        return oldest > 0 and now - oldest <= window
+
+    def reset(self) -> None:
+        for i in range(len(self.times)):
+            self.times[i] = 0.0
+
+class UserState:
+    __slots__ = ("messages", "duplicates", "mentions", "last_hash", "last_seen", "cooldown_until")
+
+    def __init__(self, cfg: AutomodConfig) -> None:
+        self.messages = SlidingWindow(cfg.flood_count)
+        self.duplicates = SlidingWindow(cfg.duplicate_count)
+        self.mentions = SlidingWindow(cfg.mention_count)
+        self.last_hash = 0
+        self.last_seen = 0.0
+        self.cooldown_until = 0.0
+
+class ChannelState:
+    __slots__ = ("slowmode", "lock", "last_seen", "cooldown_until")
+
+    def __init__(self, cfg: AutomodConfig) -> None:
+        self.slowmode = SlidingWindow(cfg.channel_slowmode_count)
+        self.lock = SlidingWindow(cfg.channel_lock_count)
+        self.last_seen = 0.0
+        self.cooldown_until = 0.0
+
+@dataclass(frozen=True)
+class Verdict:
+    action: str     # "mute" | "slowmode" | "lock" | "raid"
+    reason: str
+    delete_message: bool = False
+
+class Automod:
+    def __init__(self, cfg: Optional[AutomodConfig] = None) -> None:
+        self.cfg = cfg or AutomodConfig()
+        self.users: dict[tuple[int, int], UserState] = {}
+        self.channels: dict[int, ChannelState] = {}
+        self.joins: dict[int, SlidingWindow] = {}
+        self.raid_until: dict[int, float] = {}
+        self._last_sweep = time.monotonic()
+
+    def check_message(self, message: discord.Message) -> list[Verdict]:
+        now = time.monotonic()
+        cfg = self.cfg
+        verdicts: list[Verdict] = []
+
+        key = (message.guild.id, message.author.id)
+        user = self.users.get(key)
+        if user is None:
+            user = self.users[key] = UserState(cfg)
+        user.last_seen = now
+
+        if now >= user.cooldown_until:
+            content_hash = hash(message.content) if message.content else 0
+            if content_hash and content_hash != user.last_hash:
+                user.duplicates.reset()
+                user.last_hash = content_hash
+            mentions = len(message.raw_mentions) + len(message.raw_role_mentions) + (5 if message.mention_everyone else 0)
+            mention_hit = False
+            for _ in range(min(mentions, cfg.mention_count)):
+                mention_hit = user.mentions.hit(now, cfg.mention_window) or mention_hit
+            flood_hit = user.messages.hit(now, cfg.flood_window)
+            duplicate_hit = bool(content_hash) and user.duplicates.hit(now, cfg.duplicate_window)
+
+            if mentions >= cfg.mention_per_message or mention_hit:
+                verdicts.append(Verdict("mute", f"Említés spam ({mentions} említés)", delete_message=True))
+            elif duplicate_hit:
+                verdicts.append(Verdict("mute", f"Ismételt üzenet ({cfg.duplicate_count}× ugyanaz)", delete_message=True))
+            elif flood_hit:
+                verdicts.append(Verdict("mute", f"Üzenet flood ({cfg.flood_count} üzenet / {cfg.flood_window:g} mp)"))
+            if verdicts:
+                user.cooldown_until = now + cfg.action_cooldown
+
+        channel = self.channels.get(message.channel.id)
+        if channel is None:
+            channel = self.channels[message.channel.id] = ChannelState(cfg)
+        channel.last_seen = now
+        lock_hit = channel.lock.hit(now, cfg.channel_window)
+        slow_hit = channel.slowmode.hit(now, cfg.channel_window)
+        if now >= channel.cooldown_until:
+            if lock_hit:
+                verdicts.append(Verdict("lock", f"Csatorna flood ({cfg.channel_lock_count} üzenet / {cfg.channel_window:g} mp)"))
+                channel.cooldown_until = now + cfg.action_cooldown
+            elif slow_hit and getattr(message.channel, "slowmode_delay", 1) == 0:
+                verdicts.append(Verdict("slowmode", f"Csatorna flood ({cfg.channel_slowmode_count} üzenet / {cfg.channel_window:g} mp)"))
+                channel.cooldown_until = now + cfg.action_cooldown
+
+        self._maybe_sweep(now)
+        return verdicts
+
+    def check_join(self, member: discord.Member) -> list[Verdict]:
+        now = time.monotonic()
+        cfg = self.cfg
+        guild_id = member.guild.id
+        joins = self.joins.get(guild_id)
+        if joins is None:
+            joins = self.joins[guild_id] = SlidingWindow(cfg.join_count)
+        verdicts = []
+        if joins.hit(now, cfg.join_window) and not self.in_raid_mode(guild_id, now):
+            self.raid_until[guild_id] = now + cfg.raid_minutes * 60
+            verdicts.append(Verdict("raid", f"Csatlakozási hullám ({cfg.join_count} tag / {cfg.join_window:g} mp)"))
+        if self.in_raid_mode(guild_id, now):
+            verdicts.append(Verdict("mute", "Csatlakozás raid módban"))
+        return verdicts
+
+    def in_raid_mode(self, guild_id: int, now: Optional[float] = None) -> bool:
+        return self.raid_until.get(guild_id, 0.0) > (now or time.monotonic())
+
+    def _maybe_sweep(self, now: float) -> None:
+        """Inaktív állapotok törlése (legfeljebb percenként egyszer)."""
+        if now - self._last_sweep < 60:
+            return
+        self._last_sweep = now
+        idle = now - self.cfg.idle_seconds
+        self.users = {k: v for k, v in self.users.items() if v.last_seen >= idle or v.cooldown_until > now}
+        self.channels = {k: v for k, v in self.channels.items() if v.last_seen >= idle or v.cooldown_until > now}
+        self.raid_until = {k: v for k, v in self.raid_until.items() if v > now}
+
+    def forget_guild(self, guild_id: int) -> None:
+        self.users = {k: v for k, v in self.users.items() if k[0] != guild_id}
+        self.joins.pop(guild_id, None)
+        self.raid_until.pop(guild_id, None)
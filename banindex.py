@@ -0,0 +1,187 @@
+"""Szerverenkénti tiltólista index a `/unban`-hoz.
+
+A tiltólistát szerverenként egyszer, lustán töltjük be (lapozva, az első
+igénylésnél), utána az `on_member_ban` / `on_member_unban` események
+tartják naprakészen. Keresés ID-ra, normalizált névre (`név`, `név#1234`,
+megjelenített név), rendezett kulcslistán bisect-tel prefixre, és
+difflib-bel elgépelt névre (autocomplete).
+"""
+
+import asyncio
+import bisect
+import difflib
+import unicodedata
+from dataclasses import dataclass
+from typing import Optional, Union
+
+import discord
+
+
+MAX_RESULTS = 25  # a Discord autocomplete korlátja
+FUZZY_MIN_LENGTH = 3
+
+def normalize(name: str) -> str:
+    return unicodedata.normalize("NFKC", name).casefold().strip()
+
+@dataclass(slots=True)
+class BanEntry:
+    user_id: int
+    name: str
+    discriminator: str
+    global_name: Optional[str]
+    reason: Optional[str]
+
+    @classmethod
+    def from_user(cls, user: Union[discord.User, discord.Member], reason: Optional[str] = None) -> "BanEntry":
+        return cls(user.id, user.name, user.discriminator, user.global_name, reason)
+
+    @property
+    def tag(self) -> str:
+        return self.name if self.discriminator in ("0", "0000") else f"{self.name}#{self.discriminator}"
+
+    def keys(self) -> set[str]:
+        keys = {normalize(self.name), normalize(self.tag)}
+        if self.global_name:
+            keys.add(normalize(self.global_name))
+        return keys
+
+    def __str__(self) -> str:
+        return f"{self.tag} ({self.user_id})"
+
+class GuildBans:
+    def __init__(self) -> None:
+        self.by_id: dict[int, BanEntry] = {}
+        self.by_key: dict[str, set[int]] = {}
+        self._sorted: list[str] = []  # rendezett kulcsok a prefix kereséshez, lustán újraépítve
+        self._dirty = False
+        self.loaded = False
+        self.unbanned_during_load: Optional[set[int]] = None
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def add(self, entry: BanEntry) -> None:
+        self.remove(entry.user_id)
+        self.by_id[entry.user_id] = entry
+        for key in entry.keys():
+            ids = self.by_key.get(key)
+            if ids is None:
+                ids = self.by_key[key] = set()
+                self._dirty = True
+            ids.add(entry.user_id)
+
+    def remove(self, user_id: int) -> Optional[BanEntry]:
+        entry = self.by_id.pop(user_id, None)
+        if entry is None:
+            return None
+        for key in entry.keys():
+            ids = self.by_key.get(key)
+            if ids is not None:
+                ids.discard(user_id)
+                if not ids:
+                    del self.by_key[key]
+                    self._dirty = True
+        return entry
+
+    def _keys(self) -> list[str]:
+        if self._dirty:
+            self._sorted = sorted(self.by_key)
+            self._dirty = False
+        return self._sorted
+
+    def lookup(self, query: str) -> list[BanEntry]:
+        """Pontos egyezés: ID, `név#1234`, felhasználónév vagy megjelenített név."""
+        query = query.strip()
+        if query.isdigit():
+            entry = self.by_id.get(int(query))
+            return [entry] if entry else []
+        return [self.by_id[i] for i in self.by_key.get(normalize(query), ())]
+
+    def search(self, query: str, limit: int = MAX_RESULTS) -> list[BanEntry]:
+        """Autocomplete: ID / pontos, majd prefix, végül hasonló nevek."""
+        norm = normalize(query)
+        found: dict[int, BanEntry] = {}
+
+        def take(ids) -> None:
+            for user_id in ids:
+                if len(found) >= limit:
+                    return
+                found.setdefault(user_id, self.by_id[user_id])
+
+        if norm.isdigit():
+            take(i for i in self.by_id if str(i).startswith(norm))
+            return list(found.values())
+        keys = self._keys()
+        if not norm:
+            take(i for k in keys[:limit] for i in self.by_key[k])
+            return list(found.values())
+        start = bisect.bisect_left(keys, norm)
+        for key in keys[start:]:
+            if len(found) >= limit or not key.startswith(norm):
+                break
+            take(self.by_key[key])
+        if len(found) < limit and len(norm) >= FUZZY_MIN_LENGTH:
+            # Elgépelés: csak az azonos kezdőbetűs kulcsok között, hogy nagy listán is gyors maradjon.
+            lo = bisect.bisect_left(keys, norm[0])
+            hi = bisect.bisect_left(keys, chr(ord(norm[0]) + 1))
+            for key in difflib.get_close_matches(norm, keys[lo:hi], n=limit, cutoff=0.6):
+                take(self.by_key[key])
+        return list(found.values())
+
+class BanIndex:
+    def __init__(self) -> None:
+        self.guilds: dict[int, GuildBans] = {}
+        self._loading: dict[int, asyncio.Task] = {}
+        self.fetches = 0
+
+    def peek(self, guild_id: int) -> Optional[GuildBans]:
+        """A betöltött index, vagy None (nem indít betöltést)."""
+        bans = self.guilds.get(guild_id)
+        return bans if bans is not None and bans.loaded else None
+
+    async def get(self, guild: discord.Guild) -> GuildBans:
+        """Az index; első híváskor a teljes tiltólista betöltése (párhuzamos hívók egyetlen betöltésre várnak)."""
+        bans = self.peek(guild.id)
+        if bans is not None:
+            return bans
+        return await asyncio.shield(self.warm(guild))
+
+    def warm(self, guild: discord.Guild) -> asyncio.Task:
+        task = self._loading.get(guild.id)
+        if task is None:
+            task = self._loading[guild.id] = asyncio.create_task(self._load(guild))
+        return task
+
+    async def _load(self, guild: discord.Guild) -> GuildBans:
+        # A betöltés alatt érkező események ugyanebbe a struktúrába kerülnek;
+        # a közben feloldott tiltásokat a lapozás eredménye nem írja vissza.
+        bans = self.guilds.setdefault(guild.id, GuildBans())
+        unbanned = bans.unbanned_during_load = set()
+        try:
+            self.fetches += 1
+            async for ban in guild.bans(limit=None):
+                if ban.user.id not in unbanned and ban.user.id not in bans.by_id:
+                    bans.add(BanEntry.from_user(ban.user, ban.reason))
+            bans.loaded = True
+            return bans
+        finally:
+            bans.unbanned_during_load = None
+            self._loading.pop(guild.id, None)
+
+    def on_ban(self, guild: discord.Guild, user: Union[discord.User, discord.Member]) -> None:
+        bans = self.guilds.get(guild.id)
+        if bans is not None:
+            bans.add(BanEntry.from_user(user))
+
+    def on_unban(self, guild: discord.Guild, user: discord.User) -> None:
+        bans = self.guilds.get(guild.id)
+        if bans is not None:
+            bans.remove(user.id)
+            if bans.unbanned_during_load is not None:
+                bans.unbanned_during_load.add(user.id)
+
+    def forget_guild(self, guild_id: int) -> None:
+        self.guilds.pop(guild_id, None)
+        task = self._loading.pop(guild_id, None)
+        if task is not None:
+            task.cancel()
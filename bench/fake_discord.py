@@ -0,0 +1,265 @@
+"""Helyi Discord helyettesítő a benchmarkhoz.
+
+- `Payloads`: szintetikus gateway payloadok (szerver, tag, üzenet, interakció)
+- `FakeRest`: a bot HTTP kliensének és az interakciós webhooknak a helyére
+  kerülő REST "szerver", állítható válaszidővel; útvonalanként számol
+- `FakeGateway`: a payloadokat közvetlenül a discord.py `ConnectionState`
+  parserjeibe táplálja, websocket nélkül
+"""
+
+import asyncio
+import itertools
+import re
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+import discord
+from discord.http import Route
+from discord.webhook.async_ import async_context
+
+
+DISCORD_EPOCH = 1420070400000
+APP_ID = 100000000000000001
+ADMIN = str(discord.Permissions.all().value)
+
+_seq = itertools.count(1)
+
+def snowflake(at: Optional[float] = None) -> int:
+    ms = int((at if at is not None else time.time()) * 1000) - DISCORD_EPOCH
+    return (ms << 22) | (next(_seq) & 0x3FFFFF)
+
+def iso(at: Optional[float] = None) -> str:
+    return datetime.fromtimestamp(at if at is not None else time.time(), timezone.utc).isoformat()
+
+# ----------------- Payloadok -----------------
+
+class Payloads:
+    """Egy szintetikus szerver: szerepek, szöveges csatornák, tagok."""
+
+    def __init__(self, members: int = 1000, channels: int = 20, roles: int = 10) -> None:
+        self.bot_user = self.user(APP_ID, "benchbot", bot=True)
+        self.guild_id = snowflake(time.time() - 86400 * 365)
+        self.everyone = self.role(self.guild_id, "@everyone", 0, "0")
+        self.admin_role = self.role(snowflake(), "admin", roles + 1, ADMIN)  # legfelül: mindenkit moderálhat
+        self.roles = [self.everyone, self.admin_role] + [self.role(snowflake(), f"szerep-{i}", i + 1, "0") for i in range(roles)]
+        self.channels = [self.channel(snowflake(), "mod-log", 0)] + \
+                        [self.channel(snowflake(), f"csatorna-{i}", i + 1) for i in range(channels)]
+        self.users = [self.user(snowflake(time.time() - 86400 * 30), f"tag{i}") for i in range(members)]
+        self.moderator = self.users[0]
+        # Minden payload ugyanazokat a szerepeket adja egy taghoz (a discord.py az üzenetekből is frissíti a cache-t).
+        self.member_roles = {u["id"]: [self.roles[2 + i % roles]["id"]] for i, u in enumerate(self.users)}
+        for admin in (self.bot_user, self.moderator):
+            self.member_roles[admin["id"]] = [self.admin_role["id"]]
+
+    @staticmethod
+    def user(user_id: int, name: str, bot: bool = False) -> dict:
+        return {"id": str(user_id), "username": name, "discriminator": "0", "global_name": name,
+                "avatar": None, "bot": bot}
+
+    @staticmethod
+    def role(role_id: int, name: str, position: int, permissions: str) -> dict:
+        return {"id": str(role_id), "name": name, "color": 0, "hoist": False, "position": position,
+                "permissions": permissions, "managed": False, "mentionable": False, "flags": 0}
+
+    def channel(self, channel_id: int, name: str, position: int) -> dict:
+        return {"id": str(channel_id), "type": 0, "guild_id": str(self.guild_id), "name": name,
+                "position": position, "permission_overwrites": [], "nsfw": False, "rate_limit_per_user": 0}
+
+    def member(self, user: dict, joined: Optional[float] = None, with_user: bool = True) -> dict:
+        data = {"roles": self.member_roles.get(user["id"], []), "joined_at": iso(joined),
+                "deaf": False, "mute": False, "flags": 0}
+        if with_user:
+            data["user"] = user
+        return data
+
+    def guild(self) -> dict:
+        members = [self.member(u) for u in [self.bot_user] + self.users]
+        return {
+            "id": str(self.guild_id), "name": "Bench szerver", "owner_id": self.moderator["id"],
+            "roles": self.roles, "channels": self.channels, "members": members,
+            "member_count": len(members), "emojis": [], "stickers": [], "features": [], "threads": [],
+            "presences": [], "voice_states": [], "stage_instances": [], "guild_scheduled_events": [],
+            "unavailable": False, "large": len(members) > 250, "premium_tier": 0, "verification_level": 0,
+            "default_message_notifications": 0, "explicit_content_filter": 0, "mfa_level": 0,
+            "nsfw_level": 0, "preferred_locale": "hu", "afk_timeout": 300, "system_channel_flags": 0,
+        }
+
+    def message(self, channel_id: str, author: dict, content: str, at: Optional[float] = None,
+                message_id: Optional[int] = None) -> dict:
+        return {
+            "id": str(message_id or snowflake(at)), "channel_id": str(channel_id), "guild_id": str(self.guild_id),
+            "author": author, "member": self.member(author, with_user=False), "content": content,
+            "timestamp": iso(at), "edited_timestamp": None, "tts": False, "mention_everyone": False,
+            "mentions": [], "mention_roles": [], "attachments": [], "embeds": [], "pinned": False,
+            "type": 0, "flags": 0, "components": [],
+        }
+
+    def interaction(self, name: str, options: Optional[dict[str, Any]] = None, user: Optional[dict] = None,
+                    channel: Optional[dict] = None) -> dict:
+        """Slash parancs interakció; Member / Role értékek a `resolved` részbe kerülnek."""
+        user = user or self.moderator
+        channel = channel or self.channels[1]
+        opts, resolved = [], {"users": {}, "members": {}, "roles": {}}
+        for key, value in (options or {}).items():
+            if isinstance(value, dict) and "username" in value:
+                resolved["users"][value["id"]] = value
+                resolved["members"][value["id"]] = self.member(value, with_user=False)
+                opts.append({"name": key, "type": 6, "value": value["id"]})
+            elif isinstance(value, dict) and "permissions" in value:
+                resolved["roles"][value["id"]] = value
+                opts.append({"name": key, "type": 8, "value": value["id"]})
+            elif isinstance(value, bool):
+                opts.append({"name": key, "type": 5, "value": value})
+            elif isinstance(value, int):
+                opts.append({"name": key, "type": 4, "value": value})
+            else:
+                opts.append({"name": key, "type": 3, "value": str(value)})
+        member = self.member(user)
+        member["permissions"] = ADMIN if user is self.moderator else "0"
+        return {
+            "id": str(snowflake()), "application_id": str(APP_ID), "type": 2, "token": f"tok{next(_seq)}",
+            "version": 1, "guild_id": str(self.guild_id), "channel_id": channel["id"], "channel": channel,
+            "member": member, "app_permissions": ADMIN, "locale": "hu", "guild_locale": "hu",
+            "attachment_size_limit": 8 * 2**20, "entitlements": [], "authorizing_integration_owners": {},
+            "context": 0,
+            "data": {"id": str(snowflake()), "name": name, "type": 1, "options": opts, "resolved": resolved},
+        }
+
+    def component(self, message: dict, custom_id: str, user: dict) -> dict:
+        """Gombnyomás egy korábbi üzenet komponensén."""
+        channel = next(c for c in self.channels if c["id"] == message["channel_id"])
+        data = self.interaction("", user=user, channel=channel)
+        data.update(type=3, message=message, data={"custom_id": custom_id, "component_type": 2})
+        return data
+
+# ----------------- REST -----------------
+
+def _route_regex(path: str) -> re.Pattern:
+    return re.compile("^" + re.sub(r"\\{(\w+)\\}", r"(?P<\1>[^/]+)", re.escape(path)) + "$")
+
+class FakeRest:
+    """Válaszok útvonal-sablon szerint; minden hívás `latency` mp-ig tart."""
+
+    def __init__(self, payloads: Payloads, latency: float = 0.03, history: int = 500) -> None:
+        self.p = payloads
+        self.latency = latency
+        self.history_size = history
+        self.calls: Counter[str] = Counter()
+        self._history: dict[str, list[dict]] = {}
+        self._regex: dict[str, re.Pattern] = {}
+        self._originals: dict[str, dict] = {}  # interakció token -> a válasz üzenete
+
+    def install(self, client: discord.Client) -> None:
+        client.http.request = self.request
+        async_context.get().request = self.webhook_request
+
+    def _params(self, route: Route) -> dict[str, str]:
+        rx = self._regex.get(route.path)
+        if rx is None:
+            rx = self._regex[route.path] = _route_regex(route.path)
+        m = rx.match(route.url[len(Route.BASE):])
+        return m.groupdict() if m else {}
+
+    async def request(self, route: Route, **kwargs: Any) -> Any:
+        self.calls[route.key] += 1
+        await asyncio.sleep(self.latency)
+        params = self._params(route)
+        key = route.key
+        bot = self.p.bot_user
+        if key == "POST /channels/{channel_id}/messages":
+            return self.p.message(params["channel_id"], bot, kwargs.get("json", {}).get("content") or "")
+        if key == "PATCH /channels/{channel_id}/messages/{message_id}":
+            return self.p.message(params["channel_id"], bot, "", message_id=int(params["message_id"]))
+        if key == "GET /channels/{channel_id}/messages":
+            return self._page(params["channel_id"], kwargs.get("params", {}))
+        if key == "PATCH /guilds/{guild_id}/members/{user_id}":
+            user = next((u for u in self.p.users if u["id"] == params["user_id"]), self.p.moderator)
+            return self.p.member(user)
+        if key == "POST /guilds/{guild_id}/bulk-ban":
+            return {"banned_users": kwargs.get("json", {}).get("user_ids", []), "failed_users": []}
+        if key == "PATCH /channels/{channel_id}":
+            channel = next(c for c in self.p.channels if c["id"] == params["channel_id"])
+            return dict(channel, **kwargs.get("json", {}))
+        if key.startswith("PUT /applications/"):
+            return []
+        return None
+
+    def _page(self, channel_id: str, query: dict) -> list[dict]:
+        """Csatorna előzmények: `history` db üzenet, az elmúlt 20 napra szórva (a régiek egyenként törlődnek)."""
+        msgs = self._history.get(channel_id)
+        if msgs is None:
+            now = time.time()
+            step = 20 * 86400 / max(1, self.history_size)
+            msgs = self._history[channel_id] = [
+                self.p.message(channel_id, self.p.users[i % len(self.p.users)], f"üzenet {i}", at=now - i * step)
+                for i in range(self.history_size)
+            ]  # legújabb elöl
+        before = int(query["before"]) if query.get("before") else None
+        limit = int(query.get("limit", 50))
+        page = [m for m in msgs if before is None or int(m["id"]) < before]
+        return page[:limit]
+
+    async def webhook_request(self, route: Route, session: Any = None, **kwargs: Any) -> Any:
+        self.calls[route.key] += 1
+        await asyncio.sleep(self.latency)
+        params = self._params(route)
+        key = route.key
+        channel = self.p.channels[1]["id"]
+        if key.endswith("/callback"):
+            payload = kwargs.get("payload") or {}
+            if not payload and kwargs.get("multipart"):
+                import json
+                payload = json.loads(kwargs["multipart"][0]["value"])
+            response_type = payload.get("type", 4)
+            message = self.p.message(channel, self.p.bot_user, (payload.get("data") or {}).get("content") or "")
+            data = {"interaction": {"id": params.get("webhook_id"), "type": 2,
+                                    "response_message_id": message["id"],
+                                    "response_message_loading": response_type == 5}}
+            if response_type == 4:
+                data["resource"] = {"type": 4, "message": message}
+            self._originals[params.get("webhook_token")] = message
+            return data
+        if key.endswith("/messages/@original") and params.get("webhook_token") in self._originals:
+            return self._originals[params["webhook_token"]]
+        if key.startswith(("GET /webhooks", "PATCH /webhooks", "POST /webhooks")):
+            return self.p.message(channel, self.p.bot_user, (kwargs.get("payload") or {}).get("content") or "")
+        return None
+
+    def top(self, n: int = 10) -> list[tuple[str, int]]:
+        return self.calls.most_common(n)
+
+# ----------------- Gateway -----------------
+
+class FakeGateway:
+    """Gateway események közvetlen betáplálása (nincs websocket, nincs heartbeat)."""
+
+    def __init__(self, client: discord.Client, payloads: Payloads) -> None:
+        self.client = client
+        self.state = client._connection
+        self.p = payloads
+
+    def login(self) -> None:
+        self.state.application_id = APP_ID
+        self.state.user = discord.ClientUser(state=self.state, data=self.p.bot_user)
+
+    def ready(self) -> discord.Guild:
+        guild = self.state._add_guild_from_data(self.p.guild())
+        self.client._ready.set()
+        self.client.dispatch("ready")
+        return guild
+
+    def interaction(self, name: str, options: Optional[dict[str, Any]] = None, **kw: Any) -> None:
+        self.state.parse_interaction_create(self.p.interaction(name, options, **kw))
+
+    def component(self, message: dict, custom_id: str, user: dict) -> None:
+        self.state.parse_interaction_create(self.p.component(message, custom_id, user))
+
+    def message(self, channel: dict, author: dict, content: str) -> None:
+        self.state.parse_message_create(self.p.message(channel["id"], author, content))
+
+    def member_join(self, user: dict) -> None:
+        data = self.p.member(user)
+        data["guild_id"] = str(self.p.guild_id)
+        self.state.parse_guild_member_add(data)
@@ -0,0 +1,383 @@
+"""Offline terheléses teszt és benchmark a valódi bot kezelőkkel (core.py, cogs/).
+
+A bot egy helyi gateway / REST helyettesítő ellen fut (bench/fake_discord.py),
+élő Discord nélkül. Forgatókönyvenként szintetikus forgalmat játszik vissza
+állítható ütemben, és kiírja a parancsonkénti p50/p99 kezelési időt, a
+hívásonkénti REST hívásszámot és az event loop késését.
+
+Futtatás a repo gyökeréből:
+
+    python -m bench.run                                  # minden forgatókönyv
+    python -m bench.run interactions raid --rate 300     # csak ezek
+    python -m bench.run --save bench-baseline.json
+    python -m bench.run --compare bench-baseline.json    # regresszió esetén 1-es kilépési kód
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from typing import Callable
+
+
+SCENARIOS = ("interactions", "purge", "poll", "countdown", "raid", "reload", "spam", "chat")
+LAG_INTERVAL = 0.01
+NOISE_FLOOR = 0.005  # ennél kisebb p99 eltérés nem számít regressziónak
+
+def percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+class Harness:
+    def __init__(self, args: argparse.Namespace) -> None:
+        # A core modul importáláskor építi fel az állapotot: a környezetet előtte kell beállítani.
+        import core as botmod
+        import metrics
+        from bench.fake_discord import FakeGateway, FakeRest, Payloads
+
+        self.args = args
+        self.botmod = botmod
+        self.metrics = metrics.registry
+        self.client = botmod.bot
+        self.p = Payloads(members=args.members, channels=args.channels)
+        self.rest = FakeRest(self.p, latency=args.rest_latency / 1000, history=args.history)
+        self.gateway = FakeGateway(self.client, self.p)
+        self.samples: dict[str, list[float]] = defaultdict(list)
+        self.lag: list[float] = []
+        self.in_flight = 0
+
+    async def start(self) -> None:
+        self.rest.install(self.client)
+        await self.client._async_setup_hook()
+        self.gateway.login()
+        self._wrap_tree()
+        await self.client.setup_hook()
+        self.gateway.ready()
+        asyncio.create_task(self._monitor_lag())
+
+    async def close(self) -> None:
+        await self.client.close()
+
+    def _wrap_tree(self) -> None:
+        """A parancsfa hívásának mérése (a teljes kezelés, hibakezelővel együtt)."""
+        tree = self.client.tree
+        call = tree._call
+
+        async def timed(interaction):
+            started = time.perf_counter()
+            try:
+                await call(interaction)
+            finally:
+                self.samples[interaction.data["name"]].append(time.perf_counter() - started)
+                self.in_flight -= 1
+
+        tree._call = timed
+
+        # Komponens (gomb) interakciók: a view callback futása.
+        import discord
+        scheduled = discord.ui.View._scheduled_task
+
+        async def timed_item(view, item, interaction):
+            started = time.perf_counter()
+            try:
+                await scheduled(view, item, interaction)
+            finally:
+                name = f"gomb:{interaction.data['custom_id'].split(':')[0]}"
+                self.samples[name].append(time.perf_counter() - started)
+                self.in_flight -= 1
+
+        discord.ui.View._scheduled_task = timed_item
+
+    async def _monitor_lag(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + LAG_INTERVAL
+            await asyncio.sleep(LAG_INTERVAL)
+            self.lag.append(max(0.0, loop.time() - expected))
+
+    def reset(self) -> None:
+        self.samples.clear()
+        self.lag.clear()
+        self.rest.calls.clear()
+        self.metrics.commands.clear()
+
+    # --- forgalom ---
+
+    def command(self, name: str, options: dict | None = None, **kw) -> None:
+        self.in_flight += 1
+        self.gateway.interaction(name, options, **kw)
+
+    def click(self, message: dict, custom_id: str, user: dict) -> None:
+        self.in_flight += 1
+        self.gateway.component(message, custom_id, user)
+
+    async def paced(self, count: int, rate: float, fire: Callable[[int], None]) -> None:
+        """`count` esemény egyenletes ütemben (`rate` / mp); lemaradásnál nem alszik."""
+        started = time.perf_counter()
+        for i in range(count):
+            delay = started + i / rate - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            fire(i)
+
+    async def drain(self, timeout: float = 60.0, until: Callable[[], bool] | None = None) -> None:
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            if self.in_flight <= 0 and (until is None or until()):
+                break
+            await asyncio.sleep(0.05)
+        await asyncio.sleep(0.2)  # a kiküldött háttér taskok (mod-log, listenerek) lefutása
+
+    # --- riport ---
+
+    def report(self, scenario: str, wall: float) -> dict:
+        commands = {}
+        for name, values in sorted(self.samples.items()):
+            stats = self.metrics.commands.get(name)
+            calls = stats.calls if stats else len(values)
+            commands[name] = {
+                "n": len(values),
+                "p50": percentile(values, 0.5),
+                "p99": percentile(values, 0.99),
+                "max": max(values),
+                "rest_per_call": (stats.rest_calls / calls) if stats and calls else 0.0,
+                "errors": stats.errors if stats else 0,
+                "auto_defers": stats.auto_defers if stats else 0,
+            }
+        return {
+            "scenario": scenario,
+            "wall": wall,
+            "commands": commands,
+            "loop_lag_p50": percentile(self.lag, 0.5),
+            "loop_lag_p99": percentile(self.lag, 0.99),
+            "loop_lag_max": max(self.lag, default=0.0),
+            "rest_calls": sum(self.rest.calls.values()),
+            "throttled": sum(s.throttled for s in self.metrics.commands.values()),
+            "rest_top": self.rest.top(5),
+        }
+
+# ----------------- Forgatókönyvek -----------------
+
+async def scenario_interactions(h: Harness) -> None:
+    """Vegyes parancsforgalom (lekérdezések, figyelmeztetés, némítás, matek)."""
+    rnd = random.Random(1)
+    mix = [
+        lambda: h.command("ping"),
+        lambda: h.command("userinfo", {"user": rnd.choice(h.p.users)}),
+        lambda: h.command("roleinfo", {"role": rnd.choice(h.p.roles[2:])}),
+        lambda: h.command("serverinfo"),
+        lambda: h.command("8ball", {"question": "Sikerül?"}),
+        lambda: h.command("math", {"expr": f"{rnd.randint(1, 99)}^{rnd.randint(2, 40)} / 7"}),
+        lambda: h.command("warn", {"member": rnd.choice(h.p.users[1:]), "reason": "bench"}),
+        lambda: h.command("mute", {"member": rnd.choice(h.p.users[1:]), "minutes": 5}),
+        lambda: h.command("reverse", {"text": "benchmark"}),
+    ]
+    await h.paced(int(h.args.rate * h.args.duration), h.args.rate, lambda i: rnd.choice(mix)())
+    await h.drain()
+
+async def scenario_purge(h: Harness) -> None:
+    """Purge vihar: egyszerre több csatornán (és néhány ütköző kérés ugyanott)."""
+    channels = h.p.channels[1:]
+    count = h.args.purges
+    await h.paced(count, h.args.rate, lambda i: h.command(
+        "purge", {"amount": 200}, channel=channels[i % len(channels)]))
+    await h.drain(timeout=300)
+
+async def scenario_poll(h: Harness) -> None:
+    """Sok párhuzamos szavazás indítása, majd szavazat-roham a gombokon."""
+    await h.paced(h.args.polls, h.args.rate, lambda i: h.command(
+        "poll", {"question": f"Kérdés {i}", "options": "alma körte szilva barack"}))
+    await h.drain()
+    polls = list(h.botmod.poll_manager.polls.values())
+    if not polls:
+        return
+    rnd = random.Random(4)
+    messages = {p.message_id: h.p.message(str(p.channel_id), h.p.bot_user, "", message_id=p.message_id) for p in polls}
+
+    def vote(i: int) -> None:
+        poll = rnd.choice(polls)
+        h.click(messages[poll.message_id], f"poll:{rnd.randrange(len(poll.options))}", rnd.choice(h.p.users))
+
+    await h.paced(h.args.votes, h.args.rate * 5, vote)
+    await h.drain()
+    await asyncio.sleep(h.botmod.poll_manager.edit_interval)  # az utolsó ritkított frissítések
+
+async def scenario_countdown(h: Harness) -> None:
+    """Sok párhuzamos /countdown; megvárja, míg mindegyik lejár."""
+    rnd = random.Random(2)
+    await h.paced(h.args.countdowns, h.args.rate, lambda i: h.command(
+        "countdown", {"seconds": rnd.randint(3, 8)}))
+    scheduler = h.botmod.scheduler
+    await h.drain(timeout=60, until=lambda: not scheduler.find("countdown"))
+
+async def scenario_raid(h: Harness) -> None:
+    """Csatlakozási hullám és üzenet flood az új fiókokról (automod)."""
+    from bench.fake_discord import Payloads, snowflake
+
+    raiders = [Payloads.user(snowflake(), f"raider{i}") for i in range(h.args.raiders)]
+    for user in raiders:
+        h.gateway.member_join(user)
+    channels = h.p.channels[1:4]
+    rnd = random.Random(3)
+    count = int(h.args.rate * h.args.duration)
+    await h.paced(count, h.args.rate, lambda i: h.gateway.message(
+        rnd.choice(channels), rnd.choice(raiders), "FREE NITRO https://discord.gg/xyz"))
+    await h.drain()
+
+async def scenario_reload(h: Harness) -> None:
+    """Parancsforgalom közben ismételt /reload: a bővítménycsere ideje, kiesés nélkül."""
+    rnd = random.Random(5)
+    mix = ["ping", "flip", "uptime"]
+    await h.paced(int(h.args.rate * h.args.duration), h.args.rate, lambda i: h.command(
+        "reload" if i % 100 == 0 else rnd.choice(mix)))
+    await h.drain()
+
+async def scenario_spam(h: Harness) -> None:
+    """Egy felhasználó /say és /math áradata bekapcsolt parancs-korlátozással: az elutasítások ára."""
+    import ratelimit
+
+    spammer = h.p.users[5]
+    ratelimit.RATE_LIMITS_ENABLED = True
+    try:
+        await h.paced(int(h.args.rate * h.args.duration), h.args.rate, lambda i: h.command(
+            "say" if i % 2 else "math", {"message": "spam"} if i % 2 else {"expr": "2^10"}, user=spammer))
+        await h.drain()
+    finally:
+        ratelimit.RATE_LIMITS_ENABLED = False
+
+async def scenario_chat(h: Harness) -> None:
+    """Sok tag normál üzenetforgalma (aktivitás / XP) közben /leaderboard és /userinfo lekérdezések."""
+    rnd = random.Random(6)
+    channels = h.p.channels[1:]
+    tracker = h.botmod.activity_tracker
+
+    def fire(i: int) -> None:
+        if i % 50 == 0:
+            h.command("leaderboard", {"page": rnd.randint(1, 5)})
+        elif i % 50 == 25:
+            h.command("userinfo", {"user": rnd.choice(h.p.users)})
+        else:
+            h.gateway.message(rnd.choice(channels), rnd.choice(h.p.users[1:]), f"üzenet {i}")
+
+    await h.paced(int(h.args.rate * 10 * h.args.duration), h.args.rate * 10, fire)
+    await h.drain()
+    started = time.perf_counter()
+    pending = tracker.pending()
+    await tracker.flush()
+    h.samples["(aktivitás mentés)"].append(time.perf_counter() - started)
+    print(f"aktivitás: {pending} függő sor egy tranzakcióban kiírva")
+
+RUNNERS = {
+    "interactions": scenario_interactions,
+    "purge": scenario_purge,
+    "poll": scenario_poll,
+    "countdown": scenario_countdown,
+    "raid": scenario_raid,
+    "reload": scenario_reload,
+    "spam": scenario_spam,
+    "chat": scenario_chat,
+}
+
+# ----------------- Kimenet -----------------
+
+def print_report(r: dict) -> None:
+    print(f"\n== {r['scenario']} ({r['wall']:.1f} mp, {r['rest_calls']} REST hívás) ==")
+    if r["commands"]:
+        print(f"{'parancs':<12}{'n':>6}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}{'REST/hívás':>12}{'hiba':>6}{'halasztás':>11}")
+        for name, c in r["commands"].items():
+            print(f"{name:<12}{c['n']:>6}{c['p50'] * 1000:>10.1f}{c['p99'] * 1000:>10.1f}"
+                  f"{c['max'] * 1000:>10.1f}{c['rest_per_call']:>12.1f}{c['errors']:>6}{c.get('auto_defers', 0):>11}")
+    print(f"event loop késés: p50 {r['loop_lag_p50'] * 1000:.1f} ms, p99 {r['loop_lag_p99'] * 1000:.1f} ms, "
+          f"max {r['loop_lag_max'] * 1000:.1f} ms")
+    if r.get("throttled"):
+        print(f"korlátozott hívások: {r['throttled']}")
+    print("leggyakoribb REST útvonalak: " + ", ".join(f"{k} ×{n}" for k, n in r["rest_top"]))
+
+def compare(results: list[dict], baseline: dict, tolerance: float) -> list[str]:
+    """p99 regressziók az elmentett alapértékhez képest."""
+    problems = []
+    for r in results:
+        base = baseline.get(r["scenario"])
+        if not base:
+            continue
+        checks = [(f"{r['scenario']}/{name}", c["p99"], base["commands"].get(name, {}).get("p99"))
+                  for name, c in r["commands"].items()]
+        checks.append((f"{r['scenario']}/loop_lag", r["loop_lag_p99"], base.get("loop_lag_p99")))
+        for label, now, before in checks:
+            if before is not None and now > before * (1 + tolerance) and now - before > NOISE_FLOOR:
+                problems.append(f"{label}: p99 {before * 1000:.1f} ms → {now * 1000:.1f} ms")
+    return problems
+
+async def main(args: argparse.Namespace) -> int:
+    if args.log:
+        import botlog
+        botlog.setup(path=args.log, stdout=False)
+    harness = Harness(args)
+    await harness.start()
+    results = []
+    try:
+        for name in args.scenarios or SCENARIOS:
+            harness.reset()
+            started = time.perf_counter()
+            await RUNNERS[name](harness)
+            result = harness.report(name, time.perf_counter() - started)
+            print_report(result)
+            results.append(result)
+    finally:
+        await harness.close()
+        if args.log:
+            botlog.shutdown()
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({r["scenario"]: r for r in results}, f, indent=2, ensure_ascii=False)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            problems = compare(results, json.load(f), args.tolerance)
+        if problems:
+            print("\nRegresszió:\n  " + "\n  ".join(problems))
+            return 1
+        print("\nNincs regresszió az alapértékhez képest.")
+    return 0
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Offline benchmark a bot kezelőihez.")
+    parser.add_argument("scenarios", nargs="*", metavar="forgatókönyv",
+                        help=f"Futtatandó forgatókönyvek ({', '.join(SCENARIOS)}); alapból mind")
+    parser.add_argument("--rate", type=float, default=100.0, help="Események / mp")
+    parser.add_argument("--duration", type=float, default=5.0, help="Folyamatos forgatókönyvek hossza (mp)")
+    parser.add_argument("--rest-latency", type=float, default=30.0, help="Szimulált REST válaszidő (ms)")
+    parser.add_argument("--members", type=int, default=2000)
+    parser.add_argument("--channels", type=int, default=20)
+    parser.add_argument("--history", type=int, default=500, help="Üzenetek csatornánként (purge)")
+    parser.add_argument("--purges", type=int, default=20)
+    parser.add_argument("--polls", type=int, default=100)
+    parser.add_argument("--votes", type=int, default=2000, help="Szavazatok a poll forgatókönyvben")
+    parser.add_argument("--countdowns", type=int, default=200)
+    parser.add_argument("--raiders", type=int, default=200)
+    parser.add_argument("--log", help="JSON napló ebbe a fájlba (a naplózás költségének méréséhez)")
+    parser.add_argument("--save", help="Eredmények mentése JSON-ba (alapértéknek)")
+    parser.add_argument("--compare", help="Összevetés egy elmentett alapértékkel")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Megengedett p99 romlás aránya")
+    args = parser.parse_args()
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"ismeretlen forgatókönyv: {', '.join(sorted(unknown))}")
+    return args
+
+if __name__ == "__main__":
+    args = parse_args()
+    workdir = tempfile.mkdtemp(prefix="bot-bench-")
+    # Külön adatbázis, metrika végpont nélkül; a valódi token sosem kell.
+    os.environ["BOT_DB_PATH"] = os.path.join(workdir, "bench.db")
+    os.environ["METRICS_PORT"] = "0"
+    os.environ["RATE_LIMITS"] = "0"  # a forgatókönyvek egy felhasználóként futnak; a "spam" kapcsolja be
+    os.environ.pop("SHARD_COUNT", None)
+    sys.exit(asyncio.run(main(args)))
@@ -0,0 +1,138 @@
+"""Nem blokkoló, strukturált (JSON soros) naplózás.
+
+A hívó oldalon egy `QueueHandler` csak a rekordot készíti elő és sorba
+teszi; a JSON formázás és a fájl / stdout írás egy `QueueListener` szálon
+történik, így egy lassú lemez vagy terminál sem állítja meg az event loopot.
+
+A rekordok a futó slash parancs adataival (parancs, szerver, felhasználó) a
+`metrics.current` ContextVar-ból egészülnek ki; a sűrű, INFO szintű
+eseményeket (pl. `command`) a LOG_SAMPLE szerinti arányban mintavételezzük,
+a figyelmeztetések és hibák mindig átmennek.
+
+Környezeti változók: LOG_LEVEL (INFO), LOG_FILE (bot.log, üresen csak stdout),
+LOG_MAX_BYTES, LOG_BACKUPS, LOG_SAMPLE (pl. `command=0.1,modlog=1`).
+"""
+
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from typing import Optional
+
+import metrics
+
+
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+LOG_FILE = os.environ.get("LOG_FILE", "bot.log")
+LOG_MAX_BYTES = int(os.environ.get("LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+LOG_BACKUPS = int(os.environ.get("LOG_BACKUPS", "5"))
+DEFAULT_SAMPLE = "command=0.1,throttled=0.1"
+
+# A rekordokon (extra=...) átadható strukturált mezők, ebben a sorrendben kerülnek a JSON-ba.
+CONTEXT_FIELDS = ("event", "cluster", "guild_id", "command", "user_id", "latency_ms", "failed", "rest_calls", "fields")
+
+def parse_sample(spec: str) -> dict[str, float]:
+    rates = {}
+    for part in spec.split(","):
+        event, _, rate = part.partition("=")
+        if event.strip() and rate.strip():
+            rates[event.strip()] = min(1.0, max(0.0, float(rate)))
+    return rates
+
+class ContextFilter(logging.Filter):
+    """Futó parancs adatai és a cluster azonosító a rekordra (ha még nincs rajta)."""
+
+    def __init__(self, cluster: Optional[int] = None) -> None:
+        super().__init__()
+        self.cluster = cluster
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.cluster is not None:
+            record.cluster = self.cluster
+        inv = metrics.current.get()
+        if inv is not None:
+            for name in ("command", "guild_id", "user_id"):
+                if getattr(record, name, None) is None:
+                    setattr(record, name, getattr(inv, name))
+        return True
+
+class SamplingFilter(logging.Filter):
+    """INFO és alatta az `event` mező szerinti arányban enged át."""
+
+    def __init__(self, rates: dict[str, float]) -> None:
+        super().__init__()
+        self.rates = rates
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self.rates.get(getattr(record, "event", None), 1.0)
+        return rate >= 1.0 or random.random() < rate
+
+class StructuredQueueHandler(logging.handlers.QueueHandler):
+    """Csak az üzenetet és a kivétel szövegét készíti el; a formázás a listener szálon fut."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg, record.args, record.exc_info = record.message, None, None
+        return record
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for name in CONTEXT_FIELDS:
+            value = getattr(record, name, None)
+            if value is not None:
+                entry[name] = value
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+def setup(cluster: Optional[int] = None, path: Optional[str] = LOG_FILE, stdout: bool = True) -> None:
+    """A gyökér logger átállítása a sor alapú, JSON kimenetű láncra (egyszer, indításkor)."""
+    global _listener
+    if _listener is not None:
+        return
+    formatter = JsonFormatter()
+    outputs: list[logging.Handler] = [logging.StreamHandler(sys.stdout)] if stdout else []
+    if path:
+        if cluster is not None:
+            # Clusterenként külön fájl: a forgatás több folyamatból nem biztonságos.
+            root, ext = os.path.splitext(path)
+            path = f"{root}-{cluster}{ext}"
+        outputs.append(logging.handlers.RotatingFileHandler(
+            path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding="utf-8"))
+    for handler in outputs:
+        handler.setFormatter(formatter)
+
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    handler = StructuredQueueHandler(records)
+    handler.addFilter(SamplingFilter(parse_sample(os.environ.get("LOG_SAMPLE", DEFAULT_SAMPLE))))
+    handler.addFilter(ContextFilter(cluster))
+    root_logger = logging.getLogger()
+    root_logger.handlers[:] = [handler]
+    root_logger.setLevel(LOG_LEVEL)
+    _listener = logging.handlers.QueueListener(records, *outputs, respect_handler_level=True)
+    _listener.start()
+
+def shutdown() -> None:
+    """A sorban maradt rekordok kiírása és a listener leállítása."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,86 @@
+"""Tömeges moderációs műveletek párhuzamos végrehajtása.
+
+A műveletek egy korlátos szemaforon keresztül futnak: egy szerveren a
+kick / ban / timeout végpontok route bucketje szerverenként közös, így
+néhány párhuzamos kérés kitölti a keretet, de nem fut bele tartósan 429-be
+(a maradékot a discord.py rate limit kezelése várakoztatja).
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional, Sequence, TypeVar
+
+
+BULK_CONCURRENCY = 5
+PROGRESS_INTERVAL = 1.5
+MAX_TARGETS = 500
+
+T = TypeVar("T")
+
+@dataclass
+class BulkResult:
+    total: int
+    done: list[int] = field(default_factory=list)
+    failed: list[tuple[int, str]] = field(default_factory=list)
+    started: float = field(default_factory=time.monotonic)
+
+    @property
+    def processed(self) -> int:
+        return len(self.done) + len(self.failed)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def progress_text(self, verb: str) -> str:
+        return (f"⏳ {verb}: {self.processed}/{self.total} "
+                f"(sikeres: {len(self.done)}, hiba: {len(self.failed)}, {self.elapsed:.1f} mp)")
+
+async def run_bulk(targets: Sequence[T], key: Callable[[T], int], action: Callable[[T], Awaitable[None]],
+                   *, concurrency: int = BULK_CONCURRENCY,
+                   on_progress: Optional[Callable[[BulkResult], Awaitable[None]]] = None) -> BulkResult:
+    """`action` futtatása minden célpontra, legfeljebb `concurrency` párhuzamosan.
+
+    Az `on_progress` visszahívás legfeljebb `PROGRESS_INTERVAL` másodpercenként
+    fut (és egyszer a végén), így a haladásjelzés nem generál plusz terhelést.
+    """
+    result = BulkResult(total=len(targets))
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(target: T):
+        async with sem:
+            try:
+                await action(target)
+                result.done.append(key(target))
+            except Exception as e:
+                result.failed.append((key(target), str(e)))
+
+    async def report():
+        while True:
+            await asyncio.sleep(PROGRESS_INTERVAL)
+            await on_progress(result)
+
+    reporter = asyncio.create_task(report()) if on_progress else None
+    try:
+        await asyncio.gather(*(one(t) for t in targets))
+    finally:
+        if reporter:
+            reporter.cancel()
+    if on_progress:
+        await on_progress(result)
+    return result
+
+def parse_ids(raw: Optional[str]) -> list[int]:
+    """Szóközzel / vesszővel elválasztott ID-k vagy említések listája."""
+    if not raw:
+        return []
+    ids = []
+    for token in raw.replace(",", " ").split():
+        token = token.strip("<@!>")
+        if token.isdigit():
+            ids.append(int(token))
+    return list(dict.fromkeys(ids))
+
+def chunks(items: Sequence[T], size: int) -> list[Sequence[T]]:
+    return [items[i:i + size] for i in range(0, len(items), size)]
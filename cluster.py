@@ -0,0 +1,150 @@
+"""Shardolt, többfolyamatos futtatás.
+
+Indítás:  python cluster.py --shards 8 --clusters 2
+
+A launcher a shard tartományokat egyenletesen szétosztja a worker
+folyamatok (clusterek) között, mindegyik egy `bot.py` példány
+`AutoShardedBot` módban, a saját shardjaival. A közös állapot
+(figyelmeztetések, időzítők, szűrőlisták) a helyi SQLite adatbázisban van;
+minden cluster csak a saját szervereihez tartozó időzített feladatokat
+futtatja. Egy összeomlott worker visszalépő várakozással újraindul.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import sys
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from storage import Database
+
+
+# ----------------- Shard konfiguráció (a worker oldalon) -----------------
+
+@dataclass(frozen=True)
+class ShardConfig:
+    shard_count: Optional[int]
+    shard_ids: Optional[list[int]]
+    cluster_id: int
+
+    @property
+    def sharded(self) -> bool:
+        return self.shard_count is not None
+
+    def owns_guild(self, guild_id: Optional[int]) -> bool:
+        """A szerver ehhez a folyamathoz tartozik-e (DM-ek a 0. shardon érkeznek)."""
+        if not self.sharded or self.shard_ids is None:
+            return True
+        shard = shard_for_guild(guild_id, self.shard_count) if guild_id else 0
+        return shard in self.shard_ids
+
+def shard_for_guild(guild_id: int, shard_count: int) -> int:
+    return (guild_id >> 22) % shard_count
+
+def config_from_env() -> ShardConfig:
+    count = os.environ.get("SHARD_COUNT")
+    ids = os.environ.get("SHARD_IDS")
+    return ShardConfig(
+        shard_count=int(count) if count else None,
+        shard_ids=[int(i) for i in ids.split(",")] if ids else None,
+        cluster_id=int(os.environ.get("CLUSTER_ID", "0")),
+    )
+
+# ----------------- Cluster állapot a közös tárolóban -----------------
+
+STATUS_PREFIX = "cluster_status:"
+STATUS_INTERVAL = 30.0
+STATUS_MAX_AGE = 90.0
+
+async def publish_status(db: Database, cluster_id: int, guilds: int, latencies: list[tuple[int, float]]) -> None:
+    await db.set_meta(f"{STATUS_PREFIX}{cluster_id}", json.dumps({
+        "guilds": guilds,
+        "latencies": latencies,
+        "ts": time.time(),
+    }))
+
+async def read_statuses(db: Database) -> dict[int, dict]:
+    """Az összes élő cluster utolsó állapota (a régi bejegyzések kihagyva)."""
+    rows = await db.fetchall("SELECT key, value FROM meta WHERE key LIKE ?", (STATUS_PREFIX + "%",))
+    now = time.time()
+    statuses = {}
+    for key, value in rows:
+        data = json.loads(value)
+        if now - data["ts"] <= STATUS_MAX_AGE:
+            statuses[int(key[len(STATUS_PREFIX):])] = data
+    return statuses
+
+# ----------------- Launcher -----------------
+
+def split_shards(shard_count: int, clusters: int) -> list[list[int]]:
+    """0..shard_count-1 egyenletes, folytonos tartományokra bontása."""
+    clusters = max(1, min(clusters, shard_count))
+    base, extra = divmod(shard_count, clusters)
+    ranges, start = [], 0
+    for i in range(clusters):
+        size = base + (1 if i < extra else 0)
+        ranges.append(list(range(start, start + size)))
+        start += size
+    return ranges
+
+async def recommended_shards(token: str) -> int:
+    import aiohttp
+    async with aiohttp.ClientSession() as session:
+        async with session.get("https://discord.com/api/v10/gateway/bot",
+                               headers={"Authorization": f"Bot {token}"}) as resp:
+            resp.raise_for_status()
+            return (await resp.json())["shards"]
+
+BOT_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bot.py")
+
+async def run_worker(cluster_id: int, shard_ids: list[int], shard_count: int, stopping: asyncio.Event) -> None:
+    env = dict(os.environ, SHARD_COUNT=str(shard_count), SHARD_IDS=",".join(map(str, shard_ids)),
+               CLUSTER_ID=str(cluster_id))
+    backoff = 1.0
+    while not stopping.is_set():
+        started = time.monotonic()
+        proc = await asyncio.create_subprocess_exec(sys.executable, BOT_SCRIPT, env=env)
+        print(f"[cluster {cluster_id}] elindítva (pid {proc.pid}, shardok: {shard_ids[0]}-{shard_ids[-1]})")
+        stop_wait = asyncio.create_task(stopping.wait())
+        proc_wait = asyncio.create_task(proc.wait())
+        await asyncio.wait({stop_wait, proc_wait}, return_when=asyncio.FIRST_COMPLETED)
+        if stopping.is_set():
+            proc.send_signal(signal.SIGINT)
+            await proc.wait()
+            return
+        stop_wait.cancel()
+        # Ha sokáig futott, a visszalépés nullázódik; gyors összeomlásnál duplázódik.
+        backoff = 1.0 if time.monotonic() - started > 60 else min(backoff * 2, 60.0)
+        print(f"[cluster {cluster_id}] kilépett ({proc.returncode}), újraindítás {backoff:.0f} mp múlva")
+        try:
+            await asyncio.wait_for(stopping.wait(), timeout=backoff)
+        except asyncio.TimeoutError:
+            pass
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="A bot futtatása több folyamatban, shardolva.")
+    parser.add_argument("--shards", type=int, help="Összes shard száma (alapból a Discord ajánlása)")
+    parser.add_argument("--clusters", type=int, default=os.cpu_count() or 1, help="Worker folyamatok száma")
+    args = parser.parse_args()
+
+    shard_count = args.shards
+    if shard_count is None:
+        token = os.environ.get("DISCORD_TOKEN")
+        if not token:
+            parser.error("--shards vagy DISCORD_TOKEN szükséges az ajánlott shardszámhoz")
+        shard_count = await recommended_shards(token)
+    ranges = split_shards(shard_count, args.clusters)
+    print(f"{shard_count} shard, {len(ranges)} cluster")
+
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stopping.set)
+    await asyncio.gather(*(run_worker(i, ids, shard_count, stopping) for i, ids in enumerate(ranges)))
+
+if __name__ == "__main__":
+    asyncio.run(main())
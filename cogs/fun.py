@@ -0,0 +1,207 @@
+"""Szórakoztató / extra parancsok: dobás, szavazás, visszaszámlálás, számológép."""
+
+import random
+import time
+from datetime import timedelta
+from typing import Optional
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+import safemath
+from core import bot, poll_manager, pretty_time_delta, scheduler
+from polls import MAX_OPTIONS as POLL_MAX_OPTIONS, Poll
+from ratelimit import limit
+from scheduler import Job
+
+
+POLL_EMOJIS = ["1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟"]
+
+def poll_embed(poll: Poll) -> discord.Embed:
+    lines = []
+    for i, (opt, count) in enumerate(zip(poll.options, poll.counts)):
+        share = count / poll.total if poll.total else 0
+        bar = "█" * round(share * 12) + "░" * (12 - round(share * 12))
+        lines.append(f"{POLL_EMOJIS[i]} **{opt}**\n`{bar}` {count} ({share:.0%})")
+    status = "🔒 Lezárva" if poll.closed else f"Vége <t:{int(poll.closes_at)}:R>"
+    embed = discord.Embed(title=f"Szavazás: {poll.question}", description="\n".join(lines) + f"\n\n{status}",
+                          color=discord.Color.dark_grey() if poll.closed else discord.Color.purple())
+    embed.set_footer(text=f"{poll.total} szavazat — egy szavazat / fő, újrakattintással visszavonható")
+    return embed
+
+class PollView(discord.ui.View):
+    """Szavazó gombok fix custom_id-val és timeout nélkül, így újraindítás után is élnek (add_view)."""
+
+    def __init__(self, option_count: int):
+        super().__init__(timeout=None)
+        for i in range(option_count):
+            button = discord.ui.Button(emoji=POLL_EMOJIS[i], style=discord.ButtonStyle.secondary,
+                                       custom_id=f"poll:{i}", row=i // 5)
+            button.callback = self._vote_callback(i)
+            self.add_item(button)
+
+    @staticmethod
+    def _vote_callback(option: int):
+        async def callback(interaction: discord.Interaction):
+            poll, choice = poll_manager.vote(interaction.message.id, interaction.user.id, option)
+            if poll is None:
+                await interaction.response.send_message("Ez a szavazás már lezárult.", ephemeral=True)
+            elif choice is None:
+                await interaction.response.send_message("↩️ Szavazatod visszavonva.", ephemeral=True)
+            else:
+                await interaction.response.send_message(f"✅ Szavazatod: {POLL_EMOJIS[choice]} {poll.options[choice]}", ephemeral=True)
+        return callback
+
+async def edit_poll_message(poll: Poll):
+    msg = bot.get_partial_messageable(poll.channel_id).get_partial_message(poll.message_id)
+    await msg.edit(embed=poll_embed(poll), view=None if poll.closed else discord.utils.MISSING)
+
+async def run_poll_close_job(job: Job) -> Optional[float]:
+    poll = await poll_manager.finish(job.payload["message_id"])
+    if poll is not None:
+        try:
+            await edit_poll_message(poll)
+        except (discord.NotFound, discord.Forbidden):
+            pass
+    return None
+
+def countdown_step(remaining: float) -> int:
+    """Szerkesztési gyakoriság: távol percenként, csak a végén másodpercenként."""
+    if remaining > 300:
+        return 60
+    if remaining > 60:
+        return 15
+    if remaining > 10:
+        return 5
+    return 1
+
+def countdown_text(end: float) -> str:
+    remaining = max(0, round(end - time.time()))
+    return f"Visszaszámlálás: {pretty_time_delta(timedelta(seconds=remaining))} (vége <t:{int(end)}:R>)"
+
+def next_countdown_edit(end: float, now: float) -> float:
+    remaining = end - now
+    step = countdown_step(remaining)
+    # Kerek értékekre igazítva (pl. 4 perc, 3 perc, ...), hogy a kijelzés ne ugráljon.
+    target = max(0, (int(remaining) - 1) // step * step)
+    return end - target
+
+async def run_countdown_job(job: Job) -> Optional[float]:
+    p = job.payload
+    msg = bot.get_partial_messageable(p["channel_id"]).get_partial_message(p["message_id"])
+    now = time.time()
+    try:
+        if now >= p["end"] - 0.5:
+            await msg.edit(content="⏰ Idő lejárt!")
+            return None
+        await msg.edit(content=countdown_text(p["end"]))
+    except (discord.NotFound, discord.Forbidden):
+        return None  # az üzenet törölve / nincs jog: nincs mit frissíteni
+    return next_countdown_edit(p["end"], now)
+
+class Fun(commands.Cog):
+    """Szórakoztató / extra parancsok."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @commands.command(name="roll")
+    async def roll(self, ctx, max_value: int = 100):
+        if max_value <= 0:
+            return await ctx.send("Adj meg pozitív számot.")
+        await ctx.send(f"🎲 Dobás: {random.randint(1, max_value)} / {max_value}")
+
+    @limit(user=(5, 10), channel=(15, 30), bucket="fun")
+    @app_commands.command(name="8ball", description="Kérdezz, és kapsz egy választ")
+    async def slash_8ball(self, interaction: discord.Interaction, question: str):
+        choices = [
+            "Igen", "Nem", "Talán", "Később kérdezd meg újra", "Esélyes", "Nincs rá meg a válaszom", "Abszolút","Biztosan nem", "Az esélyek jók", "Az esélyek rosszak", "Nem tudom megmondani", "Kérdezd meg újra", "Valószínűleg igen", "Valószínűleg nem", "Nem számíthatsz rá", "Igen, de csak ha...", "Nem, hacsak nem...", "Az univerzum nem akarja", "A jelek szerint igen", "A jelek szerint nem"
+        ]
+        await interaction.response.send_message(f"🎱 {random.choice(choices)}")
+
+    @limit(user=(5, 10), channel=(15, 30), bucket="fun")
+    @app_commands.command(name="color", description="Dob egy véletlenszámot 1 és max között")
+    async def slash_color(self, interaction: discord.Interaction, max_value: Optional[int] = 100):
+        if max_value is None or max_value <= 0:
+            await interaction.response.send_message("Adj meg pozitív számot.")
+            return
+        await interaction.response.send_message(f"🎲 Dobás: {random.randint(1, max_value)} / {max_value}")
+
+    @limit(user=(5, 10), channel=(15, 30), bucket="fun")
+    @app_commands.command(name="flip", description="Pénzfeldobás — fej vagy írás")
+    async def slash_flip(self, interaction: discord.Interaction):
+        await interaction.response.send_message("🪙 " + random.choice(["Fej", "Írás"]))
+
+    @limit(user=(5, 10), channel=(15, 30), bucket="fun")
+    @app_commands.command(name="choose", description="Kiválaszt egy opciót")
+    async def slash_choose(self, interaction: discord.Interaction, options: str):
+        opts = options.split()
+        if len(opts) < 2:
+            await interaction.response.send_message("Adj meg legalább 2 opciót (szóközzel elválasztva).")
+            return
+        await interaction.response.send_message(f"👉 A választásom: **{random.choice(opts)}**")
+
+    @limit(user=(2, 60), guild=(10, 60))
+    @app_commands.command(name="poll", description="Szavazás indítása")
+    @app_commands.describe(options="Opciók szóközzel elválasztva (max 10)", minutes="Ennyi perc múlva zárul (alapból 60)")
+    async def slash_poll(self, interaction: discord.Interaction, question: str, options: str,
+                         minutes: app_commands.Range[int, 1, 10080] = 60):
+        opts = options.split()
+        if not opts:
+            opts = ["Igen", "Nem"]
+        if len(opts) > POLL_MAX_OPTIONS:
+            await interaction.response.send_message(f"Maximum {POLL_MAX_OPTIONS} opciót adhatsz meg.", ephemeral=True)
+            return
+        poll = Poll(0, interaction.guild_id or 0, interaction.channel_id, interaction.user.id, question, opts,
+                    closes_at=time.time() + minutes * 60)
+        # Egyetlen üzenet a gombokkal (a reakciók opciónként egy-egy REST hívást jelentettek).
+        await interaction.response.send_message(embed=poll_embed(poll), view=PollView(len(opts)))
+        msg = await interaction.original_response()
+        poll.message_id = msg.id
+        await poll_manager.create(poll)
+        await scheduler.schedule("poll_close", poll.closes_at, {
+            "guild_id": interaction.guild_id, "channel_id": poll.channel_id, "message_id": poll.message_id,
+        })
+
+    @limit(user=(2, 60), guild=(10, 60))
+    @app_commands.command(name="countdown", description="Visszaszámlálás indítása")
+    async def slash_countdown(self, interaction: discord.Interaction, seconds: int):
+        if seconds <= 0 or seconds > 86400:
+            await interaction.response.send_message("Adj meg 1 és 86400 közötti másodpercek számát.", ephemeral=True)
+            return
+        end = time.time() + seconds
+        await interaction.response.send_message(countdown_text(end))
+        msg = await interaction.original_response()
+        await scheduler.schedule("countdown", next_countdown_edit(end, time.time()), {
+            "guild_id": interaction.guild_id, "channel_id": msg.channel.id, "message_id": msg.id, "end": end,
+        })
+
+    @limit(user=(5, 10), guild=(20, 10))
+    @app_commands.command(name="math", description="Matematikai kifejezés kiértékelése")
+    async def slash_math(self, interaction: discord.Interaction, expr: str):
+        try:
+            result = await safemath.evaluate_async(expr)
+            await interaction.response.send_message(f"📐 Eredmény: `{result}`")
+        except safemath.MathError as e:
+            await interaction.response.send_message(f"❌ Hiba a számítás közben: {e}", ephemeral=True)
+
+    @limit(user=(5, 10), channel=(15, 30), bucket="fun")
+    @app_commands.command(name="reverse", description="Szöveg visszafordítása")
+    async def slash_reverse(self, interaction: discord.Interaction, text: str):
+        await interaction.response.send_message(text[::-1])
+
+    @limit(user=(5, 10), channel=(15, 30), bucket="fun")
+    @app_commands.command(name="mock", description="Mock stílusú szöveg")
+    async def slash_mock(self, interaction: discord.Interaction, text: str):
+        s = ''.join(c.upper() if i % 2 else c.lower() for i, c in enumerate(text))
+        await interaction.response.send_message(s)
+
+async def setup(bot: commands.Bot):
+    # Újratöltéskor is: a kezelők, a szerkesztő és a nyitott szavazások gombjai az új kódra mutassanak.
+    scheduler.register("poll_close", run_poll_close_job)
+    scheduler.register("countdown", run_countdown_job)
+    poll_manager.editor = edit_poll_message
+    for poll in poll_manager.polls.values():
+        bot.add_view(PollView(len(poll.options)), message_id=poll.message_id)
+    await bot.add_cog(Fun(bot))
@@ -0,0 +1,295 @@
+"""Általános parancsok: információk a botról, a szerverről és a tagokról."""
+
+from datetime import datetime
+from typing import Optional
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+import core
+import membercache
+from activity import level_for
+from cluster import read_statuses
+from core import SHARDS, activity_tracker, bot, db, guild_stats, member_cache, pretty_time_delta, shard_latencies, start_time
+from guildstats import GuildStats
+from ratelimit import limit
+
+
+LEADERBOARD_PAGE = 10
+
+CHANNEL_TYPE_NAMES = {
+    discord.ChannelType.text: "szöveges", discord.ChannelType.voice: "hang",
+    discord.ChannelType.category: "kategória", discord.ChannelType.news: "hír",
+    discord.ChannelType.stage_voice: "stage", discord.ChannelType.forum: "fórum",
+    discord.ChannelType.media: "média",
+}
+
+async def require_guild_stats(interaction: discord.Interaction, guild: discord.Guild) -> GuildStats:
+    """A szerver statisztika indexe; ha még nincs és a taglista hiányos, halasztott válasz mellett chunkol."""
+    stats = guild_stats.get(guild)
+    if stats is None:
+        await interaction.response.defer()
+        await member_cache.ensure_chunked(guild)
+        stats = guild_stats.build(guild)
+    return stats
+
+class General(commands.Cog):
+    """Általános parancsok."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @app_commands.command(name="help", description="Segítség — Parancsok listája")
+    async def help_cmd(self, interaction: discord.Interaction):
+        embed = discord.Embed(
+            title="Segítség — Parancsok",
+            description=f"Prefix: `/` — Írd: `/help` a használathoz",
+            color=discord.Color.blurple(),
+            timestamp=datetime.utcnow()
+        )
+        embed.set_thumbnail(url=bot.user.display_avatar.url)
+        # Általános parancsok
+        embed.add_field(
+            name="🤖 Általános",
+            value=(
+                "`/help` — Ez az üzenet\n"
+                "`/ping` — Válaszidő\n"
+                "`/say <szöveg>` — A bot ismétli\n"
+                "`/avatar [user]` — Profilkép\n"
+                "`/userinfo [user]` — Felhasználó adatai\n"
+                "`/serverinfo` — Szerver adatai\n"
+                "`/membercount` — Tagok száma\n"
+                "`/botinfo` — Bot adatai\n"
+                "`/invite` — Meghívó link\n"
+                "`/uptime` — Mióta fut a bot\n"
+                "`/leaderboard [oldal]` — XP ranglista és legaktívabb csatornák\n"
+            ),
+            inline=False
+        )
+        embed.add_field(
+            name="🛡 Moderáció (csak modoknak)",
+            value=(
+                "`/kick <user> [ok]` — Kirúgás\n"
+                "`/ban <user> [ok] [perc]` — Kitiltás (ideiglenes is)\n"
+                "`/unban <név, név#1234 vagy ID>` — Tiltás feloldása (kereséssel)\n"
+                "`/mute <user> <perc>` — Némítás\n"
+                "`/unmute <user>` — Némítás feloldása\n"
+                "`/massban` / `/masskick` / `/massmute` — Tömeges művelet (ID-k, szerep, friss csatlakozók)\n"
+                "`/purge <szám> [szűrők]` — Üzenetek törlése\n"
+                "`/lock [perc]` / `/unlock` — Csatorna zárolása / feloldása\n"
+                "`/slowmode <mp> [perc]` — Slowmode beállítása\n"
+                "`/nick <user> <új_nick>` — Becenév módosítása\n"
+                "`/clear_reactions <üzenet_id>` — Reakciók törlése\n"
+                "`/warn <user> [ok]` — Figyelmeztetés\n"
+                "`/warnings [user]` — Figyelmeztetések listája (lapozható)\n"
+                "`/filter add|remove|list` — Tiltott kifejezések\n"
+                "`/stats` — Parancsok késleltetése, hibái, REST hívásai\n"
+                "`/reload [bővítmény]` — Parancsok újratöltése újraindítás nélkül (csak admin)\n"
+            ),
+            inline=False
+        )
+        embed.add_field(
+            name="🎲 Szórakozás / Extra",
+            value=(
+                "`/8ball <kérdés>` — Véletlen válasz\n"
+                "`/color [max]` — Dobás (alap 100)\n"
+                "`/flip` — Pénzfeldobás\n"
+                "`/roll` — Dobókocka (alap 100)\n"
+                "`/choose <op1> <op2> ...` — Választás\n"
+                "`/poll \"Kérdés\" op1 op2 ... [perc]` — Gombos szavazás, időzített zárással\n"
+                "`/countdown <mp>` — Visszaszámlálás (max. 1 nap)\n"
+                "`/math <kifejezés>` — Számológép (pl. `sqrt(2)^3`, `fact(10)`)\n"
+                "`/reverse <szöveg>` — Szöveg visszafordítása\n"
+                "`/mock <szöveg>` — Mock stílusú szöveg\n"
+            ),
+            inline=False
+        )
+        embed.set_footer(text="Üzenet generálva:")
+        await interaction.response.send_message(embed=embed)
+
+    @app_commands.command(name="ping", description="Visszaadja a bot késleltetési idejét")
+    async def slash_ping(self, interaction: discord.Interaction):
+        shard_id = interaction.guild.shard_id if interaction.guild else 0
+        latencies = dict(shard_latencies())
+        latency = latencies.get(shard_id, bot.latency) * 1000
+        text = f"Pong! 🏓 Latencia: {latency:.0f} ms"
+        if len(latencies) > 1:
+            avg = sum(latencies.values()) / len(latencies) * 1000
+            text += f" (shard #{shard_id}; átlag {len(latencies)} shardon: {avg:.0f} ms)"
+        await interaction.response.send_message(text)
+
+    @limit(user=(3, 10), channel=(10, 30))
+    @app_commands.command(name="say", description="A bot ismétli a megadott szöveget")
+    async def slash_say(self, interaction: discord.Interaction, message: str):
+        await interaction.response.send_message(message)
+
+    @app_commands.command(name="avatar", description="Felhasználó profilképe")
+    async def slash_avatar(self, interaction: discord.Interaction, user: Optional[discord.Member] = None):
+        user = user or interaction.user
+        embed = discord.Embed(title=f"{user.display_name} avatarja", color=discord.Color.green())
+        embed.set_image(url=user.display_avatar.url)
+        await interaction.response.send_message(embed=embed)
+
+    @app_commands.command(name="userinfo", description="Felhasználó információi")
+    async def slash_userinfo(self, interaction: discord.Interaction, user: Optional[discord.Member] = None):
+        user = user or interaction.user
+        member_cache.touch(user)
+        roles = [r.mention for r in user.roles if r.name != "@everyone"]
+        joined = user.joined_at.strftime("%Y-%m-%d %H:%M:%S") if user.joined_at else "Ismeretlen"
+        created = user.created_at.strftime("%Y-%m-%d %H:%M:%S")
+        embed = discord.Embed(title=f"Info — {user}", color=discord.Color.blue())
+        embed.set_thumbnail(url=user.display_avatar.url)
+        embed.add_field(name="ID", value=user.id, inline=True)
+        embed.add_field(name="Bot?", value=str(user.bot), inline=True)
+        stats = guild_stats.get(user.guild) if isinstance(user, discord.Member) else None
+        position = stats.join_position(user) if stats else None
+        if position:
+            joined += f" ({position}. / {stats.members} tag)"
+        embed.add_field(name="Csatlakozott", value=joined, inline=False)
+        embed.add_field(name="Regisztrálva", value=created, inline=False)
+        embed.add_field(name=f"Szerepek ({len(roles)})", value=", ".join(roles) or "Nincs", inline=False)
+        if interaction.guild is not None and not user.bot:
+            act = await activity_tracker.user_stats(interaction.guild.id, user.id)
+            rank = f"#{act.rank} / {act.ranked}" if act.rank else "nincs rangsorolva"
+            embed.add_field(
+                name="Aktivitás",
+                value=(f"Szint {act.level} ({act.level_xp}/{act.level_needed} XP), összesen {act.xp} XP — {rank}\n"
+                       f"Üzenetek: {act.today} ma, {act.last_7_days} az elmúlt 7 napban, {act.messages} összesen"),
+                inline=False)
+        await interaction.response.send_message(embed=embed)
+
+    @limit(user=(3, 30), channel=(10, 60))
+    @app_commands.command(name="leaderboard", description="XP ranglista és a legaktívabb csatornák")
+    @app_commands.describe(page="Oldal (10 tag / oldal)")
+    async def slash_leaderboard(self, interaction: discord.Interaction, page: app_commands.Range[int, 1, 100] = 1):
+        g = interaction.guild
+        if g is None:
+            await interaction.response.send_message("Csak szerverben használható.", ephemeral=True)
+            return
+        # A ranglista előre rendezett: egy oldal csak egy szelet, nincs DB lekérdezés.
+        ranking = activity_tracker.guild(g.id)
+        offset = (page - 1) * LEADERBOARD_PAGE
+        top = ranking.top(LEADERBOARD_PAGE, offset)
+        pages = max(1, -(-len(ranking.ranking) // LEADERBOARD_PAGE))
+        if not top and page > 1:
+            await interaction.response.send_message(f"Csak {pages} oldal van.", ephemeral=True)
+            return
+        lines = [f"**{offset + i}.** <@{user_id}> — szint {level_for(xp)[0]}, {xp} XP"
+                 for i, (user_id, xp) in enumerate(top, start=1)]
+        embed = discord.Embed(title=f"🏆 Ranglista — {g.name}", description="\n".join(lines) or "Még nincs XP.",
+                              color=discord.Color.gold())
+        own = ranking.rank(interaction.user.id)
+        if own:
+            embed.add_field(name="Te", value=f"#{own} — {ranking.xp[interaction.user.id]} XP", inline=False)
+        channels = await activity_tracker.top_channels(g.id)
+        if channels:
+            embed.add_field(name="Legaktívabb csatornák (7 nap)",
+                            value="\n".join(f"<#{cid}> — {count} üzenet" for cid, count in channels), inline=False)
+        embed.set_footer(text=f"{page}. / {pages} oldal")
+        await interaction.response.send_message(embed=embed, allowed_mentions=discord.AllowedMentions.none())
+
+    @app_commands.command(name="serverinfo", description="Szerver információk")
+    async def slash_serverinfo(self, interaction: discord.Interaction):
+        g = interaction.guild
+        if g is None:
+            await interaction.response.send_message("Csak szerverben használható.", ephemeral=True)
+            return
+        stats = await require_guild_stats(interaction, g)
+        embed = discord.Embed(title=g.name, description=g.description or "Nincs leírás", color=discord.Color.red())
+        if g.icon:
+            embed.set_thumbnail(url=g.icon.url)
+        embed.add_field(name="ID", value=g.id, inline=True)
+        embed.add_field(name="Regisztrált", value=g.created_at.strftime("%Y-%m-%d"), inline=True)
+        embed.add_field(name="Tagok", value=f"{g.member_count} ({stats.humans} ember, {stats.bots} bot)", inline=True)
+        channels = ", ".join(f"{n} {CHANNEL_TYPE_NAMES.get(t, str(t))}" for t, n in stats.channels.most_common() if n > 0)
+        embed.add_field(name=f"Csatornák ({len(g.channels)})", value=channels or "Nincs", inline=False)
+        top_roles = [(g.get_role(rid), n) for rid, n in stats.roles.most_common(6)]
+        top_text = ", ".join(f"{r.mention} ({n})" for r, n in top_roles if r is not None and n > 0)
+        embed.add_field(name=f"Szerepek ({len(g.roles) - 1}) — legnépesebbek", value=top_text or "Nincs", inline=False)
+        if interaction.response.is_done():
+            await interaction.followup.send(embed=embed)
+        else:
+            await interaction.response.send_message(embed=embed)
+
+    @app_commands.command(name="membercount", description="Tagok száma a szerveren")
+    async def slash_membercount(self, interaction: discord.Interaction):
+        if interaction.guild is None:
+            await interaction.response.send_message("© Nincs adat.", ephemeral=True)
+            return
+        stats = guild_stats.get(interaction.guild)
+        detail = f" ({stats.humans} ember, {stats.bots} bot)" if stats else ""
+        await interaction.response.send_message(f"A szerveren {interaction.guild.member_count} tag van{detail}.")
+
+    @app_commands.command(name="botinfo", description="Bot információk")
+    async def slash_botinfo(self, interaction: discord.Interaction):
+        uptime = datetime.utcnow() - start_time
+        guild_count = len(bot.guilds)
+        latencies = shard_latencies()
+        if SHARDS.sharded:
+            statuses = await read_statuses(db)
+            statuses[SHARDS.cluster_id] = {"guilds": guild_count, "latencies": latencies}
+            guild_count = sum(st["guilds"] for st in statuses.values())
+            latencies = sorted(tuple(x) for st in statuses.values() for x in st["latencies"])
+        embed = discord.Embed(title="Bot információk", color=discord.Color.blurple())
+        embed.add_field(name="Név:", value=str(bot.user), inline=True)
+        embed.add_field(name="ID:", value=bot.user.id, inline=True)
+        embed.add_field(name="Futásideje:", value=pretty_time_delta(uptime), inline=True)
+        embed.add_field(name="Szerverek száma:", value=guild_count, inline=True)
+        shard_lines = [f"#{sid}: {lat * 1000:.0f} ms" for sid, lat in latencies[:20]]
+        if len(latencies) > 20:
+            shard_lines.append(f"… és még {len(latencies) - 20}")
+        embed.add_field(name=f"Shardok ({len(latencies)}):", value="\n".join(shard_lines), inline=True)
+        cache_text = f"{member_cache.policy}, {member_cache.cached_members(bot)} cachelt tag, {membercache.current_rss_mb():.0f} MB"
+        if core.startup_info:
+            cache_text += f"\nIndulás: {core.startup_info.startup_seconds:.1f} mp, {core.startup_info.rss_mb:.0f} MB"
+        embed.add_field(name="Tag cache / memória:", value=cache_text, inline=False)
+        embed.add_field(name="Készítette:", value="_.kkrrsak", inline=False)
+        embed.set_thumbnail(url=bot.user.display_avatar.url)
+        await interaction.response.send_message(embed=embed)
+
+    @app_commands.command(name="invite", description="Meghívó link a bothoz")
+    async def slash_invite(self, interaction: discord.Interaction):
+        client_id = bot.user.id
+        perms = discord.Permissions(permissions=8)
+        url = discord.utils.oauth_url(client_id, permissions=perms)
+        embed = discord.Embed(title="Meghívó a bothoz", description=f"[Kattints ide]({url})", color=discord.Color.green())
+        await interaction.response.send_message(embed=embed)
+
+    @app_commands.command(name="uptime", description="Mennyi ideje fut a bot?")
+    async def slash_uptime(self, interaction: discord.Interaction):
+        uptime = datetime.utcnow() - start_time
+        await interaction.response.send_message(f"A bot {pretty_time_delta(uptime)} óta fut.")
+
+    @app_commands.command(name="emojilist", description="A szerver custom emojijai")
+    async def slash_emojilist(self, interaction: discord.Interaction):
+        emojis = " ".join(str(e) for e in interaction.guild.emojis) if interaction.guild else ""
+        if not emojis:
+            emojis = "Nincsenek custom emojik a szerveren."
+        await interaction.response.send_message(emojis)
+
+    @app_commands.command(name="roleinfo", description="Szerep információi")
+    async def slash_roleinfo(self, interaction: discord.Interaction, role: discord.Role):
+        stats = await require_guild_stats(interaction, role.guild)
+        count = stats.role_count(role)
+        embed = discord.Embed(title=f"Szerep: {role.name}", color=role.color)
+        embed.add_field(name="ID", value=role.id, inline=True)
+        embed.add_field(name="Tagok száma", value=f"{count} ({count / stats.members:.1%})" if stats.members else count, inline=True)
+        embed.add_field(name="Létrehozva", value=role.created_at.strftime("%Y-%m-%d"), inline=True)
+        embed.add_field(name="Pozíció", value=f"{role.position} / {len(role.guild.roles) - 1}", inline=True)
+        embed.add_field(name="Kiemelt / említhető", value=f"{'igen' if role.hoist else 'nem'} / {'igen' if role.mentionable else 'nem'}", inline=True)
+        if interaction.response.is_done():
+            await interaction.followup.send(embed=embed)
+        else:
+            await interaction.response.send_message(embed=embed)
+
+    @app_commands.command(name="channelinfo", description="Csatorna információk")
+    async def slash_channelinfo(self, interaction: discord.Interaction, channel: Optional[discord.abc.GuildChannel] = None):
+        channel = channel or interaction.channel
+        embed = discord.Embed(title=f"Csatorna: {channel.name}", color=discord.Color.blurple())
+        embed.add_field(name="ID", value=channel.id, inline=True)
+        embed.add_field(name="Típus", value=str(channel.type), inline=True)
+        await interaction.response.send_message(embed=embed)
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(General(bot))
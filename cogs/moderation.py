@@ -0,0 +1,695 @@
+"""Moderációs parancsok (csak modoknak): kitiltás, némítás, tömeges műveletek, figyelmeztetések, szűrő."""
+
+import asyncio
+import re
+from datetime import datetime, timedelta
+from typing import Optional
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+import metrics
+import purge
+from bulk import BulkResult, MAX_TARGETS, chunks, parse_ids, run_bulk
+from core import (
+    SHARDS, apply_timeout, ban_index, cancel_scheduled, is_mod, log_mod_action, member_cache, modlog_pipeline,
+    pretty_time_delta, remove_timeout, schedule_undo, scheduler, set_channel_locked, set_slowmode, warn_store, word_filter,
+)
+from replies import Reply
+from warnstore import WarnRecord, cursor_of, new_warning
+
+
+# Tömeges moderáció (raid esetére)
+
+def can_moderate(actor: discord.Member, target: discord.Member) -> bool:
+    """Szerephierarchia ellenőrzés: a tulajt, magát és a botot nem érinti."""
+    g = actor.guild
+    if target.id in (g.owner_id, actor.id, g.me.id):
+        return False
+    if actor.id != g.owner_id and target.top_role >= actor.top_role:
+        return False
+    return target.top_role < g.me.top_role
+
+MEMBER_QUERY_BATCH = 100  # gateway tag-lekérdezés: legfeljebb 100 ID kérésenként
+
+async def resolve_members(guild: discord.Guild, user_ids: list[int]) -> dict[int, discord.Member]:
+    """A cache-ben nem szereplő ID-k lekérése a gatewayről; aki nem tagja a szervernek, kimarad."""
+    found: dict[int, discord.Member] = {}
+    for batch in chunks(user_ids, MEMBER_QUERY_BATCH):
+        for member in await guild.query_members(user_ids=list(batch), limit=len(batch), cache=False):
+            member_cache.touch(member)
+            found[member.id] = member
+    return found
+
+async def collect_bulk_targets(interaction: discord.Interaction, ids: Optional[str], role: Optional[discord.Role],
+                               joined_within: Optional[int], *, allow_non_members: bool = False) -> tuple[list[int], int]:
+    """Célpontok összegyűjtése ID lista, szerep és / vagy friss csatlakozás alapján.
+
+    Több szűrő esetén mindegyiknek teljesülnie kell. A cache-ben nem szereplő
+    ID-kat a gatewayről oldjuk fel, így a hierarchia ellenőrzés rájuk is
+    vonatkozik; biztosan nem tag ID csak `allow_non_members` esetén (kitiltás
+    ID alapján) marad célpont. Visszaadja a célpontokat és a kihagyottak számát.
+    """
+    g = interaction.guild
+    explicit = parse_ids(ids)
+    if explicit:
+        candidates = explicit
+    elif role or joined_within:
+        candidates = [m.id for m in g.members]
+    else:
+        return [], 0
+    cutoff = discord.utils.utcnow() - timedelta(minutes=joined_within) if joined_within else None
+    resolved: dict[int, discord.Member] = {}
+    unverified: set[int] = set()
+    missing = [user_id for user_id in candidates if g.get_member(user_id) is None]
+    if missing:
+        try:
+            resolved = await resolve_members(g, missing)
+        except asyncio.TimeoutError:
+            unverified = set(missing)  # nem tudjuk, tag-e: inkább kihagyjuk
+    targets: list[int] = []
+    skipped = 0
+    for user_id in candidates:
+        member = g.get_member(user_id) or resolved.get(user_id)
+        if member is None:
+            if allow_non_members and not (role or cutoff) and user_id not in unverified:
+                targets.append(user_id)
+            else:
+                skipped += 1
+            continue
+        if role and role not in member.roles:
+            if explicit:
+                skipped += 1
+            continue
+        if cutoff and (member.joined_at is None or member.joined_at < cutoff):
+            if explicit:
+                skipped += 1
+            continue
+        if not can_moderate(interaction.user, member):
+            skipped += 1
+            continue
+        targets.append(user_id)
+    return targets, skipped
+
+async def run_bulk_command(interaction: discord.Interaction, verb: str, title: str, color: discord.Color,
+                           targets: list[int], skipped: int, action, extra_fields: list[tuple[str, str]]):
+    """Közös keret: egy halasztott válasz, élő haladásjelzés, egy összesített mod-log bejegyzés."""
+    async def progress(result: BulkResult):
+        await edit_progress(interaction, result.progress_text(verb))
+
+    result = await run_bulk(targets, key=lambda t: t, action=action, on_progress=progress)
+    await finish_bulk_command(interaction, verb, title, color, result, skipped, extra_fields)
+
+async def edit_progress(interaction: discord.Interaction, content: str) -> None:
+    try:
+        await interaction.edit_original_response(content=content)
+    except discord.HTTPException:
+        pass  # lejárt token / törölt válasz: a művelet ettől még folytatódik, a mod-log megmarad
+
+async def finish_bulk_command(interaction: discord.Interaction, verb: str, title: str, color: discord.Color,
+                              result: BulkResult, skipped: int, extra_fields: list[tuple[str, str]]):
+    text = (f"✅ {verb} kész: {len(result.done)} sikeres, {len(result.failed)} hiba, "
+            f"{skipped} kihagyva ({result.elapsed:.1f} mp).")
+    if result.failed:
+        text += "\n" + "\n".join(f"• `{uid}`: {err}" for uid, err in result.failed[:5])
+    affected = " ".join(f"<@{uid}>" for uid in result.done) or "Nincs"
+    if len(affected) > 1000:
+        affected = affected[:1000] + "…"
+    # Először a mod-log: a műveletek már lefutottak, a válasz szerkesztése viszont elbukhat.
+    await log_mod_action(interaction.guild, title, color, [
+        ("Érintett felhasználók", f"{len(result.done)} sikeres / {result.total} ({len(result.failed)} hiba)"),
+        ("Felhasználók", affected),
+        *extra_fields,
+        ("Moderátor", f"{interaction.user} ({interaction.user.id})"),
+    ])
+    await edit_progress(interaction, text)
+
+async def _check_bulk_request(interaction: discord.Interaction, permission: str,
+                              ids: Optional[str], role: Optional[discord.Role], joined_within: Optional[int]):
+    if not getattr(interaction.guild.me.guild_permissions, permission):
+        await interaction.response.send_message(f"❌ A botnak nincs `{permission}` joga.", ephemeral=True)
+        return None
+    explicit = parse_ids(ids)
+    if not explicit and (role or joined_within) and not interaction.guild.chunked:
+        # Szerep / időablak szűréshez a teljes taglista kell: igény szerinti chunkolás (halasztott válasszal).
+        await interaction.response.defer(thinking=True)
+        await member_cache.ensure_chunked(interaction.guild)
+    elif any(interaction.guild.get_member(user_id) is None for user_id in explicit):
+        # A nem cachelt ID-k feloldása gateway kérés: halasztott válasszal.
+        await interaction.response.defer(thinking=True)
+    targets, skipped = await collect_bulk_targets(interaction, ids, role, joined_within,
+                                                  allow_non_members=permission == "ban_members")
+    error = None
+    if not targets:
+        error = "Nincs megfelelő célpont (adj meg ID-kat, szerepet vagy időablakot)."
+    elif len(targets) > MAX_TARGETS:
+        error = f"❌ Legfeljebb {MAX_TARGETS} célpont adható meg egyszerre ({len(targets)})."
+    if error:
+        if interaction.response.is_done():
+            await interaction.edit_original_response(content=error)
+        else:
+            await interaction.response.send_message(error, ephemeral=True)
+        return None
+    if not interaction.response.is_done():
+        await interaction.response.defer(thinking=True)
+    return targets, skipped
+
+BULK_OPTIONS = dict(
+    ids="Felhasználó ID-k vagy említések szóközzel / vesszővel elválasztva",
+    role="Ezzel a szereppel rendelkező tagok",
+    joined_within="Az elmúlt N percben csatlakozott tagok",
+)
+
+WARNINGS_PAGE_SIZE = 10
+
+def warnings_embed(guild: discord.Guild, member: Optional[discord.Member], items: list[WarnRecord],
+                   total: int, page: int) -> discord.Embed:
+    title = f"Figyelmeztetések — {member}" if member else f"Legutóbbi figyelmeztetések — {guild.name}"
+    embed = discord.Embed(title=title, color=discord.Color.orange())
+    start = (page - 1) * WARNINGS_PAGE_SIZE
+    for i, w in enumerate(items, start=start + 1):
+        mod = guild.get_member(w.moderator_id)
+        ts = datetime.utcfromtimestamp(w.created_at).strftime("%Y-%m-%d %H:%M:%S")
+        who = "" if member else f"<@{w.user_id}> — "
+        embed.add_field(name=f"{i}. {mod or w.moderator_id}", value=f"{who}{w.reason}\n{ts}", inline=False)
+    pages = max(1, -(-total // WARNINGS_PAGE_SIZE))
+    embed.set_footer(text=f"Összesen: {total} — {page}/{pages}. oldal")
+    return embed
+
+class WarningsView(discord.ui.View):
+    """Lapozás a figyelmeztetések között (keyset kurzorokkal, oldalanként egy lekérdezés)."""
+
+    def __init__(self, author_id: int, guild: discord.Guild, member: Optional[discord.Member],
+                 first: list[WarnRecord], total: int):
+        super().__init__(timeout=180)
+        self.author_id = author_id
+        self.guild = guild
+        self.member = member
+        self.total = total
+        self.items_: list[WarnRecord] = first
+        self.cursors: list[Optional[tuple[float, int]]] = [None]
+        # cursors[i]: az i. (0-tól számolt) oldal lekérdezésének `before` kurzora
+        self._update_buttons()
+
+    @property
+    def page(self) -> int:
+        return len(self.cursors)
+
+    def _update_buttons(self):
+        self.prev_page.disabled = self.page <= 1
+        self.next_page.disabled = self.page * WARNINGS_PAGE_SIZE >= self.total
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        return interaction.user.id == self.author_id
+
+    async def _show(self, interaction: discord.Interaction):
+        user_id = self.member.id if self.member else None
+        self.items_ = await warn_store.page(self.guild.id, user_id, before=self.cursors[-1], limit=WARNINGS_PAGE_SIZE)
+        self._update_buttons()
+        embed = warnings_embed(self.guild, self.member, self.items_, self.total, self.page)
+        await interaction.response.edit_message(embed=embed, view=self)
+
+    @discord.ui.button(label="◀", style=discord.ButtonStyle.secondary)
+    async def prev_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.cursors.pop()
+        await self._show(interaction)
+
+    @discord.ui.button(label="▶", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.cursors.append(cursor_of(self.items_[-1]))
+        await self._show(interaction)
+
+class Moderation(commands.Cog):
+    """Moderációs parancsok."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @app_commands.command(name="kick", description="Kirúg egy felhasználót")
+    @is_mod()
+    async def slash_kick(self, interaction: discord.Interaction, member: discord.Member, reason: Optional[str] = "Nincs megadva"):
+        reply = Reply(interaction)
+        if not interaction.guild.me.guild_permissions.kick_members:
+            await reply.send("❌ A botnak nincs kick joga.", ephemeral=True)
+            return
+        try:
+            await member.kick(reason=reason)
+            await reply.send(f"✅ {member} kirúgva. Ok: {reason}")
+            await log_mod_action(interaction.guild, "Felhasználó kirúgva", discord.Color.orange(), [
+                ("Felhasználó", f"{member} ({member.id})"),
+                ("Moderátor", f"{interaction.user} ({interaction.user.id})"),
+                ("Ok", reason),
+            ])
+        except Exception as e:
+            await reply.send(f"❌ Hiba a kirúgás közben: {e}", ephemeral=True)
+
+    @app_commands.command(name="ban", description="Kitilt egy felhasználót (opcionálisan ideiglenesen)")
+    @app_commands.describe(minutes="Ideiglenes kitiltás hossza percben (üresen: végleges)")
+    @is_mod()
+    async def slash_ban(self, interaction: discord.Interaction, member: discord.Member, reason: Optional[str] = "Nincs megadva",
+                        minutes: Optional[app_commands.Range[int, 1, 525600]] = None):
+        reply = Reply(interaction)
+        if not interaction.guild.me.guild_permissions.ban_members:
+            await reply.send("❌ A botnak nincs ban joga.", ephemeral=True)
+            return
+        try:
+            await member.ban(reason=reason, delete_message_days=0)
+            duration = f" ({pretty_time_delta(timedelta(minutes=minutes))})" if minutes else ""
+            await reply.send(f"✅ {member} kitiltva{duration}. Ok: {reason}")
+            if minutes:
+                await schedule_undo("unban", minutes, {"guild_id": interaction.guild.id, "user_id": member.id})
+            await log_mod_action(interaction.guild, "Felhasználó kitiltva", discord.Color.red(), [
+                ("Felhasználó", f"{member} ({member.id})"),
+                ("Moderátor", f"{interaction.user} ({interaction.user.id})"),
+                ("Ok", reason),
+                ("Időtartam", pretty_time_delta(timedelta(minutes=minutes)) if minutes else "Végleges"),
+            ])
+        except Exception as e:
+            await reply.send(f"❌ Hiba a kitiltás közben: {e}", ephemeral=True)
+
+    @app_commands.command(name="unban", description="Feloldja egy felhasználó tiltását")
+    @app_commands.describe(user_identifier="Név, név#1234 vagy ID (gépelés közben keres a tiltólistán)")
+    @is_mod()
+    async def slash_unban(self, interaction: discord.Interaction, user_identifier: str):
+        reply = Reply(interaction)
+        if not interaction.guild.me.guild_permissions.ban_members:
+            await reply.send("❌ A botnak nincs unban joga.", ephemeral=True)
+            return
+        try:
+            user_identifier = user_identifier.strip()
+            if user_identifier.isdigit():
+                # ID-nál nem kell a lista: a Discord 404-gyel jelzi, ha nincs tiltva.
+                entry = None
+                bans = ban_index.peek(interaction.guild.id)
+                if bans is not None:
+                    found = bans.lookup(user_identifier)
+                    entry = found[0] if found else None
+                target = discord.Object(id=int(user_identifier))
+                label = str(entry) if entry else user_identifier
+            else:
+                if ban_index.peek(interaction.guild.id) is None:
+                    await reply.defer()  # első betöltés: a teljes tiltólista lapozása
+                found = (await ban_index.get(interaction.guild)).lookup(user_identifier)
+                if len(found) > 1:
+                    names = ", ".join(str(e) for e in found[:10])
+                    await reply.send(f"Több találat, add meg az ID-t: {names}", ephemeral=True)
+                    return
+                if not found:
+                    await reply.send("❌ Nem található a tiltott felhasználók között.", ephemeral=True)
+                    return
+                target, label = discord.Object(id=found[0].user_id), str(found[0])
+            try:
+                await interaction.guild.unban(target)
+            except discord.NotFound:
+                await reply.send("❌ Nem található a tiltott felhasználók között.", ephemeral=True)
+                return
+            await cancel_scheduled("unban", guild_id=interaction.guild.id, user_id=target.id)
+            await reply.send(f"✅ {label} tiltását feloldottam.")
+            await log_mod_action(interaction.guild, "Tiltás feloldva", discord.Color.green(), [
+                ("Felhasználó", label),
+                ("Moderátor", f"{interaction.user} ({interaction.user.id})"),
+            ])
+        except Exception as e:
+            await reply.send(f"❌ Hiba az unban során: {e}", ephemeral=True)
+
+    @slash_unban.autocomplete("user_identifier")
+    async def unban_autocomplete(self, interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+        if interaction.guild is None or not interaction.permissions.ban_members:
+            return []
+        bans = ban_index.peek(interaction.guild.id)
+        if bans is None:
+            # Az autocomplete-re 3 mp alatt válaszolni kell: a betöltés a háttérben fut, addig nincs javaslat.
+            ban_index.warm(interaction.guild)
+            return []
+        return [app_commands.Choice(name=str(e)[:100], value=str(e.user_id)) for e in bans.search(current)]
+
+    @app_commands.command(name="massban", description="Több felhasználó kitiltása egyszerre")
+    @app_commands.describe(**BULK_OPTIONS)
+    @is_mod()
+    async def slash_massban(self, interaction: discord.Interaction, ids: Optional[str] = None, role: Optional[discord.Role] = None,
+                            joined_within: Optional[app_commands.Range[int, 1, 1440]] = None, reason: Optional[str] = "Nincs megadva"):
+        checked = await _check_bulk_request(interaction, "ban_members", ids, role, joined_within)
+        if checked is None:
+            return
+        targets, skipped = checked
+        g = interaction.guild
+        fields = [("Ok", reason)]
+        if g.me.guild_permissions.manage_guild:
+            # Bulk ban végpont: 200 felhasználó / kérés, egyetlen rate limit bucket.
+            result = BulkResult(total=len(targets))
+            for chunk in chunks(targets, 200):
+                try:
+                    res = await g.bulk_ban([discord.Object(id=uid) for uid in chunk], reason=reason, delete_message_seconds=0)
+                    result.done.extend(u.id for u in res.banned)
+                    result.failed.extend((u.id, "sikertelen") for u in res.failed)
+                except discord.HTTPException as e:
+                    result.failed.extend((uid, str(e)) for uid in chunk)
+                await edit_progress(interaction, result.progress_text("Kitiltás"))
+            await finish_bulk_command(interaction, "Kitiltás", "Tömeges kitiltás", discord.Color.red(), result, skipped, fields)
+            return
+
+        async def ban(user_id: int):
+            await g.ban(discord.Object(id=user_id), reason=reason, delete_message_seconds=0)
+
+        await run_bulk_command(interaction, "Kitiltás", "Tömeges kitiltás", discord.Color.red(), targets, skipped, ban, fields)
+
+    @app_commands.command(name="masskick", description="Több felhasználó kirúgása egyszerre")
+    @app_commands.describe(**BULK_OPTIONS)
+    @is_mod()
+    async def slash_masskick(self, interaction: discord.Interaction, ids: Optional[str] = None, role: Optional[discord.Role] = None,
+                             joined_within: Optional[app_commands.Range[int, 1, 1440]] = None, reason: Optional[str] = "Nincs megadva"):
+        checked = await _check_bulk_request(interaction, "kick_members", ids, role, joined_within)
+        if checked is None:
+            return
+        targets, skipped = checked
+        g = interaction.guild
+
+        async def kick(user_id: int):
+            await g.kick(discord.Object(id=user_id), reason=reason)
+
+        await run_bulk_command(interaction, "Kirúgás", "Tömeges kirúgás", discord.Color.orange(), targets, skipped, kick,
+                               [("Ok", reason)])
+
+    @app_commands.command(name="massmute", description="Több felhasználó némítása egyszerre")
+    @app_commands.describe(**BULK_OPTIONS)
+    @is_mod()
+    async def slash_massmute(self, interaction: discord.Interaction, ids: Optional[str] = None, role: Optional[discord.Role] = None,
+                             joined_within: Optional[app_commands.Range[int, 1, 1440]] = None, minutes: app_commands.Range[int, 1, 40320] = 10,
+                             reason: Optional[str] = "Nincs megadva"):
+        checked = await _check_bulk_request(interaction, "moderate_members", ids, role, joined_within)
+        if checked is None:
+            return
+        targets, skipped = checked
+        g = interaction.guild
+
+        async def mute(user_id: int):
+            member = g.get_member(user_id) or await g.fetch_member(user_id)
+            await member.timeout(timedelta(minutes=minutes), reason=reason)
+
+        await run_bulk_command(interaction, "Némítás", "Tömeges némítás", discord.Color.orange(), targets, skipped, mute,
+                               [("Idő", f"{minutes} perc"), ("Ok", reason)])
+
+    @app_commands.command(name="purge", description="Üzenetek törlése (szűrőkkel)")
+    @app_commands.describe(
+        amount="Legfeljebb ennyi (szűrőnek megfelelő) üzenet törlése",
+        user="Csak ettől a felhasználótól",
+        regex="Csak a mintára illeszkedő tartalmú üzenetek",
+        bots_only="Csak botok üzenetei",
+        has_links="Csak linket tartalmazó üzenetek",
+        has_attachments="Csak csatolmányt tartalmazó üzenetek",
+        before="Csak ennél az üzenet ID-nál régebbiek",
+        after="Csak ennél az üzenet ID-nál újabbak",
+    )
+    @is_mod()
+    async def slash_purge(self, interaction: discord.Interaction, amount: app_commands.Range[int, 1, 5000],
+                          user: Optional[discord.User] = None, regex: Optional[str] = None,
+                          bots_only: bool = False, has_links: bool = False, has_attachments: bool = False,
+                          before: Optional[str] = None, after: Optional[str] = None):
+        if not interaction.guild.me.guild_permissions.manage_messages:
+            await interaction.response.send_message("❌ A bot nem tud üzeneteket törölni.", ephemeral=True)
+            return
+        if any(v is not None and not v.isdigit() for v in (before, after)):
+            await interaction.response.send_message("❌ A before / after értéke üzenet ID legyen.", ephemeral=True)
+            return
+        try:
+            pattern = re.compile(regex[:200], re.IGNORECASE) if regex else None
+        except re.error as e:
+            await interaction.response.send_message(f"❌ Hibás regex: {e}", ephemeral=True)
+            return
+        if purge.is_running(interaction.channel.id):
+            await interaction.response.send_message("⏳ Ebben a csatornában már fut egy törlés.", ephemeral=True)
+            return
+        flt = purge.PurgeFilter(
+            user_id=user.id if user else None,
+            pattern=pattern,
+            bots_only=bots_only,
+            has_links=has_links,
+            has_attachments=has_attachments,
+        )
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
+        async def progress(stats: purge.PurgeStats):
+            try:
+                await interaction.edit_original_response(content=stats.progress_text())
+            except discord.HTTPException:
+                pass  # a régi üzenetek egyenként törlése túlnyúlhat a 15 perces interakció tokenen
+
+        stats = await purge.purge_channel(
+            interaction.channel, amount, flt,
+            before=int(before) if before else None,
+            after=int(after) if after else None,
+            on_progress=progress,
+        )
+        # Először a mod-log: a válasz szerkesztése hosszú törlés után már nem biztos, hogy sikerül.
+        await log_mod_action(interaction.guild, "Purge végrehajtva", discord.Color.dark_blue(), [
+            ("Csatorna", interaction.channel.mention),
+            ("Törölt üzenetek", f"{stats.deleted} (bulk: {stats.bulk_deleted}, egyenként: {stats.single_deleted})"),
+            ("Szűrők", flt.describe()),
+            ("Moderátor", str(interaction.user)),
+        ])
+        try:
+            await interaction.edit_original_response(content=(
+                f"✅ Törölve: {stats.deleted} üzenet ({stats.scanned} átnézve, {stats.failed} hiba) — "
+                f"{stats.elapsed:.1f} mp, {stats.rate:.1f} üzenet/mp."
+            ))
+        except discord.HTTPException:
+            pass
+
+    @app_commands.command(name="mute", description="Némít egy felhasználót adott ideig")
+    @is_mod()
+    async def slash_mute(self, interaction: discord.Interaction, member: discord.Member, minutes: app_commands.Range[int, 1, 525600] = 10):
+        reply = Reply(interaction)
+        if not interaction.guild.me.guild_permissions.moderate_members:
+            await reply.send("❌ A botnak nincs `Moderate Members` joga.", ephemeral=True)
+            return
+        try:
+            await apply_timeout(member, minutes)
+            member_cache.touch(member)
+            await reply.send(f"🔇 {member.mention} némítva {minutes} percig.")
+            await log_mod_action(interaction.guild, "Felhasználó némítva", discord.Color.orange(), [
+                ("Felhasználó", f"{member} ({member.id})"),
+                ("Idő", f"{minutes} perc"),
+                ("Moderátor", str(interaction.user)),
+            ])
+        except Exception as e:
+            await reply.send(f"❌ Hiba a némítás során: {e}", ephemeral=True)
+
+    @app_commands.command(name="unmute", description="Némítás feloldása")
+    @is_mod()
+    async def slash_unmute(self, interaction: discord.Interaction, member: discord.Member):
+        reply = Reply(interaction)
+        if not interaction.guild.me.guild_permissions.moderate_members:
+            await reply.send("❌ A botnak nincs `Moderate Members` joga.", ephemeral=True)
+            return
+        try:
+            await remove_timeout(member)
+            member_cache.touch(member)
+            await reply.send(f"🔊 {member.mention} némítását feloldottam.")
+            await log_mod_action(interaction.guild, "Némítás feloldva", discord.Color.green(), [
+                ("Felhasználó", f"{member} ({member.id})"),
+                ("Moderátor", str(interaction.user)),
+            ])
+        except Exception as e:
+            await reply.send(f"❌ Hiba: {e}", ephemeral=True)
+
+    @app_commands.command(name="lock", description="Zárolja az aktuális csatornát")
+    @app_commands.describe(minutes="Ennyi perc után automatikus feloldás (üresen: kézi feloldásig)")
+    @is_mod()
+    async def slash_lock(self, interaction: discord.Interaction, channel: Optional[discord.TextChannel] = None,
+                         minutes: Optional[app_commands.Range[int, 1, 10080]] = None):
+        reply = Reply(interaction)
+        channel = channel or interaction.channel
+        try:
+            await set_channel_locked(channel, True)
+            if minutes:
+                await schedule_undo("unlock", minutes, {"guild_id": interaction.guild.id, "channel_id": channel.id})
+            else:
+                await cancel_scheduled("unlock", channel_id=channel.id)
+            suffix = f" ({pretty_time_delta(timedelta(minutes=minutes))})" if minutes else ""
+            await reply.send(f"🔒 {channel.mention} zárolva{suffix}.")
+            await log_mod_action(interaction.guild, "Csatorna zárolva", discord.Color.dark_blue(), [
+                ("Csatorna", channel.mention),
+                ("Időtartam", pretty_time_delta(timedelta(minutes=minutes)) if minutes else "Kézi feloldásig"),
+                ("Moderátor", str(interaction.user)),
+            ])
+        except Exception as e:
+            await reply.send(f"❌ Hiba: {e}", ephemeral=True)
+
+    @app_commands.command(name="unlock", description="Csatorna zárolás feloldása")
+    @is_mod()
+    async def slash_unlock(self, interaction: discord.Interaction, channel: Optional[discord.TextChannel] = None):
+        reply = Reply(interaction)
+        channel = channel or interaction.channel
+        try:
+            await set_channel_locked(channel, False)
+            await cancel_scheduled("unlock", channel_id=channel.id)
+            await reply.send(f"🔓 {channel.mention} feloldva.")
+            await log_mod_action(interaction.guild, "Csatorna feloldva", discord.Color.green(), [
+                ("Csatorna", channel.mention),
+                ("Moderátor", str(interaction.user)),
+            ])
+        except Exception as e:
+            await reply.send(f"❌ Hiba: {e}", ephemeral=True)
+
+    @app_commands.command(name="slowmode", description="Csatorna slowmode beállítása")
+    @app_commands.describe(minutes="Ennyi perc után automatikus kikapcsolás (üresen: tartós)")
+    @is_mod()
+    async def slash_slowmode(self, interaction: discord.Interaction, seconds: app_commands.Range[int, 0, 21600] = 0,
+                             minutes: Optional[app_commands.Range[int, 1, 10080]] = None):
+        reply = Reply(interaction, ephemeral=True)
+        try:
+            await set_slowmode(interaction.channel, seconds)
+            if minutes and seconds:
+                await schedule_undo("slowmode_reset", minutes, {"guild_id": interaction.guild.id, "channel_id": interaction.channel.id})
+            else:
+                await cancel_scheduled("slowmode_reset", channel_id=interaction.channel.id)
+            suffix = f", {pretty_time_delta(timedelta(minutes=minutes))} múlva kikapcsol" if minutes and seconds else ""
+            await reply.send(f"⏱️ Slowmode beállítva: {seconds} mp{suffix}", ephemeral=True)
+            await log_mod_action(interaction.guild, "Slowmode módosítva", discord.Color.dark_gold(), [
+                ("Csatorna", interaction.channel.mention),
+                ("Slowmode", f"{seconds} mp{suffix}"),
+                ("Moderátor", str(interaction.user)),
+            ])
+        except Exception as e:
+            await reply.send(f"❌ Hiba: {e}", ephemeral=True)
+
+    @app_commands.command(name="nick", description="Felhasználó becenevét módosítja")
+    @is_mod()
+    async def slash_nick(self, interaction: discord.Interaction, member: discord.Member, nick: Optional[str] = None):
+        reply = Reply(interaction)
+        try:
+            await member.edit(nick=nick)
+            member_cache.touch(member)
+            await reply.send(f"✅ {member} beceneve megváltoztatva.")
+            await log_mod_action(interaction.guild, "Nick változtatva", discord.Color.blurple(), [
+                ("Felhasználó", f"{member} ({member.id})"),
+                ("Új nick", nick or "Törölve"),
+                ("Moderátor", str(interaction.user)),
+            ])
+        except Exception as e:
+            await reply.send(f"❌ Hiba: {e}", ephemeral=True)
+
+    @app_commands.command(name="clear_reactions", description="Egy üzenet reakcióinak törlése")
+    @is_mod()
+    async def slash_clear_reactions(self, interaction: discord.Interaction, message_id: int):
+        reply = Reply(interaction, ephemeral=True)
+        try:
+            msg = await interaction.channel.fetch_message(message_id)
+            await msg.clear_reactions()
+            await reply.send("✅ Reakciók törölve.", ephemeral=True)
+            await log_mod_action(interaction.guild, "Reakciók törölve", discord.Color.dark_blue(), [
+                ("Üzenet", f"[Ugrás az üzenetre]({msg.jump_url})"),
+                ("Moderátor", str(interaction.user)),
+            ])
+        except Exception as e:
+            await reply.send(f"❌ Hiba: {e}", ephemeral=True)
+
+    @app_commands.command(name="warn", description="Figyelmeztet egy felhasználót")
+    @is_mod()
+    async def slash_warn(self, interaction: discord.Interaction, member: discord.Member, reason: Optional[str] = "Nincs megadva"):
+        reply = Reply(interaction)
+        g = interaction.guild
+        if g is None:
+            await reply.send("Csak szerverben használható.", ephemeral=True)
+            return
+        await warn_store.add(new_warning(g.id, member.id, interaction.user.id, reason))
+        member_cache.touch(member)
+        await reply.send(f"⚠️ {member.mention} figyelmeztetve. Ok: {reason}")
+        await log_mod_action(g, "Figyelmeztetés", discord.Color.orange(), [
+            ("Felhasználó", f"{member} ({member.id})"),
+            ("Ok", reason),
+            ("Moderátor", str(interaction.user)),
+        ])
+
+    @app_commands.command(name="warnings", description="Figyelmeztetések (egy felhasználóé vagy a szerver legutóbbiak)")
+    @is_mod()
+    async def slash_warnings(self, interaction: discord.Interaction, member: Optional[discord.Member] = None):
+        g = interaction.guild
+        if g is None:
+            await interaction.response.send_message("Csak szerveren használható.", ephemeral=True)
+            return
+        user_id = member.id if member else None
+        total = await warn_store.count(g.id, user_id)
+        if not total:
+            text = (f"{member} még nem kapott figyelmeztetést." if member
+                    else "Ezen a szerveren még nincs figyelmeztetés.")
+            await interaction.response.send_message(text, ephemeral=True)
+            return
+        first = await warn_store.page(g.id, user_id, limit=WARNINGS_PAGE_SIZE)
+        view = WarningsView(interaction.user.id, g, member, first, total)
+        await interaction.response.send_message(embed=warnings_embed(g, member, first, total, 1), view=view)
+
+    filter_group = app_commands.Group(name="filter", description="Tiltott szavak / kifejezések kezelése")
+
+    @filter_group.command(name="add", description="Kifejezések hozzáadása (vesszővel elválasztva)")
+    @app_commands.describe(terms="Vesszővel elválasztott kifejezések", partial="Szórészletre is illeszkedjen")
+    @is_mod()
+    async def filter_add(self, interaction: discord.Interaction, terms: str, partial: bool = False):
+        added = await word_filter.add(interaction.guild.id, terms.split(","), partial)
+        if not added:
+            await interaction.response.send_message("❌ Nem lett új kifejezés felvéve.", ephemeral=True)
+            return
+        await interaction.response.send_message(f"✅ Felvéve: {len(added)} kifejezés.", ephemeral=True)
+        await log_mod_action(interaction.guild, "Szűrőlista bővítve", discord.Color.dark_gold(), [
+            ("Kifejezések", f"{len(added)} db" + (" (részszó)" if partial else "")),
+            ("Moderátor", str(interaction.user)),
+        ])
+
+    @filter_group.command(name="remove", description="Kifejezés törlése a listáról")
+    @is_mod()
+    async def filter_remove(self, interaction: discord.Interaction, term: str):
+        if not await word_filter.remove(interaction.guild.id, term):
+            await interaction.response.send_message("❌ Nincs ilyen kifejezés a listán.", ephemeral=True)
+            return
+        await interaction.response.send_message("✅ Kifejezés törölve.", ephemeral=True)
+        await log_mod_action(interaction.guild, "Szűrőlista szűkítve", discord.Color.dark_gold(), [
+            ("Moderátor", str(interaction.user)),
+        ])
+
+    @filter_group.command(name="list", description="A tiltott kifejezések listája")
+    @is_mod()
+    async def filter_list(self, interaction: discord.Interaction):
+        terms = word_filter.terms(interaction.guild.id)
+        if not terms:
+            await interaction.response.send_message("A szűrőlista üres.", ephemeral=True)
+            return
+        text = ", ".join(f"`{t}`" + ("*" if partial else "") for t, partial in terms)
+        if len(text) > 1900:
+            text = text[:1900] + "…"
+        await interaction.response.send_message(f"Tiltott kifejezések ({len(terms)}, *: részszó):\n{text}", ephemeral=True)
+
+    @app_commands.command(name="stats", description="Parancsok teljesítménye (késleltetés, hibák, REST hívások)")
+    @is_mod()
+    async def slash_stats(self, interaction: discord.Interaction):
+        registry = metrics.registry
+        ranked = sorted(registry.commands.items(), key=lambda kv: kv[1].latency.quantile(0.99), reverse=True)
+        lines = []
+        for name, st in ranked[:15]:
+            rest = st.rest_calls / st.calls if st.calls else 0
+            line = (f"`/{name}` — {st.calls} hívás, p50 {st.latency.quantile(0.5) * 1000:.0f} ms, "
+                    f"p99 {st.latency.quantile(0.99) * 1000:.0f} ms, első válasz p99 {st.ttfr.quantile(0.99) * 1000:.0f} ms, "
+                    f"{rest:.1f} REST/hívás")
+            if st.errors:
+                line += f", ❌ {st.errors} hiba"
+            if st.late:
+                line += f", ⏰ {st.late} késő válasz"
+            if st.auto_defers:
+                line += f", ⌛ {st.auto_defers} automatikus halasztás"
+            if st.throttled:
+                line += f", 🚦 {st.throttled} korlátozva"
+            if st.ratelimit_waits:
+                line += f", 🐢 {st.ratelimit_waits} rate limit ({st.ratelimit_seconds:.1f} mp)"
+            lines.append(line)
+        embed = discord.Embed(title="Parancs statisztikák", description="\n".join(lines) or "Még nem futott parancs.",
+                              color=discord.Color.blurple())
+        ml = modlog_pipeline.metrics
+        embed.add_field(name="REST hívások", value=f"{registry.rest_calls} (rate limit: {registry.ratelimit_seconds:.1f} mp)", inline=True)
+        embed.add_field(name="Mod-log", value=f"{ml.sent_events} esemény / {ml.sent_messages} üzenet, sor: {modlog_pipeline.queue_depth()}, eldobva: {ml.dropped}", inline=True)
+        embed.add_field(name="Időzített feladatok", value=scheduler.pending(), inline=True)
+        if metrics.METRICS_PORT:
+            embed.set_footer(text=f"Prometheus: http://{metrics.METRICS_HOST}:{metrics.METRICS_PORT + SHARDS.cluster_id}/metrics")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(Moderation(bot))
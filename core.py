@@ -0,0 +1,527 @@
+"""A bot magja: konfiguráció, állapot, események, közös moderációs műveletek.
+
+Ez a modul egyszer töltődik be és sosem újratöltött; a parancsok a `cogs/`
+bővítményekben vannak, amelyeket a `/reload` a gateway kapcsolat, a cache-ek
+és az itt tárolt állapot megtartásával cserél le.
+"""
+
+import os
+import time
+
+PROCESS_STARTED = time.perf_counter()
+import asyncio
+import logging
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+import membercache
+import metrics
+import modlog
+import ratelimit
+import replies
+import safemath
+import treesync
+from cluster import config_from_env, publish_status, STATUS_INTERVAL
+from modlog import ModLogEvent, ModLogPipeline
+from scheduler import Job, Scheduler
+from storage import Database
+from activity import ActivityTracker
+from automod import Automod, Verdict
+from banindex import BanIndex
+from guildstats import StatsIndex
+from polls import PollManager
+from warnstore import create_backend, new_warning
+from wordfilter import WordFilter
+
+
+log = logging.getLogger(__name__)
+
+# ----------------- Konfiguráció -----------------
+
+INTENTS = discord.Intents.default()
+INTENTS.message_content = True
+INTENTS.members = True
+
+MEMBER_CACHE_POLICY = membercache.policy_from_env()
+# full (alapértelmezett) / recent / minimal — lásd membercache.py
+
+SHARDS = config_from_env()
+# SHARD_COUNT / SHARD_IDS / CLUSTER_ID: a cluster.py launcher állítja be; nélküle egyetlen folyamat fut
+
+class ModBot(commands.AutoShardedBot if SHARDS.sharded else commands.Bot):
+    async def setup_hook(self):
+        await warn_store.start()
+        await word_filter.start()
+        await scheduler.start(self.wait_until_ready, owns=lambda job: SHARDS.owns_guild(job.payload.get("guild_id")))
+        await poll_manager.start(owns=SHARDS.owns_guild)
+        await activity_tracker.start(owns=SHARDS.owns_guild)
+        await load_extensions()
+        if SHARDS.cluster_id == 0:
+            # A parancsfa alkalmazásszintű: elég egy clusterből szinkronizálni.
+            await sync_command_tree()
+        if SHARDS.sharded:
+            asyncio.create_task(publish_cluster_status())
+        if MEMBER_CACHE_POLICY != "full":
+            asyncio.create_task(member_cache.trim_loop(self))
+        metrics.registry.install(self)
+        metrics.registry.gauge("bot_modlog_queue_depth", "Kiküldésre váró mod-log események", modlog_pipeline.queue_depth)
+        metrics.registry.gauge("bot_scheduled_jobs", "Függő időzített feladatok", scheduler.pending)
+        metrics.registry.gauge("bot_cached_members", "Cachelt tagok", lambda: member_cache.cached_members(self))
+        metrics.registry.gauge("bot_activity_pending_rows", "Mentésre váró aktivitás sorok", activity_tracker.pending)
+        if metrics.METRICS_PORT:
+            # Clusterenként külön port, hogy egy gépen több worker is fusson.
+            self.metrics_runner = await metrics.registry.serve(port=metrics.METRICS_PORT + SHARDS.cluster_id)
+
+    async def close(self):
+        # Leállás előtt kiküldjük a sorban maradt mod-log eseményeket és figyelmeztetéseket.
+        await scheduler.close()
+        if getattr(self, "metrics_runner", None):
+            await self.metrics_runner.cleanup()
+        safemath.shutdown()
+        await poll_manager.close()
+        await activity_tracker.close()
+        await modlog_pipeline.close()
+        await warn_store.close()
+        db.close()
+        await super().close()
+
+shard_kwargs = dict(shard_count=SHARDS.shard_count, shard_ids=SHARDS.shard_ids) if SHARDS.sharded else {}
+bot = ModBot(command_prefix="/", intents=INTENTS, activity=discord.Game(name="Grand Theft Auto VI"),
+             tree_cls=ratelimit.ThrottledTree, **shard_kwargs, **membercache.client_kwargs(MEMBER_CACHE_POLICY, INTENTS))
+# Slash parancsok a bot.tree használatával
+
+DEV_GUILD_ID = os.environ.get("DEV_GUILD_ID")
+# Fejlesztéshez: a parancsok csak erre a szerverre szinkronizálódnak (azonnal frissülnek)
+FORCE_TREE_SYNC = os.environ.get("FORCE_TREE_SYNC") == "1"
+
+EXTENSIONS = [f"cogs.{name.strip()}" for name in os.environ.get("EXTENSIONS", "general,moderation,fun").split(",") if name.strip()]
+# A parancsok a cogs/ bővítményekben vannak; /reload ezeket tölti újra a gateway kapcsolat bontása nélkül
+
+# ----------------- Állapot -----------------
+
+start_time = datetime.utcnow()
+modlog_pipeline = ModLogPipeline(bot)
+db = Database()
+warn_store = create_backend(db)
+# Figyelmeztetések: SQLite (alapértelmezett) vagy memória, lásd WARN_BACKEND
+word_filter = WordFilter(db)
+scheduler = Scheduler(db, is_permanent=lambda exc: isinstance(exc, discord.NotFound))
+# Időzített feladatok; hibánál újrapróbálás, kivéve ha a cél (tag, csatorna, üzenet) már nem létezik
+automod = Automod()
+ban_index = BanIndex()
+poll_manager = PollManager(db)
+activity_tracker = ActivityTracker(db)
+# Üzenetszám és XP: memóriában összesítve, kötegelve mentve (lásd activity.py)
+guild_stats = StatsIndex(max_age=None if MEMBER_CACHE_POLICY == "full" else membercache.CHUNK_GRACE)
+# Részleges tag cache-nél a nem cachelt tagok szerepváltozása nem jut el hozzánk: időnként újraépül
+member_cache = membercache.MemberCache(MEMBER_CACHE_POLICY)
+startup_info: Optional[membercache.StartupReport] = None
+AUTOMOD_ENABLED = os.environ.get("AUTOMOD", "1") != "0"
+
+# ----------------- Segédfüggvények -----------------
+
+def is_mod():
+    """Decorator: csak moderátorok / megfelelő joggal rendelkező felhasználók használhatják."""
+    def predicate(interaction: discord.Interaction) -> bool:
+        if not interaction.guild:
+            return False
+        perms = interaction.user.guild_permissions
+        return (
+            perms.administrator
+            or perms.kick_members
+            or perms.ban_members
+            or perms.manage_messages
+            or perms.moderate_members
+        )
+    return app_commands.check(predicate)
+
+def is_admin():
+    """Decorator: csak adminisztrátor vagy a bot tulajdonosa használhatja."""
+    async def predicate(interaction: discord.Interaction) -> bool:
+        if interaction.guild and interaction.user.guild_permissions.administrator:
+            return True
+        return await interaction.client.is_owner(interaction.user)
+    return app_commands.check(predicate)
+
+async def log_mod_action(guild: discord.Guild, title: str, color: discord.Color, fields: list[tuple[str, str]]):
+    """Moderációs esemény sorba állítása a kötegelt mod-log íróhoz."""
+    await modlog_pipeline.log(ModLogEvent(guild.id, title, color, fields))
+
+# Moderációs műveletek (a parancsok és az automod közösen használja)
+
+MAX_TIMEOUT = timedelta(days=28) - timedelta(minutes=1)
+
+async def apply_timeout(member: discord.Member, minutes: int, reason: Optional[str] = None):
+    """Némítás; a Discord 28 napos timeout korlátját ütemezett meghosszabbítással kerüli meg."""
+    now = discord.utils.utcnow()
+    until = now + timedelta(minutes=minutes)
+    await member.edit(timed_out_until=min(until, now + MAX_TIMEOUT), reason=reason)
+    await cancel_scheduled("mute", guild_id=member.guild.id, user_id=member.id)
+    await scheduler.schedule("mute", min(until, now + MAX_TIMEOUT).timestamp(), {
+        "guild_id": member.guild.id, "user_id": member.id, "until": until.timestamp(),
+    })
+
+async def remove_timeout(member: discord.Member, reason: Optional[str] = None):
+    await member.edit(timed_out_until=None, reason=reason)
+    await cancel_scheduled("mute", guild_id=member.guild.id, user_id=member.id)
+
+async def set_channel_locked(channel: discord.TextChannel, locked: bool, reason: Optional[str] = None):
+    await channel.set_permissions(channel.guild.default_role, send_messages=not locked, reason=reason)
+
+async def set_slowmode(channel: discord.TextChannel, seconds: int, reason: Optional[str] = None):
+    await channel.edit(slowmode_delay=seconds, reason=reason)
+
+async def sync_command_tree() -> Optional[bool]:
+    """Parancsfa szinkronizálás, csak ha a kanonikus payload hash-e változott. None: hiba."""
+    guild = discord.Object(id=int(DEV_GUILD_ID)) if DEV_GUILD_ID else None
+    if guild:
+        bot.tree.clear_commands(guild=guild)  # újratöltés után a törölt parancsok se maradjanak meg
+        bot.tree.copy_global_to(guild=guild)
+    try:
+        synced = await treesync.sync_if_changed(bot.tree, db, bot.application_id, guild=guild, force=FORCE_TREE_SYNC)
+    except Exception as e:
+        log.error("Hiba a slash parancsok szinkronizálásánál: %s", e)
+        return None
+    scope = f"szerver {DEV_GUILD_ID}" if guild else "globális"
+    if synced is None:
+        log.info("Slash parancsok változatlanok (%s), szinkronizálás kihagyva", scope)
+        return False
+    log.info("Slash parancsok szinkronizálva (%s, %s)", scope, synced)
+    return True
+
+def shard_latencies() -> list[tuple[int, float]]:
+    """(shard_id, késleltetés mp) párok; shardolás nélkül egyetlen 0. shard."""
+    if isinstance(bot, commands.AutoShardedBot):
+        return list(bot.latencies)
+    return [(0, bot.latency)]
+
+async def publish_cluster_status():
+    """A cluster állapotát a közös tárolóba írja, hogy /botinfo az összeset lássa."""
+    await bot.wait_until_ready()
+    while not bot.is_closed():
+        try:
+            await publish_status(db, SHARDS.cluster_id, len(bot.guilds), shard_latencies())
+        except Exception as e:
+            log.warning("Hiba a cluster állapot írásakor: %s", e)
+        await asyncio.sleep(STATUS_INTERVAL)
+
+def pretty_time_delta(td: timedelta) -> str:
+    s = int(td.total_seconds())
+    parts = []
+    for unit, div in (("nap", 86400), ("óra", 3600), ("perc", 60), ("mp", 1)):
+        if s >= div:
+            val, s = divmod(s, div)
+            suffix = ""
+            if unit == "nap":
+                suffix = "ok" if val > 1 else ""
+            parts.append(f"{val} {unit}{suffix}")
+    return ", ".join(parts) if parts else "0 mp"
+
+# ----------------- Időzített moderáció -----------------
+
+async def schedule_undo(kind: str, minutes: int, payload: dict) -> None:
+    """Egy művelet visszavonásának ütemezése; az azonos célpontra korábban ütemezettet lecseréli."""
+    await cancel_scheduled(kind, **payload)
+    await scheduler.schedule(kind, time.time() + minutes * 60, payload)
+
+async def cancel_scheduled(kind: str, **match) -> None:
+    for job in scheduler.find(kind, **match):
+        await scheduler.cancel(job.id)
+
+async def run_mute_job(job: Job) -> Optional[float]:
+    """Hosszú némítás meghosszabbítása, lejáratkor mod-log bejegyzés."""
+    p = job.payload
+    guild = bot.get_guild(p["guild_id"])
+    if guild is None:
+        return None
+    now = discord.utils.utcnow()
+    until = datetime.fromtimestamp(p["until"], tz=now.tzinfo)
+    if until - now > timedelta(seconds=5):
+        member = guild.get_member(p["user_id"]) or await guild.fetch_member(p["user_id"])
+        step_until = min(until, now + MAX_TIMEOUT)
+        await member.edit(timed_out_until=step_until, reason="Hosszú némítás meghosszabbítása")
+        return step_until.timestamp()
+    await log_mod_action(guild, "Némítás lejárt", discord.Color.green(), [
+        ("Felhasználó", f"<@{p['user_id']}> ({p['user_id']})"),
+        ("Moderátor", "Időzítő"),
+    ])
+    return None
+
+async def run_unban_job(job: Job) -> Optional[float]:
+    p = job.payload
+    guild = bot.get_guild(p["guild_id"])
+    if guild is None:
+        return None
+    try:
+        await guild.unban(discord.Object(id=p["user_id"]), reason="Ideiglenes kitiltás lejárt")
+    except discord.NotFound:
+        return None  # közben már feloldották
+    await log_mod_action(guild, "Ideiglenes kitiltás lejárt", discord.Color.green(), [
+        ("Felhasználó", f"<@{p['user_id']}> ({p['user_id']})"),
+        ("Moderátor", "Időzítő"),
+    ])
+    return None
+
+async def run_unlock_job(job: Job) -> Optional[float]:
+    channel = bot.get_channel(job.payload["channel_id"])
+    if not isinstance(channel, discord.TextChannel):
+        return None
+    await set_channel_locked(channel, False, reason="Időzített zárolás lejárt")
+    await log_mod_action(channel.guild, "Csatorna feloldva (időzítő)", discord.Color.green(), [
+        ("Csatorna", channel.mention),
+        ("Moderátor", "Időzítő"),
+    ])
+    return None
+
+async def run_slowmode_reset_job(job: Job) -> Optional[float]:
+    channel = bot.get_channel(job.payload["channel_id"])
+    if not isinstance(channel, discord.TextChannel):
+        return None
+    await set_slowmode(channel, 0, reason="Időzített slowmode lejárt")
+    await log_mod_action(channel.guild, "Slowmode kikapcsolva (időzítő)", discord.Color.green(), [
+        ("Csatorna", channel.mention),
+        ("Moderátor", "Időzítő"),
+    ])
+    return None
+
+scheduler.register("mute", run_mute_job)
+scheduler.register("unban", run_unban_job)
+scheduler.register("unlock", run_unlock_job)
+scheduler.register("slowmode_reset", run_slowmode_reset_job)
+
+# ----------------- Események -----------------
+
+@bot.event
+async def on_ready():
+    # Újracsatlakozáskor is lefut: itt már nincs parancs szinkronizálás, az a setup_hook-ban egyszer történik.
+    global startup_info
+    log.info("Bejelentkezve: %s (ID: %s)", bot.user, bot.user.id)
+    if startup_info is None:
+        startup_info = membercache.startup_report(member_cache, bot, PROCESS_STARTED)
+        log.info("Indulás kész — %s", startup_info)
+
+@bot.event
+async def on_member_ban(guild: discord.Guild, user: discord.abc.User):
+    ban_index.on_ban(guild, user)
+
+@bot.event
+async def on_member_unban(guild: discord.Guild, user: discord.User):
+    ban_index.on_unban(guild, user)
+
+@bot.listen("on_message")
+async def track_member_activity(message: discord.Message):
+    if message.guild is not None and not message.author.bot:
+        member_cache.touch(message.author)
+        activity_tracker.record(message.guild.id, message.channel.id, message.author.id)
+
+@bot.event
+async def on_guild_channel_create(channel: discord.abc.GuildChannel):
+    modlog.channel_created(channel)
+    guild_stats.on_channel_create(channel)
+
+@bot.event
+async def on_guild_channel_delete(channel: discord.abc.GuildChannel):
+    modlog.channel_deleted(channel)
+    guild_stats.on_channel_delete(channel)
+
+@bot.event
+async def on_guild_channel_update(before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
+    modlog.channel_updated(after)
+    guild_stats.on_channel_update(before, after)
+
+# Statisztika index karbantartása (lásd guildstats.py)
+
+@bot.listen("on_member_join")
+async def stats_on_member_join(member: discord.Member):
+    guild_stats.on_member_join(member)
+
+@bot.event
+async def on_raw_member_remove(payload: discord.RawMemberRemoveEvent):
+    guild_stats.on_member_remove(payload.guild_id, payload.user)
+
+@bot.event
+async def on_member_update(before: discord.Member, after: discord.Member):
+    guild_stats.on_member_update(before, after)
+
+@bot.event
+async def on_guild_role_delete(role: discord.Role):
+    guild_stats.on_role_delete(role)
+
+@bot.event
+async def on_guild_remove(guild: discord.Guild):
+    modlog.forget_guild(guild.id)
+    modlog_pipeline.forget_guild(guild.id)
+    automod.forget_guild(guild.id)
+    member_cache.forget_guild(guild.id)
+    ban_index.forget_guild(guild.id)
+    poll_manager.forget_guild(guild.id)
+    activity_tracker.forget_guild(guild.id)
+    guild_stats.forget_guild(guild.id)
+
+# Automod: flood / ismételt üzenet / említés spam / csatlakozási hullám
+
+def is_automod_exempt(member: discord.Member) -> bool:
+    perms = member.guild_permissions
+    return perms.administrator or perms.manage_messages or perms.moderate_members
+
+async def apply_automod(guild: discord.Guild, member: discord.Member, channel: Optional[discord.TextChannel],
+                        verdicts: list[Verdict], message: Optional[discord.Message] = None):
+    """Az automod döntéseinek végrehajtása a meglévő mute / lock / slowmode műveletekkel."""
+    cfg = automod.cfg
+    me = guild.me
+    for v in verdicts:
+        fields = [("Ok", v.reason)]
+        try:
+            if v.action == "mute":
+                if member.is_timed_out() or not me.guild_permissions.moderate_members or member.top_role >= me.top_role:
+                    continue
+                await apply_timeout(member, cfg.mute_minutes, reason=f"Automod: {v.reason}")
+                title = "Automod: felhasználó némítva"
+                fields = [("Felhasználó", f"{member} ({member.id})"), ("Idő", f"{cfg.mute_minutes} perc"), *fields]
+            elif v.action == "slowmode" and channel:
+                await set_slowmode(channel, cfg.slowmode_seconds, reason=f"Automod: {v.reason}")
+                await schedule_undo("slowmode_reset", cfg.slowmode_minutes, {"guild_id": guild.id, "channel_id": channel.id})
+                title = "Automod: slowmode bekapcsolva"
+                fields = [("Csatorna", channel.mention), ("Slowmode", f"{cfg.slowmode_seconds} mp, {cfg.slowmode_minutes} percig"), *fields]
+            elif v.action == "lock" and channel:
+                await set_channel_locked(channel, True, reason=f"Automod: {v.reason}")
+                title = "Automod: csatorna zárolva"
+                fields = [("Csatorna", channel.mention), *fields, ("Feloldás", "`/unlock` paranccsal")]
+            elif v.action == "raid":
+                title = "Automod: raid mód bekapcsolva"
+                fields = [*fields, ("Időtartam", f"{cfg.raid_minutes} perc — az új tagok automatikusan némítva")]
+            else:
+                continue
+            if v.delete_message and message is not None:
+                await message.delete()
+        except discord.HTTPException:
+            continue
+        await log_mod_action(guild, title, discord.Color.dark_red(), [*fields, ("Moderátor", "Automod")])
+
+@bot.listen("on_message")
+async def automod_on_message(message: discord.Message):
+    if not AUTOMOD_ENABLED or message.guild is None or message.author.bot:
+        return
+    if not isinstance(message.author, discord.Member) or is_automod_exempt(message.author):
+        return
+    verdicts = automod.check_message(message)
+    if verdicts:
+        channel = message.channel if isinstance(message.channel, discord.TextChannel) else None
+        await apply_automod(message.guild, message.author, channel, verdicts, message)
+
+@bot.listen("on_member_join")
+async def automod_on_member_join(member: discord.Member):
+    if not AUTOMOD_ENABLED or member.bot:
+        return
+    verdicts = automod.check_join(member)
+    if verdicts:
+        await apply_automod(member.guild, member, None, verdicts)
+
+@bot.listen("on_message")
+async def wordfilter_on_message(message: discord.Message):
+    if message.guild is None or message.author.bot or not isinstance(message.author, discord.Member):
+        return
+    term = word_filter.check(message.guild.id, message.content)
+    if term is None or is_automod_exempt(message.author):
+        return
+    reason = f"Tiltott kifejezés: {term}"
+    try:
+        await message.delete()
+    except discord.HTTPException:
+        pass
+    await warn_store.add(new_warning(message.guild.id, message.author.id, bot.user.id, reason))
+    await log_mod_action(message.guild, "Szűrő: üzenet törölve, figyelmeztetés", discord.Color.orange(), [
+        ("Felhasználó", f"{message.author} ({message.author.id})"),
+        ("Csatorna", message.channel.mention),
+        ("Ok", reason),
+        ("Moderátor", "Szűrő"),
+    ])
+
+@bot.listen("on_app_command_completion")
+async def record_command_completion(interaction: discord.Interaction, command):
+    metrics.registry.finish(interaction)
+
+async def send_error_reply(interaction: discord.Interaction, content: str) -> None:
+    """Hibaüzenet a közös válaszrétegen; ha már nem küldhető (pl. lejárt token), csak naplózunk."""
+    try:
+        await replies.reply_for(interaction).send(content, ephemeral=True)
+    except discord.HTTPException as exc:
+        log.warning("A hibaüzenet nem küldhető el (/%s): %s", metrics.command_name(interaction), exc, extra={
+            "event": "command_error", "command": metrics.command_name(interaction),
+            "guild_id": interaction.guild_id, "user_id": interaction.user.id,
+        })
+
+@bot.event
+async def on_app_command_error(interaction: discord.Interaction, error: app_commands.AppCommandError):
+    """Slash parancs hibakezelése."""
+    if isinstance(error, app_commands.TransformerError):
+        await send_error_reply(interaction, "❌ Érvénytelen argumentum.")
+    elif isinstance(error, app_commands.MissingPermissions):
+        await send_error_reply(interaction, "❌ Nincs meg a szükséges jogosultságod.")
+    elif isinstance(error, app_commands.CheckFailure):
+        await send_error_reply(interaction, "❌ Nincs jogosultságod ehhez a parancshoz.")
+    elif isinstance(error, app_commands.CommandNotFound):
+        # Ezt nem nagyon kell kezelni slash-nél
+        await send_error_reply(interaction, "❌ Ismeretlen parancs.")
+    else:
+        # Újradobás helyett naplózzuk, a hívás adataival együtt.
+        log.error("Hiba a /%s parancsban: %s", metrics.command_name(interaction), error, exc_info=error, extra={
+            "event": "command_error", "command": metrics.command_name(interaction),
+            "guild_id": interaction.guild_id, "user_id": interaction.user.id,
+        })
+        await send_error_reply(interaction, f"❌ Hiba történt: `{error}`")
+
+# ----------------- Bővítmények -----------------
+
+async def load_extensions():
+    for name in EXTENSIONS:
+        started = time.perf_counter()
+        await bot.load_extension(name)
+        elapsed = (time.perf_counter() - started) * 1000
+        log.info("Bővítmény betöltve: %s (%.0f ms)", name, elapsed, extra={"event": "extension", "latency_ms": round(elapsed, 1)})
+
+@bot.tree.command(name="reload", description="Parancs-bővítmények újratöltése újraindítás nélkül")
+@app_commands.describe(extension="A beállított bővítmények egyike (EXTENSIONS); üresen mind")
+@is_admin()
+async def slash_reload(interaction: discord.Interaction, extension: Optional[str] = None):
+    # Csak az ezt a parancsot kapó folyamat töltődik újra; clusterenként külön kell futtatni.
+    if extension:
+        name = f"cogs.{extension.strip()}"
+        if name not in EXTENSIONS:
+            known = ", ".join(f"`{n.removeprefix('cogs.')}`" for n in EXTENSIONS)
+            await interaction.response.send_message(f"❌ Ismeretlen bővítmény. Választható: {known}", ephemeral=True)
+            return
+        targets = [name]
+    else:
+        targets = EXTENSIONS
+    await interaction.response.defer(ephemeral=True, thinking=True)
+    started = time.perf_counter()
+    reloaded, failed = [], []
+    for name in targets:
+        try:
+            if name in bot.extensions:
+                await bot.reload_extension(name)  # hibánál a régi változat marad betöltve
+            else:
+                await bot.load_extension(name)
+            reloaded.append(name)
+        except commands.ExtensionError as e:
+            failed.append(f"`{name}`: {e}")
+    elapsed = (time.perf_counter() - started) * 1000
+    log.log(logging.WARNING if failed else logging.INFO, "Bővítmények újratöltve: %s (%.0f ms)%s",
+            ", ".join(reloaded) or "-", elapsed, "".join(f"; {f}" for f in failed),
+            extra={"event": "reload", "latency_ms": round(elapsed, 1)})
+    synced = await sync_command_tree() if reloaded else False
+    lines = [f"♻️ Újratöltve {elapsed:.0f} ms alatt: " + (", ".join(f"`{n}`" for n in reloaded) or "semmi")]
+    lines += [f"❌ {f}" for f in failed]
+    lines.append("Parancsfa: " + {True: "szinkronizálva", False: "változatlan", None: "szinkronizálás sikertelen"}[synced])
+    await interaction.followup.send("\n".join(lines), ephemeral=True)
+
+@slash_reload.autocomplete("extension")
+async def reload_autocomplete(interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+    names = [n.removeprefix("cogs.") for n in EXTENSIONS]
+    return [app_commands.Choice(name=n, value=n) for n in names if current.lower() in n.lower()][:25]
@@ -0,0 +1,144 @@
+"""Szerverenkénti, eseményekből frissített statisztika index.
+
+Szerepenkénti taglétszám, bot / ember arány, csatornák típusonként és a
+csatlakozási sorrend (rendezett lista, bisect). Egy szerver indexe az első
+lekérdezéskor épül fel a tag cache-ből (egyszeri O(n)), utána a gateway
+események tartják karban, így a parancsok konstans / logaritmikus időben
+válaszolnak.
+
+Nem `full` tag cache házirendnél a cache-ben nem lévő tagok szerepváltozásáról
+nem jön esemény: ilyenkor az index `max_age` másodperc után (és ha egy nem
+cachelt tag kilép, azonnal) elavul, és a következő lekérdezés újraépíti
+(igény szerinti chunkolás után).
+"""
+
+import bisect
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Optional, Union
+
+import discord
+
+
+@dataclass
+class GuildStats:
+    members: int = 0
+    bots: int = 0
+    roles: Counter = field(default_factory=Counter)  # szerep ID -> tagok száma (@everyone nélkül)
+    channels: Counter = field(default_factory=Counter)  # discord.ChannelType -> darab
+    joins: list[tuple[float, int]] = field(default_factory=list)  # (csatlakozás, tag ID), rendezve
+    stale: bool = False
+    built_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def humans(self) -> int:
+        return self.members - self.bots
+
+    @staticmethod
+    def _join_key(member: discord.Member) -> tuple[float, int]:
+        return (member.joined_at.timestamp() if member.joined_at else 0.0, member.id)
+
+    def add_member(self, member: discord.Member) -> None:
+        self.members += 1
+        self.bots += member.bot
+        self.roles.update(member._roles)
+        bisect.insort(self.joins, self._join_key(member))
+
+    def remove_member(self, member: discord.Member) -> None:
+        self.members -= 1
+        self.bots -= member.bot
+        self.roles.subtract(member._roles)
+        key = self._join_key(member)
+        i = bisect.bisect_left(self.joins, key)
+        if i < len(self.joins) and self.joins[i] == key:
+            del self.joins[i]
+
+    def update_roles(self, before: discord.Member, after: discord.Member) -> None:
+        old, new = set(before._roles), set(after._roles)
+        self.roles.subtract(old - new)
+        self.roles.update(new - old)
+
+    def role_count(self, role: discord.Role) -> int:
+        return self.members if role.is_default() else self.roles.get(role.id, 0)
+
+    def join_position(self, member: discord.Member) -> Optional[int]:
+        """Hányadikként csatlakozott (1-től), ha ismert."""
+        key = self._join_key(member)
+        i = bisect.bisect_left(self.joins, key)
+        return i + 1 if i < len(self.joins) and self.joins[i] == key else None
+
+class StatsIndex:
+    def __init__(self, max_age: Optional[float] = None) -> None:
+        self.max_age = max_age  # None: csak az események tartják karban (teljes tag cache)
+        self.guilds: dict[int, GuildStats] = {}
+        self.builds = 0
+
+    def get(self, guild: discord.Guild) -> Optional[GuildStats]:
+        """Az index; ha még nincs (vagy elavult) és a taglista teljes, most épül fel. Különben None."""
+        stats = self.guilds.get(guild.id)
+        if stats is not None and not stats.stale and (
+                self.max_age is None or time.monotonic() - stats.built_at < self.max_age):
+            return stats
+        return self.build(guild) if guild.chunked else None
+
+    def build(self, guild: discord.Guild) -> GuildStats:
+        stats = GuildStats()
+        for member in guild.members:
+            stats.members += 1
+            stats.bots += member.bot
+            stats.roles.update(member._roles)
+            stats.joins.append(stats._join_key(member))
+        stats.joins.sort()
+        stats.channels.update(c.type for c in guild.channels)
+        self.guilds[guild.id] = stats
+        self.builds += 1
+        return stats
+
+    # --- események (csak a már felépített indexeket frissítik) ---
+
+    def on_member_join(self, member: discord.Member) -> None:
+        stats = self.guilds.get(member.guild.id)
+        if stats is not None:
+            stats.add_member(member)
+
+    def on_member_remove(self, guild_id: int, user: Union[discord.User, discord.Member]) -> None:
+        stats = self.guilds.get(guild_id)
+        if stats is None:
+            return
+        if isinstance(user, discord.Member):
+            stats.remove_member(user)
+        else:
+            # Nem volt a cache-ben: a szerepeit nem ismerjük.
+            stats.members -= 1
+            stats.bots -= user.bot
+            stats.stale = True
+
+    def on_member_update(self, before: discord.Member, after: discord.Member) -> None:
+        stats = self.guilds.get(after.guild.id)
+        if stats is not None and before._roles != after._roles:
+            stats.update_roles(before, after)
+
+    def on_role_delete(self, role: discord.Role) -> None:
+        stats = self.guilds.get(role.guild.id)
+        if stats is not None:
+            stats.roles.pop(role.id, None)
+
+    def on_channel_create(self, channel: discord.abc.GuildChannel) -> None:
+        stats = self.guilds.get(channel.guild.id)
+        if stats is not None:
+            stats.channels[channel.type] += 1
+
+    def on_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        stats = self.guilds.get(channel.guild.id)
+        if stats is not None:
+            stats.channels[channel.type] -= 1
+
+    def on_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel) -> None:
+        stats = self.guilds.get(after.guild.id)
+        if stats is not None and before.type != after.type:
+            stats.channels[before.type] -= 1
+            stats.channels[after.type] += 1
+
+    def forget_guild(self, guild_id: int) -> None:
+        self.guilds.pop(guild_id, None)
@@ -0,0 +1,152 @@
+"""Konfigurálható tag cache házirend (MEMBER_CACHE környezeti változó).
+
+- `full`:    minden tag a memóriában, indításkor chunkolás (a régi viselkedés)
+- `recent`:  csak a nemrég látott / moderált tagok (szerverenként LRU),
+             nincs indítási chunkolás; teljes listát igénylő parancsoknál
+             a szerver igény szerint, egyszer chunkolódik, majd visszavágjuk
+- `minimal`: a discord.py nem cachel tagokat; csak igény szerinti chunkolás
+
+Az indulási időt és a memóriahasználatot a `StartupReport` rögzíti, hogy
+a házirendek összevethetők legyenek.
+"""
+
+import asyncio
+import os
+import resource
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import discord
+
+
+POLICIES = ("full", "recent", "minimal")
+RECENT_PER_GUILD = int(os.environ.get("MEMBER_CACHE_SIZE", "1000"))
+TRIM_INTERVAL = 300.0
+CHUNK_GRACE = 600.0  # igény szerinti chunk után ennyi ideig megtartjuk a teljes listát
+
+def policy_from_env() -> str:
+    policy = os.environ.get("MEMBER_CACHE", "full").lower()
+    if policy not in POLICIES:
+        raise ValueError(f"Ismeretlen MEMBER_CACHE házirend: {policy} (lehetséges: {', '.join(POLICIES)})")
+    return policy
+
+def client_kwargs(policy: str, intents: discord.Intents) -> dict:
+    if policy == "full":
+        return dict(member_cache_flags=discord.MemberCacheFlags.from_intents(intents), chunk_guilds_at_startup=True)
+    if policy == "recent":
+        # joined=False: a csatlakozó / frissülő tagokat a discord.py ne cachelje magától,
+        # különben az LRU-n kívül, korlát nélkül nőne a cache; tag csak a touch()-csal kerül be.
+        flags = discord.MemberCacheFlags.from_intents(intents)
+        flags.joined = False
+        return dict(member_cache_flags=flags, chunk_guilds_at_startup=False)
+    return dict(member_cache_flags=discord.MemberCacheFlags.none(), chunk_guilds_at_startup=False)
+
+class MemberCache:
+    # A tagok kézi hozzáadása / eltávolítása a discord.py privát API-ján megy
+    # (Guild._add_member, Guild._remove_member, Guild._members); nincs rá nyilvános
+    # megfelelő, ezért discord.py frissítéskor ezeket ellenőrizni kell.
+
+    def __init__(self, policy: str) -> None:
+        self.policy = policy
+        self.recent: dict[int, OrderedDict[int, None]] = {}
+        # struktúra: szerver_id -> felhasználó id-k, legrégebben látott elöl
+        self.chunked_at: dict[int, float] = {}
+        self._locks: dict[int, asyncio.Lock] = {}
+        self.chunk_requests = 0
+
+    def touch(self, member: discord.Member) -> None:
+        """Látott / moderált tag megjelölése (`recent` házirendnél a cache-be is bekerül)."""
+        if self.policy != "recent" or not isinstance(member, discord.Member):
+            return
+        guild = member.guild
+        seen = self.recent.get(guild.id)
+        if seen is None:
+            seen = self.recent[guild.id] = OrderedDict()
+        if member.id in seen:
+            seen.move_to_end(member.id)
+            return
+        seen[member.id] = None
+        if guild.get_member(member.id) is None:
+            guild._add_member(member)
+        if len(seen) > RECENT_PER_GUILD:
+            old_id, _ = seen.popitem(last=False)
+            if old_id != guild.me.id and guild.id not in self.chunked_at:
+                guild._remove_member(discord.Object(id=old_id))
+
+    async def ensure_chunked(self, guild: discord.Guild) -> None:
+        """Teljes taglista igény szerint; párhuzamos kérések egyetlen chunkolásra várnak."""
+        if self.policy == "full" or guild.chunked:
+            return
+        lock = self._locks.setdefault(guild.id, asyncio.Lock())
+        async with lock:
+            if guild.chunked:
+                return
+            self.chunk_requests += 1
+            await guild.chunk(cache=True)
+            self.chunked_at[guild.id] = time.monotonic()
+
+    def trim(self, client: discord.Client) -> int:
+        """Az igény szerint chunkolt szerverek visszavágása a nemrég látott tagokra."""
+        if self.policy == "full":
+            return 0
+        removed = 0
+        now = time.monotonic()
+        for guild_id, at in list(self.chunked_at.items()):
+            if now - at < CHUNK_GRACE:
+                continue
+            del self.chunked_at[guild_id]
+            guild = client.get_guild(guild_id)
+            if guild is None:
+                continue
+            keep = self.recent.get(guild_id, {}) if self.policy == "recent" else {}
+            for member in list(guild.members):
+                if member.id not in keep and member.id != guild.me.id:
+                    guild._remove_member(member)
+                    removed += 1
+        return removed
+
+    async def trim_loop(self, client: discord.Client) -> None:
+        while not client.is_closed():
+            await asyncio.sleep(TRIM_INTERVAL)
+            self.trim(client)
+
+    def forget_guild(self, guild_id: int) -> None:
+        self.recent.pop(guild_id, None)
+        self.chunked_at.pop(guild_id, None)
+        self._locks.pop(guild_id, None)
+
+    def cached_members(self, client: discord.Client) -> int:
+        return sum(len(g._members) for g in client.guilds)
+
+# ----------------- Indulási riport -----------------
+
+def current_rss_mb() -> float:
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError):
+        # /proc nélkül (pl. macOS) a csúcs értéket adjuk vissza
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+@dataclass
+class StartupReport:
+    policy: str
+    startup_seconds: float
+    rss_mb: float
+    guilds: int
+    cached_members: int
+
+    def __str__(self) -> str:
+        return (f"{self.policy} házirend: indulás {self.startup_seconds:.1f} mp, "
+                f"{self.rss_mb:.0f} MB RSS, {self.guilds} szerver, {self.cached_members} cachelt tag")
+
+def startup_report(cache: MemberCache, client: discord.Client, started: float) -> StartupReport:
+    return StartupReport(
+        policy=cache.policy,
+        startup_seconds=time.perf_counter() - started,
+        rss_mb=current_rss_mb(),
+        guilds=len(client.guilds),
+        cached_members=cache.cached_members(client),
+    )
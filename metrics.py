@@ -0,0 +1,312 @@
+"""Parancsonkénti késleltetés- és hibamérés, Prometheus formátumú végponttal.
+
+Minden slash parancshívás egy `Invocation`, amit a `InstrumentedTree`
+indít el és a befejezéskor / hibánál zár le. A futó hívás egy
+ContextVar-ban van, így a REST hívások (bot HTTP kliens és interakciós
+webhook), az első válasz ideje (a 3 mp-es határidőhöz mérve) és a
+rate limit várakozások (a discord.py figyelmeztető logjaiból) a hívó
+parancshoz számolódnak.
+
+A végpont alapból a 127.0.0.1:9108 (+ cluster azonosító) címen figyel,
+METRICS_PORT=0 kikapcsolja.
+"""
+
+import bisect
+import logging
+import os
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+import discord
+from aiohttp import web
+from discord import app_commands
+from discord.webhook.async_ import async_context
+
+
+log = logging.getLogger(__name__)
+
+METRICS_HOST = os.environ.get("METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.environ.get("METRICS_PORT", "9108"))
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+TTFR_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0)
+INTERACTION_DEADLINE = 3.0
+
+class Histogram:
+    """Fix vödrös hisztogram (a Prometheus `le` vödreivel kompatibilis)."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # az utolsó a +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Becslés a vödrökből (lineáris interpoláció a vödrön belül)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if seen + n >= rank and n:
+                lower = self.bounds[i - 1] if i else 0.0
+                upper = self.bounds[i] if i < len(self.bounds) else self.bounds[-1]
+                return lower + (upper - lower) * (rank - seen) / n
+            seen += n
+        return self.bounds[-1]
+
+    def cumulative(self) -> list[int]:
+        out, total = [], 0
+        for n in self.counts:
+            total += n
+            out.append(total)
+        return out
+
+@dataclass
+class CommandStats:
+    calls: int = 0
+    errors: int = 0
+    late: int = 0  # a határidő után érkezett (vagy elmaradt) első válasz
+    auto_defers: int = 0  # a válaszréteg halasztott helyette (replies.py)
+    throttled: int = 0  # a korlátozó elutasította (ratelimit.py); ezek nem számítanak hívásnak
+    rest_calls: int = 0
+    ratelimit_waits: int = 0
+    ratelimit_seconds: float = 0.0
+    latency: Histogram = field(default_factory=lambda: Histogram(LATENCY_BUCKETS))
+    ttfr: Histogram = field(default_factory=lambda: Histogram(TTFR_BUCKETS))
+
+@dataclass
+class Invocation:
+    command: str
+    guild_id: Optional[int] = None
+    user_id: Optional[int] = None
+    started: float = field(default_factory=time.perf_counter)
+    first_response: Optional[float] = None
+    rest_calls: int = 0
+    finished: bool = False
+
+current: ContextVar[Optional[Invocation]] = ContextVar("current_invocation", default=None)
+
+class Metrics:
+    def __init__(self) -> None:
+        self.commands: dict[str, CommandStats] = {}
+        self.rest_calls = 0  # összesen, parancson kívüliekkel együtt
+        self.ratelimit_waits = 0
+        self.ratelimit_seconds = 0.0
+        self.gauges: dict[str, tuple[str, Callable[[], float]]] = {}
+
+    def stats(self, command: str) -> CommandStats:
+        stats = self.commands.get(command)
+        if stats is None:
+            stats = self.commands[command] = CommandStats()
+        return stats
+
+    def gauge(self, name: str, help_text: str, fn: Callable[[], float]) -> None:
+        """Pillanatnyi érték a végponthoz (pl. mod-log sor hossza)."""
+        self.gauges[name] = (help_text, fn)
+
+    # --- hívások életciklusa ---
+
+    def begin(self, interaction: discord.Interaction) -> Invocation:
+        inv = Invocation(command_name(interaction), interaction.guild_id, interaction.user.id)
+        interaction.extras["invocation"] = inv
+        current.set(inv)
+        self.stats(inv.command).calls += 1
+        return inv
+
+    def finish(self, interaction: discord.Interaction, failed: bool = False) -> None:
+        inv: Optional[Invocation] = interaction.extras.get("invocation")
+        if inv is None or inv.finished:
+            return
+        inv.finished = True
+        latency = time.perf_counter() - inv.started
+        stats = self.stats(inv.command)
+        stats.latency.observe(latency)
+        late = False
+        if failed:
+            stats.errors += 1
+        elif inv.first_response is None:
+            stats.late += 1  # sikeres futás, de válasz nélkül: a kliens "nem válaszol" hibát mutat
+            late = True
+        else:
+            late = inv.first_response - inv.started > INTERACTION_DEADLINE
+        # Sikeres, időben válaszolt hívás: INFO (mintavételezve); hiba / késés: mindig naplózva.
+        log.log(logging.WARNING if failed or late else logging.INFO, "/%s %.0f ms", inv.command, latency * 1000,
+                extra={"event": "command", "command": inv.command, "guild_id": inv.guild_id, "user_id": inv.user_id,
+                       "latency_ms": round(latency * 1000, 1), "failed": failed, "rest_calls": inv.rest_calls})
+
+    def record_rest(self, callback: bool) -> None:
+        self.rest_calls += 1
+        inv = current.get()
+        if inv is None:
+            return
+        inv.rest_calls += 1
+        self.stats(inv.command).rest_calls += 1
+        if callback and inv.first_response is None:
+            inv.first_response = time.perf_counter()
+            ttfr = inv.first_response - inv.started
+            stats = self.stats(inv.command)
+            stats.ttfr.observe(ttfr)
+            if ttfr > INTERACTION_DEADLINE:
+                stats.late += 1
+
+    def record_auto_defer(self, interaction: discord.Interaction) -> None:
+        inv: Optional[Invocation] = interaction.extras.get("invocation")
+        command = inv.command if inv is not None else command_name(interaction)
+        self.stats(command).auto_defers += 1
+        log.info("Automatikus halasztás: /%s", command, extra={"event": "auto_defer", "command": command})
+
+    def record_throttled(self, command: str, scope: str) -> None:
+        self.stats(command).throttled += 1
+        log.info("Korlátozva: /%s (%s)", command, scope, extra={"event": "throttled", "command": command})
+
+    def record_ratelimit(self, seconds: float) -> None:
+        self.ratelimit_waits += 1
+        self.ratelimit_seconds += seconds
+        inv = current.get()
+        if inv is not None:
+            stats = self.stats(inv.command)
+            stats.ratelimit_waits += 1
+            stats.ratelimit_seconds += seconds
+
+    # --- bekötés ---
+
+    def install(self, client: discord.Client) -> None:
+        """A REST hívások és rate limit logok számlálása (a bot és az interakciós webhook oldalán)."""
+        http_request = client.http.request
+
+        async def counted_request(route, **kwargs):
+            self.record_rest(callback=False)
+            return await http_request(route, **kwargs)
+
+        client.http.request = counted_request
+
+        adapter = async_context.get()
+        adapter_request = adapter.request
+
+        async def counted_adapter_request(route, session, **kwargs):
+            self.record_rest(callback=route.path.endswith("/callback"))
+            return await adapter_request(route, session, **kwargs)
+
+        adapter.request = counted_adapter_request
+
+        handler = RateLimitLogHandler(self)
+        for name in ("discord.http", "discord.webhook.async_"):
+            logging.getLogger(name).addHandler(handler)
+
+    # --- kimenet ---
+
+    def render(self) -> str:
+        lines: list[str] = []
+
+        def header(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        def histogram(name: str, help_text: str, attr: str) -> None:
+            header(name, "histogram", help_text)
+            for command, stats in sorted(self.commands.items()):
+                hist: Histogram = getattr(stats, attr)
+                label = f'command="{command}"'
+                for bound, total in zip(hist.bounds + (float("inf"),), hist.cumulative()):
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'{name}_bucket{{{label},le="{le}"}} {total}')
+                lines.append(f"{name}_sum{{{label}}} {hist.sum:.6f}")
+                lines.append(f"{name}_count{{{label}}} {hist.count}")
+
+        def counter(name: str, help_text: str, attr: str) -> None:
+            header(name, "counter", help_text)
+            for command, stats in sorted(self.commands.items()):
+                lines.append(f'{name}{{command="{command}"}} {getattr(stats, attr)}')
+
+        histogram("bot_command_latency_seconds", "Parancs kezelő futásideje", "latency")
+        histogram("bot_command_ttfr_seconds", "Idő az első interakciós válaszig", "ttfr")
+        counter("bot_command_calls_total", "Parancshívások", "calls")
+        counter("bot_command_errors_total", "Hibával végződött hívások", "errors")
+        counter("bot_command_late_responses_total", "3 mp után érkezett vagy elmaradt első válasz", "late")
+        counter("bot_command_auto_defers_total", "A határidő közelében automatikusan halasztott hívások", "auto_defers")
+        counter("bot_command_throttled_total", "A parancs-korlátozó által elutasított hívások", "throttled")
+        counter("bot_command_rest_calls_total", "REST hívások parancsonként", "rest_calls")
+        counter("bot_command_ratelimit_waits_total", "Rate limit várakozások parancsonként", "ratelimit_waits")
+        counter("bot_command_ratelimit_wait_seconds_total", "Rate limit miatti várakozás (mp)", "ratelimit_seconds")
+        header("bot_rest_calls_total", "counter", "Összes REST hívás")
+        lines.append(f"bot_rest_calls_total {self.rest_calls}")
+        header("bot_ratelimit_wait_seconds_total", "counter", "Összes rate limit várakozás (mp)")
+        lines.append(f"bot_ratelimit_wait_seconds_total {self.ratelimit_seconds:.3f}")
+        for name, (help_text, fn) in sorted(self.gauges.items()):
+            header(name, "gauge", help_text)
+            lines.append(f"{name} {fn()}")
+        return "\n".join(lines) + "\n"
+
+    async def serve(self, host: str = METRICS_HOST, port: int = METRICS_PORT) -> Optional[web.AppRunner]:
+        if not port:
+            return None
+
+        async def handle(request: web.Request) -> web.Response:
+            return web.Response(text=self.render(), content_type="text/plain", charset="utf-8")
+
+        app = web.Application()
+        app.router.add_get("/metrics", handle)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, host, port).start()
+        return runner
+
+def command_name(interaction: discord.Interaction) -> str:
+    command = interaction.command
+    if command is not None:
+        return command.qualified_name
+    return (interaction.data or {}).get("name", "ismeretlen")
+
+class RateLimitLogHandler(logging.Handler):
+    """A discord.py 429-es figyelmeztetéseiből (utolsó argumentum: várakozás mp-ben) számol.
+
+    A logolás a kérést küldő taskban, szinkron történik, így a ContextVar
+    a hívó parancsot adja.
+    """
+
+    def __init__(self, metrics: Metrics) -> None:
+        super().__init__(logging.WARNING)
+        self.metrics = metrics
+
+    def emit(self, record: logging.LogRecord) -> None:
+        msg = str(record.msg)
+        # A globális limitnél a 429-es sor is megjelenik, azt már számoltuk.
+        if "rate limit" not in msg.lower() or msg.startswith("Global") or not record.args:
+            return
+        wait = record.args[-1] if isinstance(record.args, tuple) else None
+        if isinstance(wait, (int, float)):
+            self.metrics.record_ratelimit(float(wait))
+
+class InstrumentedTree(app_commands.CommandTree):
+    """Parancsfa, ami minden slash parancshívást mér.
+
+    Hibánál az `app_command_error` eseményt is kiküldi, hogy a bot
+    `on_app_command_error` kezelője megkapja; kezelő nélkül az alapértelmezett
+    naplózás fut.
+    """
+
+    async def interaction_check(self, interaction: discord.Interaction, /) -> bool:
+        if interaction.type is discord.InteractionType.application_command:
+            registry.begin(interaction)
+        return True
+
+    async def on_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError, /) -> None:
+        registry.finish(interaction, failed=True)
+        handled = getattr(self.client, "on_app_command_error", None) is not None or \
+            getattr(self.client, "extra_events", {}).get("on_app_command_error")
+        if not handled:
+            await super().on_error(interaction, error)
+            return
+        self.client.dispatch("app_command_error", interaction, error)
+
+registry = Metrics()
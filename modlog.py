@@ -0,0 +1,255 @@
+"""Mod-log: csatorna gyorsítótár és kötegelt, rate-limit kímélő író.
+
+A moderációs parancsok nem küldenek közvetlenül a mod-log csatornába, hanem
+`ModLogEvent` rekordokat tesznek egy szerverenkénti sorba. Egy háttér task
+a sort rövid időközönként üríti, és egy üzenetben legfeljebb 10 embedet küld,
+így egy raid vagy purge hullám sem eszi meg a csatorna rate limitjét.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+import discord
+
+
+log = logging.getLogger(__name__)
+
+# ----------------- Csatorna gyorsítótár -----------------
+
+MODLOG_NAMES = ("mod-log", "mod_log", "modlog")
+channel_ids: dict[int, int] = {}
+# struktúra: szerver_id -> mod-log csatorna id (a csatorna események frissítik)
+_channel_locks: dict[int, asyncio.Lock] = {}
+
+def find_channel(guild: discord.Guild) -> Optional[discord.TextChannel]:
+    ch_id = channel_ids.get(guild.id)
+    if ch_id is not None:
+        ch = guild.get_channel(ch_id)
+        if isinstance(ch, discord.TextChannel):
+            return ch
+        channel_ids.pop(guild.id, None)
+    return None
+
+async def get_or_create_channel(guild: discord.Guild) -> Optional[discord.TextChannel]:
+    """Megkeresi / létrehozza a mod-log csatornát (szerverenként gyorsítótárazva)."""
+    ch = find_channel(guild)
+    if ch:
+        return ch
+    # Egyszerre csak egy hívó keres / hoz létre csatornát szerverenként,
+    # így párhuzamos moderációs műveletek sem hoznak létre duplikált csatornát.
+    lock = _channel_locks.setdefault(guild.id, asyncio.Lock())
+    async with lock:
+        ch = find_channel(guild)
+        if ch:
+            return ch
+        for ch in guild.text_channels:
+            if ch.name in MODLOG_NAMES:
+                channel_ids[guild.id] = ch.id
+                return ch
+        try:
+            overwrites = {
+                guild.default_role: discord.PermissionOverwrite(send_messages=False, read_messages=True)
+            }
+            ch = await guild.create_text_channel("mod-log", overwrites=overwrites, reason="Automatikus mod-log létrehozása")
+            channel_ids[guild.id] = ch.id
+            return ch
+        except Exception:
+            return None
+
+def channel_created(channel: discord.abc.GuildChannel) -> None:
+    if isinstance(channel, discord.TextChannel) and channel.name in MODLOG_NAMES:
+        channel_ids.setdefault(channel.guild.id, channel.id)
+
+def channel_deleted(channel: discord.abc.GuildChannel) -> None:
+    if channel_ids.get(channel.guild.id) == channel.id:
+        channel_ids.pop(channel.guild.id, None)
+
+def channel_updated(after: discord.abc.GuildChannel) -> None:
+    if not isinstance(after, discord.TextChannel):
+        return
+    cached = channel_ids.get(after.guild.id)
+    if cached == after.id and after.name not in MODLOG_NAMES:
+        # Átnevezték: a következő hívás újra megkeresi a csatornát.
+        channel_ids.pop(after.guild.id, None)
+    elif cached is None and after.name in MODLOG_NAMES:
+        channel_ids[after.guild.id] = after.id
+
+def forget_guild(guild_id: int) -> None:
+    channel_ids.pop(guild_id, None)
+    _channel_locks.pop(guild_id, None)
+
+# ----------------- Események -----------------
+
+@dataclass
+class ModLogEvent:
+    """Egy moderációs esemény (a mod-log embed és a strukturált log közös alapja)."""
+    guild_id: int
+    title: str
+    color: discord.Color
+    fields: list[tuple[str, str]]
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+
+    def to_embed(self) -> discord.Embed:
+        embed = discord.Embed(title=self.title, color=self.color, timestamp=self.timestamp)
+        for name, value in self.fields:
+            embed.add_field(name=name, value=value, inline=False)
+        return embed
+
+    def log_extra(self) -> dict:
+        """Ugyanez az esemény a strukturált naplóba (lásd botlog.py)."""
+        return {"event": "modlog", "guild_id": self.guild_id, "fields": dict(self.fields)}
+
+# ----------------- Kötegelt író -----------------
+
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+FLUSH_INTERVAL = 2.0
+QUEUE_SIZE = 500
+PUT_TIMEOUT = 5.0
+
+class ModLogMetrics:
+    """Összesített számlálók az összes szerver írójára."""
+
+    def __init__(self) -> None:
+        self.enqueued = 0
+        self.dropped = 0
+        self.sent_events = 0
+        self.sent_messages = 0
+        self.flush_count = 0
+        self.flush_seconds_total = 0.0
+        self.flush_seconds_max = 0.0
+
+    def record_flush(self, events: int, messages: int, seconds: float) -> None:
+        self.sent_events += events
+        self.sent_messages += messages
+        self.flush_count += 1
+        self.flush_seconds_total += seconds
+        self.flush_seconds_max = max(self.flush_seconds_max, seconds)
+
+    @property
+    def flush_seconds_avg(self) -> float:
+        return self.flush_seconds_total / self.flush_count if self.flush_count else 0.0
+
+class ModLogWriter:
+    """Egy szerver mod-log sora és az azt ürítő háttér task."""
+
+    def __init__(self, client: discord.Client, guild_id: int, metrics: ModLogMetrics,
+                 *, interval: float = FLUSH_INTERVAL, maxsize: int = QUEUE_SIZE) -> None:
+        self.client = client
+        self.guild_id = guild_id
+        self.metrics = metrics
+        self.interval = interval
+        self.queue: asyncio.Queue[ModLogEvent] = asyncio.Queue(maxsize=maxsize)
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=f"modlog-{self.guild_id}")
+
+    async def put(self, event: ModLogEvent) -> bool:
+        """Sorba teszi az eseményt; tele sornál vár (backpressure), majd eldobja."""
+        self.start()
+        try:
+            await asyncio.wait_for(self.queue.put(event), timeout=PUT_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.metrics.dropped += 1
+            return False
+        self.metrics.enqueued += 1
+        return True
+
+    async def _collect(self) -> list[ModLogEvent]:
+        """Az első eseménytől számított `interval` ideig vagy 10 eseményig gyűjt."""
+        batch = [await self.queue.get()]
+        deadline = time.monotonic() + self.interval
+        while len(batch) < MAX_EMBEDS_PER_MESSAGE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect()
+            await self.flush(batch)
+
+    async def flush(self, batch: list[ModLogEvent]) -> None:
+        if not batch:
+            return
+        started = time.perf_counter()
+        guild = self.client.get_guild(self.guild_id)
+        ch = await get_or_create_channel(guild) if guild else None
+        if ch is None:
+            self.metrics.dropped += len(batch)
+            return
+        messages = 0
+        sent = 0
+        for chunk in _chunk_embeds([e.to_embed() for e in batch]):
+            try:
+                await ch.send(embeds=chunk)
+                messages += 1
+                sent += len(chunk)
+            except discord.HTTPException:
+                self.metrics.dropped += len(chunk)
+        self.metrics.record_flush(sent, messages, time.perf_counter() - started)
+
+    async def drain(self) -> None:
+        """Leállítja a taskot és kiküldi a sorban maradt eseményeket."""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        while not self.queue.empty():
+            batch = []
+            while not self.queue.empty() and len(batch) < MAX_EMBEDS_PER_MESSAGE:
+                batch.append(self.queue.get_nowait())
+            await self.flush(batch)
+
+def _chunk_embeds(embeds: list[discord.Embed]) -> list[list[discord.Embed]]:
+    """Üzenetenként legfeljebb 10 embed és 6000 karakter."""
+    chunks: list[list[discord.Embed]] = []
+    current: list[discord.Embed] = []
+    size = 0
+    for embed in embeds:
+        n = len(embed)
+        if current and (len(current) >= MAX_EMBEDS_PER_MESSAGE or size + n > MAX_EMBED_CHARS_PER_MESSAGE):
+            chunks.append(current)
+            current, size = [], 0
+        current.append(embed)
+        size += n
+    if current:
+        chunks.append(current)
+    return chunks
+
+class ModLogPipeline:
+    """Szerverenkénti írók nyilvántartása."""
+
+    def __init__(self, client: discord.Client) -> None:
+        self.client = client
+        self.metrics = ModLogMetrics()
+        self._writers: dict[int, ModLogWriter] = {}
+
+    async def log(self, event: ModLogEvent) -> bool:
+        log.info(event.title, extra=event.log_extra())
+        writer = self._writers.get(event.guild_id)
+        if writer is None:
+            writer = self._writers[event.guild_id] = ModLogWriter(self.client, event.guild_id, self.metrics)
+        return await writer.put(event)
+
+    def queue_depth(self) -> int:
+        return sum(w.queue.qsize() for w in self._writers.values())
+
+    def forget_guild(self, guild_id: int) -> None:
+        writer = self._writers.pop(guild_id, None)
+        if writer and writer._task:
+            writer._task.cancel()
+
+    async def close(self) -> None:
+        for writer in list(self._writers.values()):
+            await writer.drain()
@@ -0,0 +1,228 @@
+"""Gombos szavazások: memóriabeli számlálás, kötegelt mentés, ritkított szerkesztés.
+
+Minden nyitott szavazás a memóriában van (opciónkénti számlálók és
+felhasználó -> opció térkép), így egy szavazat O(1). A szavazatok egy
+pufferből kötegelve (`executemany`) kerülnek SQLite-ba; újraindításkor a
+nyitott szavazások a tárolt szavazatokból állnak helyre. Az üzenet
+szerkesztése szavazásonként legfeljebb `EDIT_INTERVAL` másodpercenként
+történik, bármennyi szavazat érkezik közben.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional
+
+from storage import Database
+
+
+log = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS polls (
+    message_id INTEGER PRIMARY KEY,
+    guild_id INTEGER NOT NULL,
+    channel_id INTEGER NOT NULL,
+    author_id INTEGER NOT NULL,
+    question TEXT NOT NULL,
+    options TEXT NOT NULL,
+    closes_at REAL NOT NULL,
+    closed INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS poll_votes (
+    message_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    option INTEGER NOT NULL,
+    PRIMARY KEY (message_id, user_id)
+) WITHOUT ROWID;
+"""
+
+MAX_OPTIONS = 10
+FLUSH_INTERVAL = 2.0
+FLUSH_BATCH = 500
+EDIT_INTERVAL = 3.0
+
+@dataclass
+class Poll:
+    message_id: int
+    guild_id: int
+    channel_id: int
+    author_id: int
+    question: str
+    options: list[str]
+    closes_at: float  # unix időbélyeg
+    closed: bool = False
+    counts: list[int] = field(default_factory=list)
+    votes: dict[int, int] = field(default_factory=dict)  # user_id -> opció index
+    last_edit: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            self.counts = [0] * len(self.options)
+
+    @property
+    def total(self) -> int:
+        return len(self.votes)
+
+    def vote(self, user_id: int, option: int) -> Optional[int]:
+        """Egy felhasználó egy szavazata; ugyanarra újra kattintva visszavonja. Az új választást adja vissza."""
+        previous = self.votes.get(user_id)
+        if previous is not None:
+            self.counts[previous] -= 1
+        if previous == option:
+            del self.votes[user_id]
+            return None
+        self.votes[user_id] = option
+        self.counts[option] += 1
+        return option
+
+# Az üzenet frissítése (a parancsot tartalmazó bővítmény állítja be); a szavazás zárásakor is ezt hívjuk.
+Editor = Callable[[Poll], Awaitable[None]]
+
+class PollManager:
+    def __init__(self, db: Database, *, interval: float = FLUSH_INTERVAL, batch: int = FLUSH_BATCH,
+                 edit_interval: float = EDIT_INTERVAL) -> None:
+        self.db = db
+        self.interval = interval
+        self.batch = batch
+        self.edit_interval = edit_interval
+        self.polls: dict[int, Poll] = {}
+        self.editor: Optional[Editor] = None
+        self._pending: dict[tuple[int, int], Optional[int]] = {}  # None: visszavont szavazat
+        self._edits: dict[int, asyncio.Task] = {}
+        self._wake = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self, owns: Optional[Callable[[int], bool]] = None) -> list[Poll]:
+        """A nyitott szavazások visszatöltése; több folyamatnál `owns` a szerver ID-ra szűr."""
+        await self.db.executescript(SCHEMA)
+
+        def load(conn):
+            polls = conn.execute(
+                "SELECT message_id, guild_id, channel_id, author_id, question, options, closes_at "
+                "FROM polls WHERE closed = 0").fetchall()
+            votes = conn.execute(
+                "SELECT v.message_id, v.user_id, v.option FROM poll_votes v "
+                "JOIN polls p ON p.message_id = v.message_id WHERE p.closed = 0").fetchall()
+            return polls, votes
+
+        rows, votes = await self.db.run(load)
+        for message_id, guild_id, channel_id, author_id, question, options, closes_at in rows:
+            if owns is None or owns(guild_id):
+                self.polls[message_id] = Poll(message_id, guild_id, channel_id, author_id, question,
+                                              json.loads(options), closes_at)
+        for message_id, user_id, option in votes:
+            poll = self.polls.get(message_id)
+            if poll is not None and option < len(poll.options):
+                poll.vote(user_id, option)
+        self._task = asyncio.create_task(self._run(), name="polls-flush")
+        return list(self.polls.values())
+
+    async def close(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        for task in self._edits.values():
+            task.cancel()
+        self._edits.clear()
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await self.flush()
+            except Exception:
+                log.exception("Szavazatok mentése sikertelen")
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+            upserts = [(m, u, o) for (m, u), o in pending.items() if o is not None]
+            deletes = [(m, u) for (m, u), o in pending.items() if o is None]
+
+            def write(conn):
+                conn.executemany(
+                    "INSERT INTO poll_votes (message_id, user_id, option) VALUES (?, ?, ?) "
+                    "ON CONFLICT (message_id, user_id) DO UPDATE SET option = excluded.option", upserts)
+                conn.executemany("DELETE FROM poll_votes WHERE message_id = ? AND user_id = ?", deletes)
+            try:
+                await self.db.run(write)
+            except Exception:
+                # Visszatesszük; a közben leadott (újabb) szavazat felülírja a régit.
+                for key, option in pending.items():
+                    self._pending.setdefault(key, option)
+                raise
+
+    async def create(self, poll: Poll) -> None:
+        self.polls[poll.message_id] = poll
+        await self.db.execute(
+            "INSERT INTO polls (message_id, guild_id, channel_id, author_id, question, options, closes_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (poll.message_id, poll.guild_id, poll.channel_id, poll.author_id, poll.question,
+             json.dumps(poll.options), poll.closes_at),
+        )
+
+    def vote(self, message_id: int, user_id: int, option: int) -> tuple[Optional[Poll], Optional[int]]:
+        """Szavazat rögzítése (DB írás és üzenet frissítés később, kötegelve)."""
+        poll = self.polls.get(message_id)
+        if poll is None or poll.closed or not 0 <= option < len(poll.options):
+            return None, None
+        choice = poll.vote(user_id, option)
+        self._pending[(message_id, user_id)] = choice
+        if len(self._pending) >= self.batch:
+            self._wake.set()
+        self._schedule_edit(poll)
+        return poll, choice
+
+    def _schedule_edit(self, poll: Poll) -> None:
+        if poll.message_id in self._edits:
+            return  # már van függő frissítés: az a legfrissebb állást fogja mutatni
+        delay = max(0.0, poll.last_edit + self.edit_interval - time.monotonic())
+        self._edits[poll.message_id] = asyncio.create_task(self._edit_later(poll, delay))
+
+    async def _edit_later(self, poll: Poll, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self._edits.pop(poll.message_id, None)
+        if poll.closed or self.editor is None:
+            return
+        poll.last_edit = time.monotonic()
+        try:
+            await self.editor(poll)
+        except Exception:
+            log.exception("Szavazás frissítése sikertelen (%s)", poll.message_id)
+
+    async def finish(self, message_id: int) -> Optional[Poll]:
+        """Szavazás lezárása: függő frissítés törlése, szavazatok mentése, végeredmény."""
+        poll = self.polls.get(message_id)
+        if poll is None:
+            return None
+        poll.closed = True
+        task = self._edits.pop(message_id, None)
+        if task is not None:
+            task.cancel()
+        try:
+            await self.flush()
+            await self.db.execute("UPDATE polls SET closed = 1 WHERE message_id = ?", (message_id,))
+        except Exception:
+            # Nyitva marad, így az ütemező újrapróbálkozása ugyanezt a szavazást zárja le.
+            poll.closed = False
+            raise
+        self.polls.pop(message_id, None)
+        return poll
+
+    def forget_guild(self, guild_id: int) -> None:
+        for message_id in [m for m, p in self.polls.items() if p.guild_id == guild_id]:
+            self.polls.pop(message_id)
+            task = self._edits.pop(message_id, None)
+            if task is not None:
+                task.cancel()
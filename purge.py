@@ -0,0 +1,156 @@
+"""Szűrhető, nagy áteresztőképességű üzenettörlés.
+
+A csatorna előzményeit 100-as lapokban olvassa (ennyi az API maximuma),
+a szűrőnek megfelelő, 14 napnál fiatalabb üzeneteket 100-as kötegekben
+bulk delete-tel törli, a régebbieket pedig egyenként, lassítva.
+"""
+
+import asyncio
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Awaitable, Callable, Optional
+
+import discord
+
+
+BULK_DELETE_MAX = 100
+BULK_DELETE_MAX_AGE = timedelta(days=14) - timedelta(minutes=5)  # biztonsági ráhagyás
+OLD_DELETE_DELAY = 1.0
+PROGRESS_INTERVAL = 1.5
+SCAN_FACTOR = 10
+MAX_SCAN = 20000
+
+LINK_RE = re.compile(r"https?://\S+|discord\.gg/\S+", re.IGNORECASE)
+
+@dataclass
+class PurgeFilter:
+    user_id: Optional[int] = None
+    pattern: Optional[re.Pattern] = None
+    bots_only: bool = False
+    has_links: bool = False
+    has_attachments: bool = False
+
+    def matches(self, msg: discord.Message) -> bool:
+        if msg.pinned:
+            return False
+        if self.user_id is not None and msg.author.id != self.user_id:
+            return False
+        if self.bots_only and not msg.author.bot:
+            return False
+        if self.has_links and not LINK_RE.search(msg.content):
+            return False
+        if self.has_attachments and not msg.attachments:
+            return False
+        if self.pattern is not None and not self.pattern.search(msg.content):
+            return False
+        return True
+
+    def describe(self) -> str:
+        parts = []
+        if self.user_id is not None:
+            parts.append(f"felhasználó: <@{self.user_id}>")
+        if self.pattern is not None:
+            parts.append(f"regex: `{self.pattern.pattern}`")
+        if self.bots_only:
+            parts.append("csak botok")
+        if self.has_links:
+            parts.append("linket tartalmaz")
+        if self.has_attachments:
+            parts.append("csatolmányt tartalmaz")
+        return ", ".join(parts) or "nincs"
+
+@dataclass
+class PurgeStats:
+    limit: int
+    scanned: int = 0
+    bulk_deleted: int = 0
+    single_deleted: int = 0
+    failed: int = 0
+    started: float = field(default_factory=time.monotonic)
+
+    @property
+    def deleted(self) -> int:
+        return self.bulk_deleted + self.single_deleted
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    @property
+    def rate(self) -> float:
+        return self.deleted / self.elapsed if self.elapsed > 0 else 0.0
+
+    def progress_text(self) -> str:
+        return (f"🧹 Törlés folyamatban: {self.deleted}/{self.limit} törölve, {self.scanned} átnézve "
+                f"({self.rate:.1f} üzenet/mp)")
+
+_channel_locks: dict[int, asyncio.Lock] = {}
+
+def is_running(channel_id: int) -> bool:
+    lock = _channel_locks.get(channel_id)
+    return lock is not None and lock.locked()
+
+async def purge_channel(channel: discord.TextChannel, limit: int, flt: PurgeFilter, *,
+                        before: Optional[int] = None, after: Optional[int] = None,
+                        on_progress: Optional[Callable[[PurgeStats], Awaitable[None]]] = None) -> PurgeStats:
+    """Legfeljebb `limit` szűrőnek megfelelő üzenet törlése (legújabbtól visszafelé)."""
+    stats = PurgeStats(limit=limit)
+    lock = _channel_locks.setdefault(channel.id, asyncio.Lock())
+    reporter = None
+
+    async def report():
+        while True:
+            await asyncio.sleep(PROGRESS_INTERVAL)
+            await on_progress(stats)
+
+    async def flush(batch: list[discord.Message]):
+        if not batch:
+            return
+        try:
+            await channel.delete_messages(batch)
+            stats.bulk_deleted += len(batch)
+        except discord.HTTPException:
+            stats.failed += len(batch)
+        batch.clear()
+
+    async with lock:
+        if on_progress:
+            reporter = asyncio.create_task(report())
+        try:
+            cutoff = discord.utils.utcnow() - BULK_DELETE_MAX_AGE
+            batch: list[discord.Message] = []
+            queued = 0
+            max_scan = min(MAX_SCAN, limit * SCAN_FACTOR)
+            history = channel.history(
+                limit=max_scan,
+                before=discord.Object(id=before) if before else None,
+                after=discord.Object(id=after) if after else None,
+                oldest_first=False,
+            )
+            async for msg in history:
+                stats.scanned += 1
+                if not flt.matches(msg):
+                    continue
+                queued += 1
+                if msg.created_at > cutoff:
+                    batch.append(msg)
+                    if len(batch) >= BULK_DELETE_MAX:
+                        await flush(batch)
+                else:
+                    # 14 napnál régebbi: csak egyenként törölhető, külön (szigorúbb) rate limittel.
+                    await flush(batch)
+                    try:
+                        await msg.delete()
+                        stats.single_deleted += 1
+                    except discord.HTTPException:
+                        stats.failed += 1
+                    await asyncio.sleep(OLD_DELETE_DELAY)
+                if queued >= limit:
+                    break
+            await flush(batch)
+        finally:
+            if reporter:
+                reporter.cancel()
+    return stats
@@ -0,0 +1,128 @@
+"""Token bucket alapú parancs-korlátozás (felhasználó / csatorna / szerver szinten).
+
+A korlátokat parancsonként a `@limit(...)` decorator adja meg (az
+`@app_commands.command` fölött). Egy vödör állapota egyetlen szám: az az
+időpont, amikorra újra tele lesz. A feltöltés így lusta (hozzáféréskor
+számoljuk), a tele vödör pedig egyszerűen törölhető, mert egyenértékű a
+hiányzóval; a tétlen vödröket időnként egy söprés takarítja.
+
+Az elutasítás a parancsfában, az argumentumok feldolgozása előtt történik
+(`ThrottledTree`). Ablakonként csak az első elutasításra megy (ephemeral)
+válasz; az ismételt próbálkozások REST hívás nélkül esnek el.
+"""
+
+import os
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import discord
+from discord import app_commands
+
+import metrics
+
+
+RATE_LIMITS_ENABLED = os.environ.get("RATE_LIMITS", "1") != "0"
+SWEEP_INTERVAL = 60.0
+EPSILON = 1e-9  # a tört intervallumok összegének kerekítési hibája ne vegyen el egy tokent
+
+@dataclass(frozen=True, slots=True)
+class Limit:
+    rate: int  # vödör mérete (ennyi hívás ...)
+    per: float  # ... ennyi másodperc alatt töltődik vissza
+
+    @property
+    def interval(self) -> float:
+        return self.per / self.rate
+
+@dataclass(frozen=True, slots=True)
+class CommandLimits:
+    bucket: str  # több parancs közös vödröt is használhat
+    limits: dict[str, Limit]
+
+@dataclass(frozen=True, slots=True)
+class Rejection:
+    scope: str
+    retry_after: float
+    notify: bool  # kell-e válaszolni (ablakonként csak egyszer)
+
+class RateLimiter:
+    def __init__(self) -> None:
+        self.buckets: dict[tuple[str, str, int], float] = {}  # (vödör, scope, ID) -> mikorra lesz tele
+        self._notified: dict[tuple[str, int], float] = {}  # (vödör, felhasználó) -> eddig nem jelzünk újra
+        self._next_sweep = 0.0
+
+    def hit(self, config: CommandLimits, ids: dict[str, Optional[int]], now: Optional[float] = None) -> Optional[Rejection]:
+        """Egy token minden érintett vödörből; ha bármelyik üres, egyikből sem von le."""
+        now = time.monotonic() if now is None else now
+        if now >= self._next_sweep:
+            self.sweep(now)
+        updates = []
+        rejected: Optional[tuple[str, float]] = None
+        for scope, limit in config.limits.items():
+            target = ids.get(scope)
+            if target is None:
+                continue  # pl. DM-ben nincs szerver
+            key = (config.bucket, scope, target)
+            full_at = max(self.buckets.get(key, now), now)
+            # Tele vödörnél full_at == now; minden felhasznált token `interval`-lal tolja ki.
+            wait = full_at - now - (limit.per - limit.interval)
+            if wait > EPSILON:
+                if rejected is None or wait > rejected[1]:
+                    rejected = (scope, wait)
+            else:
+                updates.append((key, full_at + limit.interval))
+        if rejected is None:
+            self.buckets.update(updates)
+            return None
+        scope, wait = rejected
+        user_key = (config.bucket, ids.get("user") or 0)
+        notify = self._notified.get(user_key, 0.0) <= now
+        if notify:
+            self._notified[user_key] = now + wait
+        return Rejection(scope, wait, notify)
+
+    def sweep(self, now: float) -> None:
+        """A tele (tétlen) vödrök és a lejárt jelzések törlése."""
+        self.buckets = {k: t for k, t in self.buckets.items() if t > now}
+        self._notified = {k: t for k, t in self._notified.items() if t > now}
+        self._next_sweep = now + SWEEP_INTERVAL
+
+limiter = RateLimiter()
+
+def limit(*, user: Optional[tuple[int, float]] = None, channel: Optional[tuple[int, float]] = None,
+          guild: Optional[tuple[int, float]] = None, bucket: Optional[str] = None):
+    """Decorator: (hívás, mp) korlátok hatókörönként, pl. `@limit(user=(3, 10), channel=(10, 30))`."""
+    specs = {"user": user, "channel": channel, "guild": guild}
+    limits = {scope: Limit(*spec) for scope, spec in specs.items() if spec}
+
+    def decorator(command: app_commands.Command) -> app_commands.Command:
+        if not isinstance(command, app_commands.Command):
+            raise TypeError("A @limit az @app_commands.command fölé kerüljön")
+        command.extras["ratelimit"] = CommandLimits(bucket or command.qualified_name, limits)
+        return command
+    return decorator
+
+SCOPE_TEXT = {
+    "user": "Túl gyorsan használod ezt a parancsot",
+    "channel": "Ebben a csatornában most túl sokszor futott ez a parancs",
+    "guild": "Ezen a szerveren most túl sokszor futott ez a parancs",
+}
+
+class ThrottledTree(metrics.InstrumentedTree):
+    """A korlátozott parancsokat a parancsfa szintjén, a kezelő és az argumentumok előtt szűri."""
+
+    async def interaction_check(self, interaction: discord.Interaction, /) -> bool:
+        command = interaction.command if interaction.type is discord.InteractionType.application_command else None
+        config: Optional[CommandLimits] = command.extras.get("ratelimit") if command is not None else None
+        if config is not None and RATE_LIMITS_ENABLED:
+            ids = {"user": interaction.user.id, "channel": interaction.channel_id, "guild": interaction.guild_id}
+            rejection = limiter.hit(config, ids)
+            if rejection is not None:
+                metrics.registry.record_throttled(command.qualified_name, rejection.scope)
+                if rejection.notify:
+                    await interaction.response.send_message(
+                        f"⏳ {SCOPE_TEXT[rejection.scope]}, próbáld újra {max(1, round(rejection.retry_after))} mp múlva.",
+                        ephemeral=True)
+                return False
+        return await super().interaction_check(interaction)
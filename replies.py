@@ -0,0 +1,78 @@
+"""Közös válaszréteg slash parancsokhoz: automatikus halasztás a 3 mp-es határidő előtt.
+
+Egy `Reply` az interakció létrehozásától méri az időt. Ha a kezelő (REST
+munka miatt) `DEFER_MARGIN` másodpercre megközelíti a határidőt és még nem
+válaszolt, magától halaszt ("gondolkodik..."). A kezelő ezután is csak
+`reply.send`-et hív: az első válasz a halasztott üzenetet cseréli le, a
+többi followupként megy, így a hibaágak sem válaszolnak kétszer ugyanarra
+az interakcióra. Az automatikus halasztások parancsonként számolódnak.
+"""
+
+import asyncio
+from typing import Optional
+
+import discord
+
+import metrics
+
+
+DEFER_MARGIN = 1.0  # ennyivel a határidő előtt halasztunk (a defer kérésnek is át kell érnie)
+
+class Reply:
+    def __init__(self, interaction: discord.Interaction, *, ephemeral: bool = False,
+                 margin: float = DEFER_MARGIN) -> None:
+        self.interaction = interaction
+        self.ephemeral = ephemeral  # a halasztott üzenet láthatósága
+        self.auto_deferred = False
+        self._placeholder = False  # a halasztott üzenet még lecserélendő
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task] = None
+        interaction.extras["reply"] = self
+        if not interaction.response.is_done():
+            budget = metrics.INTERACTION_DEADLINE - margin
+            age = (discord.utils.utcnow() - interaction.created_at).total_seconds()
+            self._timer = asyncio.create_task(self._defer_later(min(budget, max(0.0, budget - age))))
+
+    async def _defer_later(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        async with self._lock:
+            inv = self.interaction.extras.get("invocation")
+            if self.interaction.response.is_done() or (inv is not None and inv.finished):
+                return
+            try:
+                await self.interaction.response.defer(ephemeral=self.ephemeral, thinking=True)
+            except discord.HTTPException:
+                return  # lejárt vagy közben megválaszolták
+            self.auto_deferred = self._placeholder = True
+            metrics.registry.record_auto_defer(self.interaction)
+
+    async def defer(self) -> None:
+        """Halasztás előre látható lassú munka előtt (ez nem számít automatikus halasztásnak)."""
+        async with self._lock:
+            if not self.interaction.response.is_done():
+                await self.interaction.response.defer(ephemeral=self.ephemeral, thinking=True)
+                self._placeholder = True
+
+    async def send(self, content: Optional[str] = None, *, ephemeral: bool = False, **kwargs) -> None:
+        """Válasz a megfelelő úton: első válasz, halasztott üzenet cseréje vagy followup."""
+        async with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            response = self.interaction.response
+            if not response.is_done():
+                await response.send_message(content, ephemeral=ephemeral, **kwargs)
+            elif self._placeholder:
+                self._placeholder = False
+                if ephemeral == self.ephemeral:
+                    await self.interaction.edit_original_response(content=content, **kwargs)
+                else:
+                    # A halasztott üzenet láthatósága utólag nem változtatható: helyette followup.
+                    await self.interaction.delete_original_response()
+                    await self.interaction.followup.send(content, ephemeral=ephemeral, **kwargs)
+            else:
+                await self.interaction.followup.send(content, ephemeral=ephemeral, **kwargs)
+
+def reply_for(interaction: discord.Interaction) -> Reply:
+    """A kezelő `Reply`-ja, vagy egy új (pl. a hibakezelőnek, ha a kezelő nem használt ilyet)."""
+    return interaction.extras.get("reply") or Reply(interaction)
@@ -0,0 +1,193 @@
+"""Biztonságos matematikai kifejezés kiértékelő a `/math` parancshoz.
+
+Nincs `eval`: a kifejezést az `ast` modul elemzi, és csak a
+whitelistelt csomópontokat értékeljük ki egy költségmodell mellett
+(műveletszám, kitevő, számnagyság és faktoriális korlát). A kiértékelés
+egy külön folyamatban fut kemény időkorláttal, így az event loop és a
+gateway heartbeat sosem áll meg.
+"""
+
+import ast
+import asyncio
+import math
+import multiprocessing
+import operator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Union
+
+
+MAX_EXPR_LENGTH = 200
+MAX_OPERATIONS = 200
+MAX_EXPONENT = 1000
+MAX_INT_BITS = 4096
+MAX_FACTORIAL = 300
+TIME_LIMIT = 2.0
+
+Number = Union[int, float]
+
+class MathError(ValueError):
+    """A felhasználónak megjeleníthető kiértékelési hiba."""
+
+def _factorial(x: Number) -> int:
+    if not float(x).is_integer() or x < 0:
+        raise MathError("A faktoriális csak nemnegatív egészre értelmezett.")
+    if x > MAX_FACTORIAL:
+        raise MathError(f"A faktoriális legfeljebb {MAX_FACTORIAL}!-ig engedélyezett.")
+    return math.factorial(int(x))
+
+FUNCTIONS = {
+    "sqrt": math.sqrt, "cbrt": lambda x: math.copysign(abs(x) ** (1 / 3), x),
+    "sin": math.sin, "cos": math.cos, "tan": math.tan,
+    "asin": math.asin, "acos": math.acos, "atan": math.atan,
+    "log": math.log, "ln": math.log, "log10": math.log10, "log2": math.log2,
+    "exp": math.exp, "abs": abs, "floor": math.floor, "ceil": math.ceil,
+    "round": round, "fact": _factorial, "deg": math.degrees, "rad": math.radians,
+    "min": min, "max": max, "gcd": math.gcd, "hypot": math.hypot,
+}
+CONSTANTS = {"pi": math.pi, "e": math.e, "tau": math.tau}
+
+BIN_OPS = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+    ast.Div: operator.truediv, ast.FloorDiv: operator.floordiv, ast.Mod: operator.mod,
+}
+UNARY_OPS = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+
+class Evaluator:
+    def __init__(self) -> None:
+        self.operations = 0
+
+    def _tick(self) -> None:
+        self.operations += 1
+        if self.operations > MAX_OPERATIONS:
+            raise MathError("A kifejezés túl sok műveletet tartalmaz.")
+
+    def _check(self, value: Number) -> Number:
+        if isinstance(value, int) and value.bit_length() > MAX_INT_BITS:
+            raise MathError("Az eredmény túl nagy.")
+        if isinstance(value, float) and math.isinf(value):
+            raise MathError("Az eredmény túl nagy.")
+        return value
+
+    def eval(self, node: ast.AST) -> Number:
+        self._tick()
+        if isinstance(node, ast.Expression):
+            return self.eval(node.body)
+        if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+            return self._check(node.value)
+        if isinstance(node, ast.Name):
+            if node.id in CONSTANTS:
+                return CONSTANTS[node.id]
+            raise MathError(f"Ismeretlen név: {node.id}")
+        if isinstance(node, ast.UnaryOp) and type(node.op) in UNARY_OPS:
+            return UNARY_OPS[type(node.op)](self.eval(node.operand))
+        if isinstance(node, ast.BinOp):
+            left = self.eval(node.left)
+            right = self.eval(node.right)
+            if isinstance(node.op, ast.Pow):
+                return self._pow(left, right)
+            op = BIN_OPS.get(type(node.op))
+            if op is None:
+                raise MathError("Nem engedélyezett művelet.")
+            if isinstance(node.op, ast.Mult) and isinstance(left, int) and isinstance(right, int):
+                if left.bit_length() + right.bit_length() > MAX_INT_BITS + 1:
+                    raise MathError("Az eredmény túl nagy.")
+            try:
+                return self._check(op(left, right))
+            except ZeroDivisionError:
+                raise MathError("Nullával való osztás.")
+            except (OverflowError, ValueError):
+                # Pl. nagy egész és float keverése: a float konverzió túlcsordul.
+                raise MathError("Az eredmény túl nagy.")
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and not node.keywords:
+            fn = FUNCTIONS.get(node.func.id)
+            if fn is None:
+                raise MathError(f"Ismeretlen függvény: {node.func.id}")
+            args = [self.eval(a) for a in node.args]
+            try:
+                return self._check(fn(*args))
+            except (TypeError, ValueError, OverflowError) as e:
+                if isinstance(e, MathError):
+                    raise
+                raise MathError(f"Hibás argumentum: {node.func.id}()")
+        raise MathError("Nem engedélyezett kifejezés.")
+
+    def _pow(self, base: Number, exp: Number) -> Number:
+        if abs(exp) > MAX_EXPONENT:
+            raise MathError(f"A kitevő legfeljebb {MAX_EXPONENT} lehet.")
+        if isinstance(base, int) and isinstance(exp, int) and exp > 0:
+            # Az eredmény bitszáma előre becsülhető: ne számoljunk ki óriási egészt.
+            if base.bit_length() * exp > MAX_INT_BITS:
+                raise MathError("Az eredmény túl nagy.")
+        try:
+            result = base ** exp
+        except OverflowError:
+            raise MathError("Az eredmény túl nagy.")
+        except ZeroDivisionError:
+            raise MathError("Nullával való osztás.")
+        if isinstance(result, complex):
+            raise MathError("Az eredmény nem valós szám.")
+        return self._check(result)
+
+def parse(expr: str) -> ast.Expression:
+    if len(expr) > MAX_EXPR_LENGTH:
+        raise MathError(f"A kifejezés legfeljebb {MAX_EXPR_LENGTH} karakter lehet.")
+    # A `^` a megszokott hatványozás jele, a `×` / `÷` is elfogadott.
+    expr = expr.replace("^", "**").replace("×", "*").replace("÷", "/")
+    try:
+        return ast.parse(expr, mode="eval")
+    except SyntaxError:
+        raise MathError("Hibás kifejezés.")
+
+def evaluate(expr: str) -> Number:
+    """Szinkron kiértékelés (a worker folyamatban fut)."""
+    return Evaluator().eval(parse(expr))
+
+def format_result(value: Number) -> str:
+    if isinstance(value, float):
+        if value.is_integer() and abs(value) < 1e16:
+            return str(int(value))
+        return f"{value:.12g}"
+    text = str(value)
+    return text if len(text) <= 1500 else f"{text[:40]}…{text[-40:]} ({len(text)} számjegy)"
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # fork helyett forkserver: a többszálú bot folyamat (napló listener, SQLite szál)
+        # másolata örökölhetne egy épp foglalt lockot, és a worker beragadna.
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        _pool = ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context(method))
+    return _pool
+
+def _kill_pool() -> None:
+    """Időtúllépéskor a workert leállítjuk (egy szálat nem lehetne megszakítani)."""
+    global _pool
+    pool, _pool = _pool, None
+    if pool is None:
+        return
+    for proc in list(getattr(pool, "_processes", {}).values()):
+        proc.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+async def evaluate_async(expr: str, timeout: float = TIME_LIMIT) -> str:
+    # Elemzési hibát helyben, olcsón jelzünk; csak az érvényes fa megy a workerhez.
+    parse(expr)
+    loop = asyncio.get_running_loop()
+    try:
+        value = await asyncio.wait_for(loop.run_in_executor(_get_pool(), evaluate, expr), timeout)
+    except asyncio.TimeoutError:
+        _kill_pool()
+        raise MathError("A számítás túllépte az időkorlátot.")
+    except BrokenProcessPool:
+        _kill_pool()
+        raise MathError("A számítás sikertelen, próbáld újra.")
+    return format_result(value)
+
+def shutdown() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
@@ -0,0 +1,203 @@
+"""Perzisztens időzítő szolgáltatás (visszaszámlálások, lejáró némítások, ...).
+
+Az összes időzített feladat egyetlen min-heapben van, és egyetlen task
+alszik a legkorábbi esedékességig. A feladatok SQLite-ban is megvannak,
+így újraindítás után folytatódnak; a leállás alatt lejártakat az első
+körben pótolja. Az egyszerre lejáró feladatok kötegben, párhuzamosan
+futnak. Egy handler visszaadhat egy új időpontot: ekkor a feladat
+újraütemeződik (pl. a következő szerkesztésre).
+
+Ha a handler kivételt dob, a feladat exponenciális várakozással újra
+lefut (`MAX_ATTEMPTS`-ig); csak a végleges hibák (`is_permanent`) és a
+kimerült próbálkozások után törlődik, így pl. egy átmeneti 5xx miatt nem
+marad valaki örökre kitiltva.
+"""
+
+import asyncio
+import heapq
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+from storage import Database
+
+
+log = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    due REAL NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_due ON jobs (due);
+"""
+
+BATCH_SIZE = 100
+UNKNOWN_KIND_RETRY = 60  # mp; a kezelő nélküli feladatok nem vesznek el
+MAX_ATTEMPTS = 12
+RETRY_BASE = 30.0  # mp; minden sikertelen próbálkozás után duplázódik ...
+RETRY_MAX = 3600.0  # ... eddig (12 próbálkozás ≈ 5 óra)
+WRITE_RETRY = 5.0  # mp; sikertelen DB írás után ennyit vár a dispatcher
+
+@dataclass
+class Job:
+    id: int
+    kind: str
+    due: float  # unix időbélyeg
+    payload: dict[str, Any]
+
+# A handler None-t ad vissza, ha a feladat kész, különben a következő esedékességet.
+Handler = Callable[[Job], Awaitable[Optional[float]]]
+
+class Scheduler:
+    def __init__(self, db: Database, *, is_permanent: Callable[[Exception], bool] = lambda exc: False) -> None:
+        self.db = db
+        self.is_permanent = is_permanent  # ezekre a hibákra nincs újrapróbálás
+        self.handlers: dict[str, Handler] = {}
+        self.jobs: dict[int, Job] = {}
+        self._heap: list[tuple[float, int]] = []
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        # Ki nem írt DB változások (sikertelen írás után a következő köteggel mennek)
+        self._unsaved_done: list[tuple[int]] = []
+        self._unsaved_rescheduled: list[tuple[float, str, int]] = []
+
+    def register(self, kind: str, handler: Handler) -> None:
+        self.handlers[kind] = handler
+
+    async def start(self, wait_until_ready: Optional[Callable[[], Awaitable[Any]]] = None,
+                    owns: Optional[Callable[[Job], bool]] = None) -> None:
+        """Betölti a tárolt feladatokat; több folyamatnál `owns` szűri a sajátjainkra."""
+        await self.db.executescript(SCHEMA)
+        rows = await self.db.fetchall("SELECT id, kind, due, payload FROM jobs")
+        for job_id, kind, due, payload in rows:
+            job = Job(job_id, kind, due, json.loads(payload))
+            if owns is None or owns(job):
+                self._push(job)
+        self._task = asyncio.create_task(self._run(wait_until_ready), name="scheduler")
+
+    async def close(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    def _push(self, job: Job) -> None:
+        self.jobs[job.id] = job
+        heapq.heappush(self._heap, (job.due, job.id))
+
+    async def schedule(self, kind: str, due: float, payload: dict[str, Any]) -> int:
+        def insert(conn):
+            cur = conn.execute("INSERT INTO jobs (kind, due, payload) VALUES (?, ?, ?)",
+                               (kind, due, json.dumps(payload)))
+            return cur.lastrowid
+        job_id = await self.db.run(insert)
+        self._push(Job(job_id, kind, due, payload))
+        self._wake.set()
+        return job_id
+
+    async def cancel(self, job_id: int) -> bool:
+        # A heap bejegyzés bent marad, a dispatcher kihagyja (lusta törlés).
+        if self.jobs.pop(job_id, None) is None:
+            return False
+        await self.db.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+        return True
+
+    def find(self, kind: str, **match: Any) -> list[Job]:
+        return [j for j in self.jobs.values()
+                if j.kind == kind and all(j.payload.get(k) == v for k, v in match.items())]
+
+    def pending(self) -> int:
+        return len(self.jobs)
+
+    async def _run(self, wait_until_ready: Optional[Callable[[], Awaitable[Any]]]) -> None:
+        if wait_until_ready is not None:
+            # A handlerek a szerver cache-re építenek: csak READY után indulunk.
+            await wait_until_ready()
+        overdue = sum(1 for j in self.jobs.values() if j.due <= time.time())
+        if overdue:
+            log.info("%d lejárt feladat pótlása indításkor", overdue)
+        while True:
+            self._wake.clear()
+            while self._heap and self._heap[0][1] not in self.jobs:
+                heapq.heappop(self._heap)
+            timeout = max(0.0, self._heap[0][0] - time.time()) if self._heap else None
+            if timeout is None or timeout > 0:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+                    continue  # új feladat érkezett: újraszámoljuk a legkorábbit
+                except asyncio.TimeoutError:
+                    pass
+            try:
+                await self._execute_batch(self._pop_due())
+            except Exception:
+                # Egy sikertelen írás ne állítsa le az összes időzítőt.
+                log.exception("Az időzített feladatok mentése sikertelen, újrapróbálás %d mp múlva", WRITE_RETRY)
+                await asyncio.sleep(WRITE_RETRY)
+
+    def _pop_due(self) -> list[Job]:
+        """Az összes esedékes feladat kivétele (legfeljebb BATCH_SIZE)."""
+        now = time.time()
+        batch = []
+        while self._heap and self._heap[0][0] <= now and len(batch) < BATCH_SIZE:
+            due, job_id = heapq.heappop(self._heap)
+            job = self.jobs.get(job_id)
+            if job is not None and job.due == due:
+                batch.append(job)
+        return batch
+
+    async def _execute_batch(self, batch: list[Job]) -> None:
+        """Egyszerre lejáró feladatok párhuzamos futtatása, egy tranzakciós DB frissítéssel."""
+        if not batch and not self._unsaved_done and not self._unsaved_rescheduled:
+            return
+        results = await asyncio.gather(*(self._call_handler(job) for job in batch))
+        done, self._unsaved_done = self._unsaved_done, []
+        rescheduled, self._unsaved_rescheduled = self._unsaved_rescheduled, []
+        for job, next_due in zip(batch, results):
+            if job.id not in self.jobs:
+                continue  # a handler közben törölte
+            if next_due is None:
+                self.jobs.pop(job.id, None)
+                done.append((job.id,))
+            else:
+                job.due = next_due
+                heapq.heappush(self._heap, (job.due, job.id))
+                rescheduled.append((job.due, json.dumps(job.payload), job.id))
+
+        def write(conn):
+            conn.executemany("DELETE FROM jobs WHERE id = ?", done)
+            conn.executemany("UPDATE jobs SET due = ?, payload = ? WHERE id = ?", rescheduled)
+        try:
+            await self.db.run(write)
+        except Exception:
+            self._unsaved_done = done + self._unsaved_done
+            self._unsaved_rescheduled = rescheduled + self._unsaved_rescheduled
+            raise
+
+    async def _call_handler(self, job: Job) -> Optional[float]:
+        handler = self.handlers.get(job.kind)
+        if handler is None:
+            # Pl. a kezelőt regisztráló bővítmény épp újratöltés alatt van: később újra próbáljuk.
+            log.warning("Ismeretlen feladat típus: %s (id=%s), újrapróbálás %d mp múlva", job.kind, job.id, UNKNOWN_KIND_RETRY)
+            return time.time() + UNKNOWN_KIND_RETRY
+        try:
+            next_due = await handler(job)
+        except Exception as exc:
+            return self._retry_due(job, exc)
+        job.payload.pop("attempts", None)
+        return next_due
+
+    def _retry_due(self, job: Job, exc: Exception) -> Optional[float]:
+        """Újrapróbálás időpontja exponenciális várakozással; None, ha feladjuk."""
+        attempts = job.payload.get("attempts", 0) + 1
+        if self.is_permanent(exc) or attempts >= MAX_ATTEMPTS:
+            log.error("A(z) %s feladat végleg sikertelen (id=%s, %d. próbálkozás)", job.kind, job.id, attempts, exc_info=exc)
+            return None
+        delay = min(RETRY_MAX, RETRY_BASE * 2 ** (attempts - 1))
+        job.payload["attempts"] = attempts
+        log.warning("Hiba a(z) %s feladat futtatásakor (id=%s), újrapróbálás %d mp múlva (%d. próbálkozás)",
+                    job.kind, job.id, delay, attempts, exc_info=exc)
+        return time.time() + delay
@@ -0,0 +1,71 @@
+"""Helyi SQLite tároló a perzisztens állapothoz (figyelmeztetések, időzítők, ...).
+
+Egyetlen kapcsolatot használ WAL módban; minden lekérdezés egy worker szálon
+fut (`asyncio.to_thread`), így a lemezművelet sosem blokkolja az event loopot.
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+from typing import Any, Callable, Iterable, Optional, TypeVar
+
+
+DB_PATH = os.environ.get("BOT_DB_PATH", "bot.db")
+
+T = TypeVar("T")
+
+class Database:
+    def __init__(self, path: str = DB_PATH) -> None:
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        return conn
+
+    def _call(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._connect()
+            with self._conn:
+                return fn(self._conn)
+
+    async def run(self, fn: Callable[[sqlite3.Connection], T]) -> T:
+        """`fn(conn)` futtatása egy tranzakcióban, worker szálon."""
+        return await asyncio.to_thread(self._call, fn)
+
+    async def execute(self, sql: str, params: Iterable[Any] = ()) -> None:
+        await self.run(lambda c: c.execute(sql, tuple(params)))
+
+    async def executemany(self, sql: str, rows: list[tuple]) -> None:
+        if rows:
+            await self.run(lambda c: c.executemany(sql, rows))
+
+    async def executescript(self, sql: str) -> None:
+        await self.run(lambda c: c.executescript(sql))
+
+    async def fetchall(self, sql: str, params: Iterable[Any] = ()) -> list[tuple]:
+        return await self.run(lambda c: c.execute(sql, tuple(params)).fetchall())
+
+    async def fetchone(self, sql: str, params: Iterable[Any] = ()) -> Optional[tuple]:
+        return await self.run(lambda c: c.execute(sql, tuple(params)).fetchone())
+
+    async def get_meta(self, key: str) -> Optional[str]:
+        """Egyszerű kulcs-érték tároló apróságokhoz (pl. a parancsfa hash-e)."""
+        row = await self.fetchone("SELECT value FROM meta WHERE key = ?", (key,))
+        return row[0] if row else None
+
+    async def set_meta(self, key: str, value: str) -> None:
+        await self.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
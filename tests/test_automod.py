@@ -0,0 +1,24 @@
+from automod import SlidingWindow
+
+
+def test_window_fills_after_size_events():
+    w = SlidingWindow(3)
+    assert not w.hit(1.0, window=5.0)
+    assert not w.hit(2.0, window=5.0)
+    assert w.hit(3.0, window=5.0)
+
+def test_window_only_counts_recent_events():
+    w = SlidingWindow(3)
+    for t in (1.0, 2.0, 3.0):
+        w.hit(t, window=5.0)
+    # Mindig a 3 utolsó közül a legrégebbi számít: 6.5-nél ez 2.0, 9.0-nál 3.0.
+    assert w.hit(6.5, window=5.0)
+    assert not w.hit(9.0, window=5.0)
+    assert not w.hit(20.0, window=5.0)
+
+def test_reset_clears_history():
+    w = SlidingWindow(2)
+    w.hit(1.0, window=5.0)
+    assert w.hit(1.5, window=5.0)
+    w.reset()
+    assert not w.hit(2.0, window=5.0)
@@ -0,0 +1,28 @@
+from types import SimpleNamespace
+
+from guildstats import StatsIndex
+
+
+def fake_guild(chunked=True):
+    return SimpleNamespace(id=1, chunked=chunked, members=[], channels=[])
+
+def test_full_cache_index_never_expires():
+    index = StatsIndex()
+    guild = fake_guild()
+    stats = index.get(guild)
+    stats.built_at -= 10_000
+    assert index.get(guild) is stats
+    assert index.builds == 1
+
+def test_partial_cache_index_expires_and_needs_chunk():
+    index = StatsIndex(max_age=600)
+    guild = fake_guild()
+    stats = index.get(guild)
+    assert index.get(guild) is stats
+    stats.built_at -= 601
+    guild.chunked = False
+    # Elavult, és a taglista már nem teljes: chunkolás kell az újraépítéshez.
+    assert index.get(guild) is None
+    guild.chunked = True
+    assert index.get(guild) is not stats
+    assert index.builds == 2
@@ -0,0 +1,37 @@
+import asyncio
+import sqlite3
+
+import pytest
+
+from polls import Poll, PollManager
+from storage import Database
+
+
+def test_finish_keeps_poll_open_when_write_fails(tmp_path):
+    async def run():
+        db = Database(str(tmp_path / "polls.db"))
+        manager = PollManager(db)
+        await manager.start()
+        await manager.create(Poll(1, 10, 20, 30, "?", ["a", "b"], closes_at=0.0))
+        manager.vote(1, 99, 0)
+
+        execute = db.execute
+        async def failing(sql, params=()):
+            if sql.startswith("UPDATE polls"):
+                raise sqlite3.OperationalError("database is locked")
+            await execute(sql, params)
+        db.execute = failing
+        with pytest.raises(sqlite3.OperationalError):
+            await manager.finish(1)
+        # Az újrapróbálkozás még megtalálja, és a szavazás addig is nyitva van.
+        assert 1 in manager.polls and not manager.polls[1].closed
+
+        db.execute = execute
+        poll = await manager.finish(1)
+        await manager.close()
+        assert poll is not None and poll.closed and poll.counts == [1, 0]
+        assert 1 not in manager.polls
+        assert await db.fetchone("SELECT closed FROM polls WHERE message_id = 1") == (1,)
+        assert await db.fetchall("SELECT user_id, option FROM poll_votes") == [(99, 0)]
+
+    asyncio.run(run())
@@ -0,0 +1,70 @@
+import pytest
+
+from ratelimit import CommandLimits, Limit, RateLimiter
+
+
+def limits(**scopes):
+    return CommandLimits("cmd", {scope: Limit(*spec) for scope, spec in scopes.items()})
+
+def test_burst_then_refill():
+    rl = RateLimiter()
+    cfg = limits(user=(3, 10))
+    ids = {"user": 1}
+    assert all(rl.hit(cfg, ids, now=100.0) is None for _ in range(3))
+    rejection = rl.hit(cfg, ids, now=100.0)
+    assert rejection is not None and rejection.scope == "user"
+    assert rejection.retry_after == pytest.approx(10 / 3)
+    # Egy token 10/3 mp alatt töltődik vissza.
+    assert rl.hit(cfg, ids, now=103.0) is not None
+    assert rl.hit(cfg, ids, now=103.4) is None
+    assert rl.hit(cfg, ids, now=103.4) is not None
+    # Tétlenség után újra teljes a vödör.
+    assert all(rl.hit(cfg, ids, now=200.0) is None for _ in range(3))
+
+@pytest.mark.parametrize("rate, per", [(3, 10), (5, 10), (10, 30), (7, 1)])
+def test_full_burst_despite_float_rounding(rate, per):
+    rl = RateLimiter()
+    cfg = limits(user=(rate, per))
+    assert all(rl.hit(cfg, {"user": 1}, now=200.0) is None for _ in range(rate))
+    assert rl.hit(cfg, {"user": 1}, now=200.0) is not None
+
+def test_users_have_separate_buckets():
+    rl = RateLimiter()
+    cfg = limits(user=(1, 10))
+    assert rl.hit(cfg, {"user": 1}, now=0.0) is None
+    assert rl.hit(cfg, {"user": 1}, now=0.0) is not None
+    assert rl.hit(cfg, {"user": 2}, now=0.0) is None
+
+def test_rejection_consumes_no_tokens():
+    rl = RateLimiter()
+    cfg = limits(user=(5, 10), channel=(2, 10))
+    for user in (1, 2):
+        assert rl.hit(cfg, {"user": user, "channel": 7}, now=0.0) is None
+    rejection = rl.hit(cfg, {"user": 3, "channel": 7}, now=0.0)
+    assert rejection.scope == "channel"
+    # A 3. felhasználó vödre érintetlen maradt: más csatornákban még 5-öt hívhat.
+    assert all(rl.hit(cfg, {"user": 3, "channel": channel}, now=0.0) is None for channel in range(10, 15))
+    assert rl.hit(cfg, {"user": 3, "channel": 20}, now=0.0).scope == "user"
+
+def test_missing_scope_is_skipped():
+    rl = RateLimiter()
+    cfg = limits(user=(5, 10), guild=(1, 10))
+    assert rl.hit(cfg, {"user": 1, "guild": None}, now=0.0) is None
+    assert rl.hit(cfg, {"user": 1, "guild": None}, now=0.0) is None
+
+def test_notify_once_per_window():
+    rl = RateLimiter()
+    cfg = limits(user=(1, 10))
+    rl.hit(cfg, {"user": 1}, now=0.0)
+    assert rl.hit(cfg, {"user": 1}, now=0.0).notify
+    assert not rl.hit(cfg, {"user": 1}, now=5.0).notify
+    rl.hit(cfg, {"user": 1}, now=10.0)
+    assert rl.hit(cfg, {"user": 1}, now=10.0).notify
+
+def test_sweep_drops_full_buckets():
+    rl = RateLimiter()
+    cfg = limits(user=(2, 10))
+    rl.hit(cfg, {"user": 1}, now=0.0)
+    assert rl.buckets
+    rl.sweep(now=20.0)
+    assert not rl.buckets
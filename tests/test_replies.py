@@ -0,0 +1,110 @@
+import asyncio
+from datetime import timedelta
+
+import discord
+
+import replies
+
+
+class FakeResponse:
+    def __init__(self, calls):
+        self.calls = calls
+        self.done = False
+
+    def is_done(self):
+        return self.done
+
+    async def send_message(self, content=None, *, ephemeral=False, **kwargs):
+        self.done = True
+        self.calls.append(("send_message", content, ephemeral))
+
+    async def defer(self, *, ephemeral=False, thinking=False):
+        self.done = True
+        self.calls.append(("defer", None, ephemeral))
+
+class FakeFollowup:
+    def __init__(self, calls):
+        self.calls = calls
+
+    async def send(self, content=None, *, ephemeral=False, **kwargs):
+        self.calls.append(("followup", content, ephemeral))
+
+class FakeInteraction:
+    """Csak a `Reply` által használt felület; a hívások sorrendjét rögzíti."""
+
+    def __init__(self, age: float = 0.0):
+        self.calls = []
+        self.extras = {}
+        self.command = None
+        self.data = {"name": "teszt"}
+        self.created_at = discord.utils.utcnow() - timedelta(seconds=age)
+        self.response = FakeResponse(self.calls)
+        self.followup = FakeFollowup(self.calls)
+
+    async def edit_original_response(self, *, content=None, **kwargs):
+        self.calls.append(("edit_original", content, None))
+
+    async def delete_original_response(self):
+        self.calls.append(("delete_original", None, None))
+
+def run(coro):
+    return asyncio.run(coro)
+
+def test_error_before_any_reply_uses_handlers_reply():
+    async def scenario():
+        interaction = FakeInteraction()
+        reply = replies.Reply(interaction)
+        assert replies.reply_for(interaction) is reply
+        await replies.reply_for(interaction).send("hiba", ephemeral=True)
+        await asyncio.sleep(0)
+        return interaction.calls, reply._timer
+    calls, timer = run(scenario())
+    assert calls == [("send_message", "hiba", True)]
+    assert timer is None
+
+def test_error_after_public_defer_replaces_placeholder_with_ephemeral_followup():
+    async def scenario():
+        interaction = FakeInteraction()
+        reply = replies.Reply(interaction)
+        await reply.defer()
+        await replies.reply_for(interaction).send("hiba", ephemeral=True)
+        return interaction.calls
+    assert run(scenario()) == [("defer", None, False), ("delete_original", None, None), ("followup", "hiba", True)]
+
+def test_error_after_ephemeral_defer_edits_placeholder():
+    async def scenario():
+        interaction = FakeInteraction()
+        reply = replies.Reply(interaction, ephemeral=True)
+        await reply.defer()
+        await replies.reply_for(interaction).send("hiba", ephemeral=True)
+        return interaction.calls
+    assert run(scenario()) == [("defer", None, True), ("edit_original", "hiba", None)]
+
+def test_error_after_answer_goes_to_followup():
+    async def scenario():
+        interaction = FakeInteraction()
+        reply = replies.Reply(interaction)
+        await reply.send("kész")
+        await replies.reply_for(interaction).send("hiba", ephemeral=True)
+        return interaction.calls
+    assert run(scenario()) == [("send_message", "kész", False), ("followup", "hiba", True)]
+
+def test_auto_defer_near_deadline_then_error():
+    async def scenario():
+        # Már majdnem lejárt interakció: a halasztás azonnal megtörténik.
+        interaction = FakeInteraction(age=2.5)
+        reply = replies.Reply(interaction, margin=1.0)
+        await asyncio.sleep(0.05)
+        deferred = reply.auto_deferred
+        await replies.reply_for(interaction).send("hiba", ephemeral=True)
+        return deferred, interaction.calls
+    deferred, calls = run(scenario())
+    assert deferred
+    assert calls == [("defer", None, False), ("delete_original", None, None), ("followup", "hiba", True)]
+
+def test_reply_for_without_handler_reply():
+    async def scenario():
+        interaction = FakeInteraction()
+        await replies.reply_for(interaction).send("hiba", ephemeral=True)
+        return interaction.calls
+    assert run(scenario()) == [("send_message", "hiba", True)]
@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+import safemath
+from safemath import MathError, evaluate
+
+
+def test_basic_arithmetic():
+    assert evaluate("2^10") == 1024
+    assert evaluate("(1 + 2) * 3 - 4 / 2") == 7.0
+    assert evaluate("sqrt(16) + fact(5)") == 124.0
+    assert safemath.format_result(evaluate("2 * 0.5")) == "1"
+
+@pytest.mark.parametrize("expr", ["9**9**9", "9^9^9", "2^1001", "10^-1001"])
+def test_exponent_limit(expr):
+    with pytest.raises(MathError):
+        evaluate(expr)
+
+def test_int_bit_cap():
+    assert evaluate("2^1000 * 2^1000 * 2^1000 * 2^1000").bit_length() == 4001
+    for expr in ("2^1000 * 2^1000 * 2^1000 * 2^1000 * 2^1000", "(2^1000)^5", "3^1000 * 3^1000 * 3^1000"):
+        with pytest.raises(MathError):
+            evaluate(expr)
+
+def test_factorial_limits():
+    assert evaluate(f"fact({safemath.MAX_FACTORIAL})") > 0
+    for expr in (f"fact({safemath.MAX_FACTORIAL + 1})", "fact(-1)", "fact(2.5)", "fact(fact(10))"):
+        with pytest.raises(MathError):
+            evaluate(expr)
+
+@pytest.mark.parametrize("expr", [
+    "__import__('os').system('id')",
+    "().__class__.__bases__",
+    "open('x')",
+    "x",
+    "lambda: 1",
+    "[1, 2]",
+    "'a' * 3",
+    "sqrt(x=4)",
+    "1 if 1 else 2",
+])
+def test_rejects_non_whitelisted(expr):
+    with pytest.raises(MathError):
+        evaluate(expr)
+
+def test_operation_and_length_limits():
+    with pytest.raises(MathError):
+        evaluate("+".join(["1"] * 150))
+    with pytest.raises(MathError):
+        evaluate("1" * (safemath.MAX_EXPR_LENGTH + 1))
+
+@pytest.mark.parametrize("expr", ["2^1000*2^100 / 3", "2^1000*2^100 + 0.5", "2^1000*2^100 * 1.0", "2^4000 % 0.5", "2^1000*2^100 % 0.5"])
+def test_big_int_float_mix_overflow(expr):
+    with pytest.raises(MathError):
+        evaluate(expr)
+
+def test_errors_are_user_facing():
+    for expr in ("1 / 0", "1 % 0", "0 ^ -1", "log(-1)", "(-8) ^ 0.5", "1e308 * 10"):
+        with pytest.raises(MathError):
+            evaluate(expr)
+
+def test_evaluate_async_uses_worker():
+    async def run():
+        try:
+            return await safemath.evaluate_async("2^64", timeout=30)
+        finally:
+            safemath.shutdown()
+    assert asyncio.run(run()) == str(2 ** 64)
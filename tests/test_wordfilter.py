@@ -0,0 +1,43 @@
+from wordfilter import AhoCorasick, normalize
+
+
+def automaton(*terms, partial=False):
+    ac = AhoCorasick()
+    for term in terms:
+        ac.add(term, partial)
+    return ac
+
+def test_word_boundaries():
+    ac = automaton("ass")
+    assert ac.find("you ass!") == "ass"
+    assert ac.find("ass") == "ass"
+    assert ac.find("class") is None
+    assert ac.find("assassin") is None
+
+def test_partial_terms_match_inside_words():
+    ac = automaton("ass", partial=True)
+    assert ac.find("class") == "ass"
+
+def test_longer_term_after_rejected_prefix():
+    ac = automaton("bad", "badword")
+    assert ac.find("a badword here") == "badword"
+    assert ac.find("badwords") is None
+
+def test_overlapping_terms_via_failure_links():
+    ac = automaton("he", "she", "hers")
+    assert ac.find("ushers") is None
+    assert ac.find("u she rs") == "she"
+    assert ac.find("that is hers") == "hers"
+
+def test_add_after_build_and_remove():
+    ac = automaton("foo")
+    assert ac.find("foo bar") == "foo"
+    ac.add("bar")
+    assert ac.find("xx bar") == "bar"
+    assert ac.remove("foo")
+    assert not ac.remove("foo")
+    assert ac.find("foo") is None
+    assert ac.terms() == [("bar", False)]
+
+def test_normalize():
+    assert normalize("  Tiltott   SZÓ\n") == "tiltott szó"
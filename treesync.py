@@ -0,0 +1,40 @@
+"""Hash alapú slash parancsfa szinkronizálás.
+
+A parancsfát kanonikus JSON-ná alakítjuk és hash-eljük; a feltöltés csak
+akkor történik meg, ha a hash eltér az utoljára szinkronizálttól (ezt a
+helyi adatbázis tárolja). Így egy újraindítás vagy gateway újracsatlakozás
+nem égeti a parancs szinkronizálás rate limitjét.
+"""
+
+import hashlib
+import json
+from typing import Optional
+
+import discord
+from discord import app_commands
+
+from storage import Database
+
+
+def canonical_payload(tree: app_commands.CommandTree, guild: Optional[discord.abc.Snowflake] = None) -> str:
+    commands = [cmd.to_dict(tree) for cmd in tree.get_commands(guild=guild)]
+    commands.sort(key=lambda c: (c.get("type", 1), c["name"]))
+    return json.dumps(commands, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+def tree_hash(tree: app_commands.CommandTree, guild: Optional[discord.abc.Snowflake] = None) -> str:
+    return hashlib.sha256(canonical_payload(tree, guild).encode()).hexdigest()
+
+def _meta_key(application_id: int, guild: Optional[discord.abc.Snowflake]) -> str:
+    scope = f"guild:{guild.id}" if guild else "global"
+    return f"tree_hash:{application_id}:{scope}"
+
+async def sync_if_changed(tree: app_commands.CommandTree, db: Database, application_id: int, *,
+                          guild: Optional[discord.abc.Snowflake] = None, force: bool = False) -> Optional[int]:
+    """Szinkronizál, ha a fa változott. Visszaadja a szinkronizált parancsok számát, vagy None-t, ha nem kellett."""
+    key = _meta_key(application_id, guild)
+    digest = tree_hash(tree, guild)
+    if not force and await db.get_meta(key) == digest:
+        return None
+    synced = await tree.sync(guild=guild)
+    await db.set_meta(key, digest)
+    return len(synced)
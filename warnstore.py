@@ -0,0 +1,192 @@
+"""Figyelmeztetések tárolása cserélhető backenddel.
+
+Alapértelmezés a SQLite backend: az írások egy pufferbe kerülnek, amit egy
+háttér task kötegelve (`executemany`) ír ki; az olvasások keyset
+lapozással, indexen keresztül mennek, így a memóriahasználat a találatok
+számától független.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from storage import Database
+
+
+log = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class WarnRecord:
+    guild_id: int
+    user_id: int
+    moderator_id: int
+    reason: str
+    created_at: float  # unix időbélyeg
+    id: Optional[int] = None
+
+# Lapozási kurzor: (created_at, id) az utolsó megjelenített elemből.
+Cursor = tuple[float, int]
+
+class WarnBackend:
+    """A backendek közös felülete."""
+
+    async def start(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    async def add(self, warning: WarnRecord) -> None:
+        raise NotImplementedError
+
+    async def count(self, guild_id: int, user_id: Optional[int] = None) -> int:
+        raise NotImplementedError
+
+    async def page(self, guild_id: int, user_id: Optional[int] = None, *,
+                   before: Optional[Cursor] = None, limit: int = 10) -> list[WarnRecord]:
+        """Legújabb elöl; `before` az előző lap utolsó elemének kurzora."""
+        raise NotImplementedError
+
+def cursor_of(warning: WarnRecord) -> Cursor:
+    return (warning.created_at, warning.id or 0)
+
+class MemoryWarnBackend(WarnBackend):
+    """Nem perzisztens backend (tesztekhez / fejlesztéshez)."""
+
+    def __init__(self) -> None:
+        self._items: dict[int, list[WarnRecord]] = {}
+        # struktúra: szerver_id -> lista időrendben
+        self._next_id = 1
+
+    async def add(self, warning: WarnRecord) -> None:
+        stored = WarnRecord(warning.guild_id, warning.user_id, warning.moderator_id,
+                            warning.reason, warning.created_at, self._next_id)
+        self._next_id += 1
+        self._items.setdefault(warning.guild_id, []).append(stored)
+
+    def _select(self, guild_id: int, user_id: Optional[int]) -> list[WarnRecord]:
+        items = self._items.get(guild_id, [])
+        return [w for w in items if user_id is None or w.user_id == user_id]
+
+    async def count(self, guild_id: int, user_id: Optional[int] = None) -> int:
+        return len(self._select(guild_id, user_id))
+
+    async def page(self, guild_id: int, user_id: Optional[int] = None, *,
+                   before: Optional[Cursor] = None, limit: int = 10) -> list[WarnRecord]:
+        items = sorted(self._select(guild_id, user_id), key=cursor_of, reverse=True)
+        if before is not None:
+            items = [w for w in items if cursor_of(w) < before]
+        return items[:limit]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS warnings (
+    id INTEGER PRIMARY KEY,
+    guild_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    moderator_id INTEGER NOT NULL,
+    reason TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_warnings_guild_user ON warnings (guild_id, user_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_warnings_guild_time ON warnings (guild_id, created_at);
+"""
+
+FLUSH_INTERVAL = 1.0
+FLUSH_BATCH = 200
+
+class SQLiteWarnBackend(WarnBackend):
+    def __init__(self, db: Database, *, interval: float = FLUSH_INTERVAL, batch: int = FLUSH_BATCH) -> None:
+        self.db = db
+        self.interval = interval
+        self.batch = batch
+        self._pending: list[WarnRecord] = []
+        self._wake = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        await self.db.executescript(SCHEMA)
+        self._task = asyncio.create_task(self._run(), name="warnstore-flush")
+
+    async def close(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await self.flush()
+            except Exception:
+                log.exception("Figyelmeztetések mentése sikertelen")
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, []
+            rows = [(w.guild_id, w.user_id, w.moderator_id, w.reason, w.created_at) for w in pending]
+            try:
+                await self.db.executemany(
+                    "INSERT INTO warnings (guild_id, user_id, moderator_id, reason, created_at) VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+            except Exception:
+                # Visszatesszük (a közben érkezettek elé), hogy a következő mentés újrapróbálja.
+                self._pending = pending + self._pending
+                raise
+
+    async def add(self, warning: WarnRecord) -> None:
+        self._pending.append(warning)
+        if len(self._pending) >= self.batch:
+            self._wake.set()
+
+    async def count(self, guild_id: int, user_id: Optional[int] = None) -> int:
+        await self.flush()
+        if user_id is None:
+            row = await self.db.fetchone("SELECT COUNT(*) FROM warnings WHERE guild_id = ?", (guild_id,))
+        else:
+            row = await self.db.fetchone(
+                "SELECT COUNT(*) FROM warnings WHERE guild_id = ? AND user_id = ?", (guild_id, user_id)
+            )
+        return row[0] if row else 0
+
+    async def page(self, guild_id: int, user_id: Optional[int] = None, *,
+                   before: Optional[Cursor] = None, limit: int = 10) -> list[WarnRecord]:
+        await self.flush()
+        where = ["guild_id = ?"]
+        params: list = [guild_id]
+        if user_id is not None:
+            where.append("user_id = ?")
+            params.append(user_id)
+        if before is not None:
+            where.append("(created_at, id) < (?, ?)")
+            params.extend(before)
+        params.append(limit)
+        rows = await self.db.fetchall(
+            "SELECT guild_id, user_id, moderator_id, reason, created_at, id FROM warnings "
+            f"WHERE {' AND '.join(where)} ORDER BY created_at DESC, id DESC LIMIT ?",
+            params,
+        )
+        return [WarnRecord(*row) for row in rows]
+
+def create_backend(db: Database, name: Optional[str] = None) -> WarnBackend:
+    """Backend kiválasztása a `WARN_BACKEND` környezeti változó alapján."""
+    name = (name or os.environ.get("WARN_BACKEND", "sqlite")).lower()
+    if name == "memory":
+        return MemoryWarnBackend()
+    if name == "sqlite":
+        return SQLiteWarnBackend(db)
+    raise ValueError(f"Ismeretlen figyelmeztetés backend: {name}")
+
+def new_warning(guild_id: int, user_id: int, moderator_id: int, reason: str) -> WarnRecord:
+    return WarnRecord(guild_id, user_id, moderator_id, reason, time.time())
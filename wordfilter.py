@@ -0,0 +1,167 @@
+"""Szerverenkénti tiltott szó / kifejezés szűrő Aho–Corasick automatával.
+
+Egy üzenet ellenőrzése a tartalom hosszában lineáris, függetlenül attól,
+hány kifejezés van a listán. Új kifejezés hozzáadása csak a trie-t bővíti,
+a failure linkeket pedig a következő illesztés előtt, egyszer számolja
+újra; törlésnél csak a végállapot jelölése tűnik el.
+"""
+
+import asyncio
+from collections import deque
+from typing import Iterable, Optional
+
+from storage import Database
+
+
+MAX_TERMS_PER_GUILD = 1000
+MAX_TERM_LENGTH = 100
+
+def normalize(text: str) -> str:
+    return " ".join(text.casefold().split())
+
+class AhoCorasick:
+    def __init__(self) -> None:
+        self.goto: list[dict[str, int]] = [{}]
+        self.fail: list[int] = [0]
+        self.out: list[Optional[tuple[str, bool]]] = [None]
+        # out[node]: (kifejezés, részszó egyezés engedélyezett?) ha itt végződik egy kifejezés
+        self.dict_link: list[int] = [0]
+        # dict_link[node]: a failure lánc következő végállapota (0 = nincs)
+        self._dirty = False
+        self.size = 0
+
+    def add(self, term: str, partial: bool = False) -> None:
+        node = 0
+        for ch in term:
+            nxt = self.goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto.append({})
+                self.fail.append(0)
+                self.out.append(None)
+                self.dict_link.append(0)
+                self.goto[node][ch] = nxt
+            node = nxt
+        if self.out[node] is None:
+            self.size += 1
+        self.out[node] = (term, partial)
+        self._dirty = True
+
+    def remove(self, term: str) -> bool:
+        node = 0
+        for ch in term:
+            node = self.goto[node].get(ch, -1)
+            if node < 0:
+                return False
+        if self.out[node] is None:
+            return False
+        self.out[node] = None
+        self.size -= 1
+        self._dirty = True
+        return True
+
+    def _build(self) -> None:
+        """Failure és dictionary linkek BFS-sel (O(trie méret))."""
+        queue = deque()
+        for nxt in self.goto[0].values():
+            self.fail[nxt] = 0
+            self.dict_link[nxt] = 0
+            queue.append(nxt)
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self.goto[node].items():
+                f = self.fail[node]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                target = self.goto[f].get(ch, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                fl = self.fail[nxt]
+                self.dict_link[nxt] = fl if self.out[fl] is not None else self.dict_link[fl]
+                queue.append(nxt)
+        self._dirty = False
+
+    def find(self, text: str) -> Optional[str]:
+        """Az első (szóhatárra illeszkedő) találat, vagy None."""
+        if self.size == 0:
+            return None
+        if self._dirty:
+            self._build()
+        goto, fail, out, dict_link = self.goto, self.fail, self.out, self.dict_link
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            hit = node if out[node] is not None else dict_link[node]
+            while hit:
+                term, partial = out[hit]
+                start = i - len(term) + 1
+                if partial or (_boundary(text, start - 1) and _boundary(text, i + 1)):
+                    return term
+                hit = dict_link[hit]
+        return None
+
+    def terms(self) -> list[tuple[str, bool]]:
+        return sorted(o for o in self.out if o is not None)
+
+def _boundary(text: str, i: int) -> bool:
+    return i < 0 or i >= len(text) or not text[i].isalnum()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS filter_terms (
+    guild_id INTEGER NOT NULL,
+    term TEXT NOT NULL,
+    partial INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (guild_id, term)
+);
+"""
+
+class WordFilter:
+    """Szerverenkénti automaták, SQLite-ban tárolt kifejezéslistával."""
+
+    def __init__(self, db: Database) -> None:
+        self.db = db
+        self.automata: dict[int, AhoCorasick] = {}
+        self._lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        await self.db.executescript(SCHEMA)
+        rows = await self.db.fetchall("SELECT guild_id, term, partial FROM filter_terms")
+        for guild_id, term, partial in rows:
+            self.automata.setdefault(guild_id, AhoCorasick()).add(term, bool(partial))
+
+    def check(self, guild_id: int, content: str) -> Optional[str]:
+        ac = self.automata.get(guild_id)
+        if ac is None or not content:
+            return None
+        return ac.find(normalize(content))
+
+    def terms(self, guild_id: int) -> list[tuple[str, bool]]:
+        ac = self.automata.get(guild_id)
+        return ac.terms() if ac else []
+
+    async def add(self, guild_id: int, terms: Iterable[str], partial: bool = False) -> list[str]:
+        """Hozzáadja a kifejezéseket; visszaadja a ténylegesen felvetteket."""
+        async with self._lock:
+            ac = self.automata.setdefault(guild_id, AhoCorasick())
+            added = []
+            for raw in terms:
+                term = normalize(raw)
+                if not term or len(term) > MAX_TERM_LENGTH or ac.size >= MAX_TERMS_PER_GUILD:
+                    continue
+                ac.add(term, partial)
+                added.append(term)
+            await self.db.executemany(
+                "INSERT OR REPLACE INTO filter_terms (guild_id, term, partial) VALUES (?, ?, ?)",
+                [(guild_id, t, int(partial)) for t in added],
+            )
+            return added
+
+    async def remove(self, guild_id: int, raw: str) -> bool:
+        async with self._lock:
+            ac = self.automata.get(guild_id)
+            term = normalize(raw)
+            if ac is None or not ac.remove(term):
+                return False
+            await self.db.execute("DELETE FROM filter_terms WHERE guild_id = ? AND term = ?", (guild_id, term))
+            return True